@@ -0,0 +1,48 @@
+"""Per-chart overhead of building the canvas, with and without a FigurePool."""
+import timeit
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import tufte
+from tufte.base import FigurePool
+
+
+class FigurePoolSuite:
+    params = [True, False]
+    param_names = ["pool"]
+
+    def setup(self, pool):
+        self.x = np.arange(100)
+        self.y = np.random.default_rng(0).random(100)
+        self.pool = FigurePool() if pool else None
+
+    def teardown(self, pool):
+        plt.close("all")
+
+    def render(self):
+        ax = tufte.lineplot(x=self.x, y=self.y, figsize=(8, 4), pool=self.pool)
+        if self.pool is None:
+            plt.close(ax.figure)
+        else:
+            self.pool.release(ax.figure)
+
+    def time_lineplot(self, pool):
+        self.render()
+
+
+if __name__ == "__main__":
+    import warnings
+
+    warnings.simplefilter("ignore")
+    suite = FigurePoolSuite()
+    for pool in FigurePoolSuite.params:
+        suite.setup(pool)
+        suite.render()  # Warm up
+        seconds = min(timeit.repeat(suite.render, number=50, repeat=3)) / 50
+        print(f"pool={pool}: {seconds * 1e3:.2f} ms per chart")
+        suite.teardown(pool)
@@ -0,0 +1,111 @@
+"""Size and save time of vector output, with and without rasterized data layers,
+and of multi-format export against one savefig per format and resolution."""
+import io
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import tufte
+from tufte.base import RASTERIZE_ABOVE
+
+
+class RasterizeSuite:
+    params = [
+        ["lineplot", "scatterplot"],
+        [10**3, 10**5],
+        ["svg", "pdf"],
+        [True, False],
+    ]
+    param_names = ["kind", "n", "format", "rasterize"]
+    timeout = 300
+
+    def setup(self, kind, n, fmt, rasterize):
+        rng = np.random.default_rng(0)
+        x = rng.standard_normal(n)
+        self.ax = getattr(tufte, kind)(
+            np.sort(x) if kind == "lineplot" else x,
+            rng.standard_normal(n),
+            figsize=(8, 4),
+            rasterize_above=RASTERIZE_ABOVE if rasterize else None,
+        )
+
+    def teardown(self, *args):
+        plt.close("all")
+
+    def save(self, fmt) -> int:
+        buffer = io.BytesIO()
+        self.ax.figure.savefig(buffer, format=fmt, dpi=150)
+        return buffer.tell()
+
+    def time_savefig(self, kind, n, fmt, rasterize):
+        self.save(fmt)
+
+    def track_file_size(self, kind, n, fmt, rasterize):
+        return self.save(fmt)
+
+    track_file_size.unit = "bytes"
+
+
+class MultiFormatSuite:
+    params = [[10**3, 10**5], [0, 1, 6]]
+    param_names = ["n", "png_compression"]
+    formats = ["png", "svg", "pdf"]
+    dpi = [72, 200]
+
+    def setup(self, n, png_compression):
+        rng = np.random.default_rng(0)
+        self.ax = tufte.lineplot(
+            np.arange(n), rng.standard_normal(n).cumsum(), figsize=(8, 4)
+        )
+
+    def teardown(self, *args):
+        plt.close("all")
+
+    def time_savefig_each(self, n, png_compression):
+        for fmt in self.formats:
+            for dpi in self.dpi:
+                self.ax.figure.savefig(io.BytesIO(), format=fmt, dpi=dpi)
+
+    def time_export(self, n, png_compression):
+        tufte.export(self.ax, self.formats, self.dpi, png_compression)
+
+    def track_png_size(self, n, png_compression):
+        return len(tufte.export(self.ax, "png", 200, png_compression)["png"][200])
+
+    track_png_size.unit = "bytes"
+
+
+if __name__ == "__main__":
+    import itertools
+    import warnings
+
+    warnings.simplefilter("ignore")
+    suite = RasterizeSuite()
+    for args in itertools.product(*RasterizeSuite.params):
+        suite.setup(*args)
+        start = time.perf_counter()
+        size = suite.save(args[2])
+        seconds = time.perf_counter() - start
+        print(f"{args}: {seconds:.2f} s, {size / 1e6:.2f} MB")
+        suite.teardown()
+
+    suite = MultiFormatSuite()
+    for args in itertools.product(*MultiFormatSuite.params):
+        suite.setup(*args)
+        start = time.perf_counter()
+        suite.time_savefig_each(*args)
+        each = time.perf_counter() - start
+        start = time.perf_counter()
+        suite.time_export(*args)
+        single = time.perf_counter() - start
+        size = suite.track_png_size(*args)
+        print(
+            f"{args}: savefig {each:.2f} s, export {single:.2f} s,"
+            f" png {size / 1e3:.0f} kB"
+        )
+        suite.teardown()
@@ -0,0 +1,57 @@
+"""Cold-start cost of importing the package, each case in a fresh interpreter."""
+import subprocess
+import sys
+
+HEAVY_MODULES = ("matplotlib", "pandas", "numpy")
+
+
+class ImportSuite:
+    timeout = 60
+
+    def timeraw_import_tufte(self):
+        return "import tufte"
+
+    def timeraw_import_lineplot(self):
+        return "from tufte import lineplot"
+
+    def track_heavy_modules_on_import(self):
+        """Number of heavy dependencies loaded by a bare `import tufte` (expected 0)"""
+        return len(heavy_modules_on_import())
+
+    track_heavy_modules_on_import.unit = "modules"
+
+
+def heavy_modules_on_import() -> list:
+    code = (
+        "import sys, tufte; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    return [module for module in output.split(",") if module]
+
+
+def import_time(statement: str, repeat: int = 5) -> float:
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{statement}; print(time.perf_counter() - start)"
+    )
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            ).stdout
+        )
+        for _ in range(repeat)
+    )
+
+
+if __name__ == "__main__":
+    for statement in ("import tufte", "from tufte import lineplot"):
+        print(f"{statement}: {import_time(statement) * 1e3:.1f} ms")
+
+    heavy = heavy_modules_on_import()
+    print(f"heavy modules loaded by import tufte: {heavy or 'none'}")
+    sys.exit(1 if heavy else 0)
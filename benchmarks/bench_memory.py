@@ -0,0 +1,142 @@
+"""Soak test: resident memory over many renders must stay flat once warm.
+
+Run as a script to render RENDERS charts with each figure lifecycle and fail
+if the RSS grows by more than MAX_GROWTH_MB, or if figures are left alive,
+after the warm-up renders. tests/test_memory.py runs a shorter soak.
+"""
+import gc
+import os
+import resource
+import sys
+import time
+from functools import partial
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+from matplotlib.figure import Figure
+
+import tufte
+from tufte.base import FigurePool
+from tufte.line import Line
+
+RENDERS = 10**4
+WARMUP = 10**3
+MAX_GROWTH_MB = 16
+
+
+def rss_mb() -> float:
+    """Current resident memory, or the peak where it cannot be read"""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+    except OSError:
+        # Kilobytes on Linux, bytes on macOS
+        scale = 2**20 if sys.platform == "darwin" else 2**10
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def live_figures() -> int:
+    """Number of figures alive, whether pyplot knows about them or not"""
+    gc.collect()
+    return sum(isinstance(obj, Figure) for obj in gc.get_objects())
+
+
+def make_data(i: int) -> tuple:
+    rng = np.random.default_rng(i)
+    return np.arange(100), rng.standard_normal(100).cumsum()
+
+
+def render_close(i: int) -> bytes:
+    x, y = make_data(i)
+    ax = tufte.lineplot(x, y, figsize=(4, 3), dpi=72)
+    return tufte.export(ax, "png", close=True)["png"][72]
+
+
+def render_context(i: int) -> bytes:
+    x, y = make_data(i)
+    with Line(xlabel="x", ylabel="y", figsize=(4, 3), dpi=72) as line:
+        line.plot(x, y)
+        return tufte.export(line.ax, "png")["png"][72]
+
+
+def render_pool(i: int, pool: FigurePool) -> bytes:
+    x, y = make_data(i)
+    fig, ax = pool.acquire((4, 3), 72)
+    try:
+        tufte.lineplot(x, y, ax=ax)
+        return tufte.export(ax, "png")["png"][72]
+
+    finally:
+        pool.release(fig)
+
+
+def render_unregistered(i: int) -> bytes:
+    x, y = make_data(i)
+    ax = tufte.lineplot(x, y, figsize=(4, 3), dpi=72, pyplot=False)
+    return tufte.export(ax, "png")["png"][72]
+
+
+LIFECYCLES = {
+    "close": render_close,
+    "context": render_context,
+    "pool": render_pool,
+    "unregistered": render_unregistered,
+}
+
+
+def soak(lifecycle: str, renders: int = RENDERS, warmup: int = WARMUP) -> tuple:
+    """Growth of the RSS, in MB, and of the number of live figures between the
+    end of the warm-up and the last render"""
+    render = LIFECYCLES[lifecycle]
+    if lifecycle == "pool":
+        render = partial(render, pool=FigurePool(pyplot=False))
+    for i in range(renders):
+        if i == warmup:
+            baseline = rss_mb(), live_figures()
+        render(i)
+
+    return rss_mb() - baseline[0], live_figures() - baseline[1]
+
+
+class MemorySuite:
+    params = [list(LIFECYCLES)]
+    param_names = ["lifecycle"]
+    timeout = 1800
+
+    def track_rss_growth(self, lifecycle):
+        return soak(lifecycle)[0]
+
+    track_rss_growth.unit = "MB"
+
+    def track_figure_growth(self, lifecycle):
+        return soak(lifecycle)[1]
+
+    track_figure_growth.unit = "figures"
+
+
+if __name__ == "__main__":
+    import warnings
+
+    warnings.simplefilter("ignore")
+    failed = []
+    for lifecycle in LIFECYCLES:
+        start = time.perf_counter()
+        growth, figures = soak(lifecycle)
+        seconds = time.perf_counter() - start
+        print(
+            f"{lifecycle:<12} {RENDERS} renders in {seconds:.0f} s,"
+            f" RSS {rss_mb():.0f} MB, growth {growth:.1f} MB, {figures} figures"
+        )
+        if growth > MAX_GROWTH_MB or figures > 0:
+            failed.append(lifecycle)
+
+    if failed:
+        sys.exit(
+            f"Memory grew by more than {MAX_GROWTH_MB} MB or figures were left"
+            f" alive: {failed}"
+        )
@@ -0,0 +1,206 @@
+"""Time per stage, peak memory and file size of every plot type.
+
+Runs under asv (`asv continuous master HEAD` compares two commits), or
+standalone:
+
+    python -m benchmarks.bench_plots --out head.json
+    git checkout master && python -m benchmarks.bench_plots --out base.json
+    python -m benchmarks.bench_plots --compare base.json head.json
+"""
+import io
+import time
+import tracemalloc
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+import tufte
+import tufte.tufte as legacy
+
+SIZES = [10, 10**3, 10**5, 10**7]
+FORMATS = ["png", "svg", "pdf"]
+
+
+def make_data(plot: str, n: int) -> dict:
+    rng = np.random.default_rng(0)
+    if plot in ("bar", "legacy_bar"):
+        return {"x": np.arange(n), "y": rng.random(n)}
+
+    if plot in ("box", "legacy_bplot", "density", "histogram"):
+        return {"y": rng.standard_normal(n)}
+
+    data = {"x": np.arange(n, dtype=np.float64), "y": rng.standard_normal(n).cumsum()}
+    if plot == "facet":
+        # A 20 x 20 grid of small multiples
+        data["by"] = np.arange(n) * 400 // n
+
+    return data
+
+
+# Plot name -> (function of the data returning a figure, largest n, largest n
+# of vector output). Vector output of unrasterized layers grows with n.
+CASES = {
+    "line": (lambda d: tufte.lineplot(d["x"], d["y"]).figure, 10**7, 10**7),
+    "scatter": (lambda d: tufte.scatterplot(d["x"], d["y"]).figure, 10**7, 10**7),
+    "scatter_density": (
+        lambda d: tufte.scatterplot(d["x"], d["y"], mode="density").figure,
+        10**7,
+        10**7,
+    ),
+    "facet": (
+        lambda d: tufte.facetplot(d["x"], d["y"], by=d["by"]).figure,
+        10**7,
+        10**5,
+    ),
+    "bar": (lambda d: tufte.barplot(d["x"], d["y"]).figure, 10**5, 10**5),
+    "box": (lambda d: tufte.boxplot(d["y"]).figure, 10**7, 10**7),
+    "density": (lambda d: tufte.densityplot(d["y"], rug=True).figure, 10**7, 10**7),
+    "histogram": (
+        lambda d: tufte.densityplot(d["y"], mode="histogram").figure,
+        10**7,
+        10**7,
+    ),
+    "legacy_scatter": (lambda d: legacy.scatter(d["x"], d["y"])[0], 10**7, 10**5),
+    "legacy_bar": (lambda d: legacy.bar(d["x"], d["y"])[0], 10**3, 10**3),
+    "legacy_bplot": (
+        lambda d: legacy.bplot(pd.DataFrame({"y": d["y"]}))[0],
+        10**7,
+        10**7,
+    ),
+}
+
+
+def save(fig, fmt: str) -> int:
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt)
+    return buffer.tell()
+
+
+class PlotSuite:
+    params = [list(CASES), SIZES, FORMATS]
+    param_names = ["plot", "n", "format"]
+    timeout = 900
+
+    def setup(self, plot, n, fmt):
+        function, max_n, max_vector_n = CASES[plot]
+        if n > (max_vector_n if fmt != "png" else max_n):
+            raise NotImplementedError  # Skipped by asv
+
+        self.function = function
+        self.data = make_data(plot, n)
+        self.fig = function(self.data)
+
+    def teardown(self, *args):
+        plt.close("all")
+
+    def time_plot(self, plot, n, fmt):
+        plt.close(self.function(self.data))
+
+    def time_draw(self, plot, n, fmt):
+        self.fig.canvas.draw()
+
+    def time_savefig(self, plot, n, fmt):
+        save(self.fig, fmt)
+
+    def peakmem_plot_and_save(self, plot, n, fmt):
+        fig = self.function(self.data)
+        save(fig, fmt)
+        plt.close(fig)
+
+    def track_file_size(self, plot, n, fmt):
+        return save(self.fig, fmt)
+
+    track_file_size.unit = "bytes"
+
+
+def run_case(plot: str, n: int, fmt: str) -> dict:
+    """Measure one case outside of asv
+
+    Returns:
+        dict: Seconds per stage, Python heap peak in bytes and file size.
+    """
+    function = CASES[plot][0]
+    data = make_data(plot, n)
+
+    start = time.perf_counter()
+    fig = function(data)
+    plotted = time.perf_counter()
+    fig.canvas.draw()
+    drawn = time.perf_counter()
+    size = save(fig, fmt)
+    saved = time.perf_counter()
+    plt.close(fig)
+
+    # A second pass, as tracing allocations slows everything down
+    tracemalloc.start()
+    fig = function(data)
+    save(fig, fmt)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    plt.close(fig)
+
+    return {
+        "plot": plotted - start,
+        "draw": drawn - plotted,
+        "save": saved - drawn,
+        "peak_bytes": peak,
+        "file_bytes": size,
+    }
+
+
+def compare(base: dict, head: dict, threshold: float = 1.1):
+    """Print the ratio head / base of every metric, flagging regressions"""
+    for case in sorted(set(base) & set(head)):
+        ratios = {
+            metric: head[case][metric] / base[case][metric]
+            for metric in head[case]
+            if base[case].get(metric)
+        }
+        flag = "REGRESSION" if max(ratios.values(), default=1) > threshold else ""
+        cells = " ".join(f"{metric}={ratio:.2f}x" for metric, ratio in ratios.items())
+        print(f"{case:<32} {cells} {flag}")
+
+
+if __name__ == "__main__":
+    import argparse
+    import itertools
+    import json
+    import warnings
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plots", nargs="+", default=list(CASES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--formats", nargs="+", default=FORMATS)
+    parser.add_argument("--out", help="Write the results to a JSON file")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "HEAD"))
+    args = parser.parse_args()
+
+    if args.compare:
+        base, head = (json.load(open(path)) for path in args.compare)
+        compare(base, head)
+        raise SystemExit
+
+    warnings.simplefilter("ignore")
+    results = {}
+    for plot, n, fmt in itertools.product(args.plots, args.sizes, args.formats):
+        _, max_n, max_vector_n = CASES[plot]
+        if n > (max_vector_n if fmt != "png" else max_n):
+            continue
+
+        result = run_case(plot, n, fmt)
+        results[f"{plot}-{n}-{fmt}"] = result
+        print(
+            f"{plot:<16} n={n:<9} {fmt:<4}"
+            f" plot {result['plot']:8.3f} s  draw {result['draw']:8.3f} s"
+            f"  save {result['save']:8.3f} s  peak {result['peak_bytes'] / 1e6:8.1f} MB"
+            f"  file {result['file_bytes'] / 1e6:8.2f} MB"
+        )
+
+    if args.out:
+        with open(args.out, "w") as file:
+            json.dump(results, file, indent=2)
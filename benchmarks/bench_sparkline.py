@@ -0,0 +1,54 @@
+"""Time per sparkline of the bulk renderer, against one lineplot per sparkline."""
+import io
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import tufte
+
+
+def make_series(count: int, n: int) -> list:
+    rng = np.random.default_rng(0)
+    return list(rng.standard_normal((count, n)).cumsum(axis=1))
+
+
+class SparklineSuite:
+    params = [[100, 10**4], ["png", "svg"]]
+    param_names = ["n", "format"]
+
+    def setup(self, n, fmt):
+        self.series = make_series(1000, n)
+
+    def time_sparklines(self, n, fmt):
+        tufte.sparklines(self.series, format=fmt)
+
+    def time_lineplot(self, n, fmt):
+        for values in self.series[:20]:
+            ax = tufte.lineplot(np.arange(n), values, figsize=(1, 0.2), dpi=100)
+            ax.figure.savefig(io.BytesIO(), format=fmt)
+            plt.close(ax.figure)
+
+
+if __name__ == "__main__":
+    import itertools
+    import warnings
+
+    warnings.simplefilter("ignore")
+    suite = SparklineSuite()
+    for n, fmt in itertools.product(*SparklineSuite.params):
+        suite.setup(n, fmt)
+        start = time.perf_counter()
+        suite.time_sparklines(n, fmt)
+        bulk = (time.perf_counter() - start) / 1000
+        start = time.perf_counter()
+        suite.time_lineplot(n, fmt)
+        single = (time.perf_counter() - start) / 20
+        print(
+            f"n={n:<6} {fmt}: sparklines {bulk * 1e3:.2f} ms,"
+            f" lineplot {single * 1e3:.2f} ms per chart"
+        )
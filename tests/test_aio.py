@@ -0,0 +1,43 @@
+import asyncio
+import logging
+import threading
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from tufte import aio
+from tufte.aio import AsyncRenderer
+
+
+def test_rendering_outlives_its_loop(monkeypatch, caplog):
+    started, finish = threading.Event(), threading.Event()
+
+    def render_bytes(*args):
+        started.set()
+        finish.wait(5)
+        return b""
+
+    monkeypatch.setattr(aio, "render_bytes", render_bytes)
+    renderer = AsyncRenderer(max_concurrency=1)
+
+    async def leave_rendering():
+        asyncio.create_task(renderer.render("line"))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+    # The pending render is cancelled and the loop closed while it renders
+    asyncio.run(leave_rendering())
+    with caplog.at_level(logging.ERROR, logger="concurrent.futures"):
+        finish.set()
+        renderer.shutdown()
+
+    assert not caplog.records
+
+
+def test_renderer_serves_successive_loops(monkeypatch):
+    monkeypatch.setattr(aio, "render_bytes", lambda *args: b"chart")
+    renderer = AsyncRenderer(max_concurrency=1)
+
+    for _ in range(3):
+        assert asyncio.run(renderer.render("line")) == b"chart"
+    renderer.shutdown()
@@ -0,0 +1,32 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+
+import tufte
+from tufte.bar import Bar
+
+
+@pytest.mark.parametrize("rasterize_above, rasterized", [(100, True), (None, False)])
+def test_rasterize_above(rasterize_above, rasterized):
+    ax = tufte.barplot(
+        np.arange(500), np.arange(500) % 7, rasterize_above=rasterize_above
+    )
+
+    assert ax.collections[0].get_rasterized() is rasterized
+
+
+def test_dtype(monkeypatch):
+    dtypes = []
+    plot_batch = Bar.plot_batch
+
+    def spy(self, positions, y, *args):
+        dtypes.append(y.dtype)
+        return plot_batch(self, positions, y, *args)
+
+    monkeypatch.setattr(Bar, "plot_batch", spy)
+    tufte.barplot(np.arange(500), np.arange(500) % 7 * 0.5, dtype="float32")
+
+    assert dtypes == [np.float32]
@@ -0,0 +1,63 @@
+import os
+import resource
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tufte.batch import SharedBlocks, render_many
+
+
+@pytest.fixture
+def low_fd_limit():
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(128, hard), hard))
+    yield
+    resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+
+def test_render_many_keeps_blocks_bounded(tmp_path, low_fd_limit):
+    # One DataFrame per chart, more columns than file descriptors
+    specs = (
+        {
+            "kind": "line",
+            "name": str(i),
+            "x": "x",
+            "y": "y",
+            "data": pd.DataFrame({"x": np.arange(10), "y": np.arange(10) * i}),
+            "figsize": (2, 1),
+            "dpi": 20,
+        }
+        for i in range(200)
+    )
+
+    results = list(render_many(specs, str(tmp_path), workers=2))
+
+    assert [result.error for result in results if not result.ok] == []
+    assert len(os.listdir(tmp_path)) == 200
+
+
+def test_shared_blocks_are_freed_with_their_last_chart():
+    data = pd.DataFrame({"x": np.arange(10.0)})
+    blocks = SharedBlocks()
+    first = blocks.share(data, "x")
+    second = blocks.share(data, "x")
+    assert first == second
+
+    blocks.release([first.shm_name])
+    shm, array = first.attach()
+    np.testing.assert_array_equal(array, data["x"])
+    del array
+    shm.close()
+
+    blocks.release([second.shm_name])
+    with pytest.raises(FileNotFoundError):
+        first.attach()
+
+    # A new DataFrame is copied again, even if it reuses the id of a freed one
+    assert blocks.share(pd.DataFrame({"x": np.ones(3)}), "x").length == 3
+    blocks.close()
@@ -0,0 +1,56 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.collections import LineCollection, PathCollection
+
+import tufte
+from tufte.box import Box
+
+
+def test_grouped_quartiles_match_groupby():
+    rng = np.random.default_rng(0)
+    codes = rng.integers(0, 49, 10**4)
+    # Group 7 is empty and group 49 has a single value
+    codes[codes == 7] = 8
+    codes[-1] = 49
+    values = rng.standard_normal(len(codes)) * (codes + 1)
+
+    stats = Box.get_grouped_summary_statistics(values, codes, 50)
+
+    expected = (
+        pd.Series(values)
+        .groupby(codes)
+        .quantile([0, 0.25, 0.5, 0.75, 1])
+        .unstack()
+        .reindex(range(50))
+    )
+    for q, key in zip([0, 0.25, 0.5, 0.75, 1], ["min", "25%", "50%", "75%", "max"]):
+        np.testing.assert_allclose(stats[key], expected[q], rtol=1e-12)
+    assert np.isnan(stats["50%"][7])
+    assert stats["25%"][49] == stats["75%"][49] == values[-1]
+
+
+@pytest.mark.parametrize("n_groups", [3, 300])
+def test_artists_do_not_depend_on_the_number_of_groups(n_groups):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "group": rng.integers(0, n_groups, 10**4),
+            "value": rng.standard_cauchy(10**4),
+        }
+    )
+
+    ax = tufte.boxplot("value", data=data, by="group")
+
+    collections = [type(collection) for collection in ax.collections]
+    assert collections.count(LineCollection) == 1
+    assert collections.count(PathCollection) == 2
+    assert len(ax.collections) == 3
+    whiskers, medians, outliers = ax.collections
+    assert len(whiskers.get_segments()) == 2 * n_groups
+    assert len(medians.get_offsets()) == n_groups
+    assert len(outliers.get_offsets()) > 0
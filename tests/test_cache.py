@@ -0,0 +1,78 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+
+from tufte.cache import RenderCache, render_key
+
+
+def test_put_scans_only_when_full(tmp_path, monkeypatch):
+    cache = RenderCache(tmp_path, max_bytes=100 * 100, scan_every=10**6)
+    scans = []
+    evict = cache.evict
+    monkeypatch.setattr(cache, "evict", lambda: scans.append(1) or evict())
+
+    for i in range(300):
+        cache.put(f"{i:040x}", "png", b"x" * 100)
+
+    # The first put scans, then one scan per 10 % of max_bytes written once full
+    assert len(scans) <= 1 + 200 // 10
+    assert cache.size <= cache.max_bytes
+    assert sum(1 for _ in tmp_path.glob("*/*")) * 100 == cache.size
+
+
+def test_put_scans_every_scan_every_puts(tmp_path, monkeypatch):
+    cache = RenderCache(tmp_path, scan_every=10)
+    scans = []
+    evict = cache.evict
+    monkeypatch.setattr(cache, "evict", lambda: scans.append(1) or evict())
+
+    for i in range(31):
+        cache.put(f"{i:040x}", "png", b"x")
+
+    assert len(scans) == 4
+
+
+def test_key_depends_on_rcparams():
+    kwargs = {"x": [0, 1, 2], "y": [1, 0, 2]}
+    key = render_key("line", **kwargs)
+    with matplotlib.rc_context({"font.size": 31}):
+        assert render_key("line", **kwargs) != key
+    with matplotlib.rc_context({"interactive": True}):
+        assert render_key("line", **kwargs) == key
+
+
+def test_key_depends_on_matplotlib_version(monkeypatch):
+    kwargs = {"x": [0, 1, 2], "y": [1, 0, 2]}
+    key = render_key("line", **kwargs)
+    monkeypatch.setattr(matplotlib, "__version__", "0.0.0")
+
+    assert render_key("line", **kwargs) != key
+
+
+@pytest.mark.parametrize("max_bytes", [250, 1000])
+def test_evict_keeps_cache_under_max_bytes(tmp_path, max_bytes):
+    cache = RenderCache(tmp_path, max_bytes=max_bytes)
+    for i in range(50):
+        cache.put(f"{i:040x}", "png", b"x" * 100)
+
+    assert sum(path.stat().st_size for path in tmp_path.glob("*/*")) <= max_bytes
+
+
+@pytest.mark.parametrize(
+    "scalar, value",
+    [
+        (np.int64(2), 2),
+        (np.float32(0.5), 0.5),
+        (np.float64(1.5), 1.5),
+        (np.bool_(1), True),
+    ],
+)
+def test_numpy_scalars_are_keyed_as_python_values(scalar, value):
+    kwargs = {"x": [0, 1, 2], "y": [1, 0, 2]}
+
+    assert render_key("line", linewidth=scalar, **kwargs) == render_key(
+        "line", linewidth=value, **kwargs
+    )
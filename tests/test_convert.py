@@ -0,0 +1,94 @@
+import array
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tufte.base import as_array, select
+
+pa = pytest.importorskip("pyarrow")
+
+
+def data_buffer(values) -> np.ndarray:
+    """View the data buffer of a primitive Arrow array"""
+    if isinstance(values, pa.ChunkedArray):
+        (values,) = values.chunks
+    return np.frombuffer(values.buffers()[1], dtype=values.type.to_pandas_dtype())
+
+
+def test_arrow_array_is_viewed():
+    values = pa.array(np.arange(10.0))
+
+    assert np.shares_memory(as_array(values), data_buffer(values))
+
+
+def test_arrow_chunked_array_is_viewed():
+    values = pa.chunked_array([np.arange(10)])
+
+    assert np.shares_memory(as_array(values), data_buffer(values))
+
+
+def test_pandas_arrow_column_is_viewed():
+    series = pd.Series(np.arange(10.0), dtype="float64[pyarrow]")
+    converted = as_array(series)
+
+    assert isinstance(converted, np.ndarray)
+    assert np.shares_memory(converted, data_buffer(series.array.__arrow_array__()))
+
+
+def test_polars_series_is_viewed():
+    pl = pytest.importorskip("polars")
+    series = pl.Series(np.arange(10.0))
+
+    assert np.shares_memory(as_array(series), series.to_numpy())
+
+
+def test_buffer_is_viewed():
+    values = array.array("d", range(10))
+    converted = as_array(values)
+    values[0] = -1.0
+
+    assert converted[0] == -1.0
+
+
+def test_arrow_nulls_become_nan():
+    pl = pytest.importorskip("polars")
+
+    for values in (
+        pa.array([1.0, None, 3.0]),
+        pa.array([1, None, 3]),
+        pd.Series([1.0, None, 3.0], dtype="float64[pyarrow]"),
+        pl.Series([1.0, None, 3.0]),
+    ):
+        np.testing.assert_array_equal(as_array(values), [1.0, np.nan, 3.0])
+
+
+def test_dtype_is_cast():
+    converted = as_array(pa.array(np.arange(10.0)), dtype="float32")
+
+    assert converted.dtype == np.float32
+    assert as_array(pa.array(["a", "b"]), dtype="float32").dtype == object
+
+
+def test_select_arrow_table():
+    table = pa.table({"x": np.arange(4.0), "y": np.arange(4)})
+
+    column = select(table, "x")
+    assert np.shares_memory(data_buffer(column), data_buffer(table.column("x")))
+    frame = select(table, ["x", "y"])
+    assert frame.dtypes.tolist() == [np.float64, np.int64]
+    assert np.shares_memory(frame["x"].to_numpy(), data_buffer(table.column("x")))
+
+
+def test_select_polars_frame():
+    pl = pytest.importorskip("polars")
+    frame = pl.DataFrame({"x": [1.0, None], "y": [1, 2]})
+
+    assert select(frame, "y").to_list() == [1, 2]
+    np.testing.assert_array_equal(select(frame, ["x"])["x"], [1.0, np.nan])
+
+
+def test_select_pandas_frame():
+    frame = pd.DataFrame({"x": [1.0, 2.0]})
+
+    pd.testing.assert_series_equal(select(frame, "x"), frame["x"])
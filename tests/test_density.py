@@ -0,0 +1,45 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+from matplotlib.colors import to_rgba
+
+import tufte
+
+
+@pytest.mark.parametrize("mode", ["kde", "histogram"])
+def test_limits_frame_chunk_iterators(mode):
+    rng = np.random.default_rng(0)
+    chunks = [rng.standard_normal(1000) for _ in range(5)]
+    ax = tufte.densityplot(iter(chunks), limits=(-5, 5), mode=mode)
+
+    xmin, xmax = ax.get_xlim()
+    assert xmin <= -5 and xmax >= 5
+    assert ax.get_xticks()[[0, -1]].tolist() == [-5, 5]
+
+
+def test_kde_forwards_line_properties():
+    values = np.random.default_rng(0).standard_normal(1000)
+
+    ax = tufte.densityplot(values, color="red", alpha=0.5, linestyle="--")
+
+    assert ax.lines[0].get_color() == "red"
+    assert ax.lines[0].get_alpha() == 0.5
+    assert ax.lines[0].get_linestyle() == "--"
+
+
+def test_histogram_uses_color_and_properties():
+    values = np.random.default_rng(0).standard_normal(1000)
+
+    ax = tufte.densityplot(values, mode="histogram", color="red", alpha=0.5)
+
+    (bars,) = ax.patches
+    assert to_rgba(bars.get_facecolor(), 1) == to_rgba("red")
+    assert bars.get_alpha() == 0.5
+
+
+def test_unknown_properties_are_rejected():
+    with pytest.raises(AttributeError):
+        tufte.densityplot(np.arange(10.0), colour="red")
@@ -0,0 +1,83 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+
+import tufte
+from tufte.downsample import downsample, lttb, minmax, pixel
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    x = np.arange(10**4, dtype=np.float64)
+    return x, rng.standard_normal(x.size).cumsum()
+
+
+def test_lttb_keeps_the_ends_and_the_extremes(series):
+    x, y = series
+    y[1234], y[8765] = 1e3, -1e3
+
+    indices = lttb(x, y, 200)
+
+    assert len(indices) == 200
+    assert indices[0] == 0 and indices[-1] == len(x) - 1
+    assert {1234, 8765} <= set(indices)
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_minmax_keeps_the_min_and_max_of_every_bucket(series):
+    x, y = series
+    n_buckets = 50
+
+    indices = minmax(y, 2 * n_buckets)
+
+    kept = set(indices)
+    for bucket in np.array_split(np.arange(len(y)), n_buckets):
+        assert bucket[np.argmin(y[bucket])] in kept
+        assert bucket[np.argmax(y[bucket])] in kept
+    assert {0, len(y) - 1} <= kept
+
+
+def test_pixel_keeps_one_point_per_pixel():
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(0, 1, 10**5), rng.uniform(0, 1, 10**5)
+
+    indices = pixel(x, y, (0, 1), (0, 1), 40, 30)
+
+    cells = np.floor(x[indices] * 40) + 40 * np.floor(y[indices] * 30)
+    assert len(np.unique(cells)) == len(indices) == 40 * 30
+
+
+def test_downsample_drops_non_finite_values(series):
+    x, y = series
+    y[::7] = np.nan
+
+    x, y = downsample(x, y, "lttb", 100)
+
+    assert len(x) == 100 and np.isfinite(y).all()
+
+
+def test_downsample_rejects_unknown_methods(series):
+    with pytest.raises(ValueError):
+        downsample(*series, "pixel", 100)
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax", 100])
+def test_scatter_rejects_series_methods(method):
+    x, y = np.random.default_rng(0).uniform(size=(2, 100))
+
+    with pytest.raises(ValueError):
+        tufte.scatterplot(x, y, downsample=method)
+
+
+def test_scatter_pixel_keeps_the_inside_of_the_cloud():
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(0, 1, 10**5), rng.uniform(0, 1, 10**5)
+
+    ax = tufte.scatterplot(x, y, downsample="pixel", figsize=(4, 3), dpi=50)
+
+    counts = np.histogram(ax.collections[-1].get_offsets()[:, 1], 5, (0, 1))[0]
+    assert counts.min() > 0.1 * counts.max()
@@ -0,0 +1,27 @@
+import importlib
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import tufte
+
+
+def test_export_stays_callable_once_its_module_is_imported():
+    module = importlib.import_module("tufte._export")
+    from tufte._export import encode  # noqa: F401
+
+    assert tufte.export is module.export
+    assert callable(tufte.export)
+
+
+def test_export_is_importable_lazily():
+    sys.modules.pop("tufte._export", None)
+    vars(tufte).pop("export", None)
+    ax = tufte.lineplot([0, 1, 2], [1, 0, 2], figsize=(2, 2), dpi=50)
+
+    images = tufte.export(ax, ["png", "svg"], close=True)
+
+    assert images["png"][50].startswith(b"\x89PNG")
+    assert b"<svg" in images["svg"][50]
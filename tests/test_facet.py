@@ -0,0 +1,57 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+
+import tufte
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame(
+        {
+            "g": np.repeat(["a", "b", "c", "d"], 5),
+            "x": np.tile(np.arange(5), 4),
+            "y": np.arange(20) * 1.5,
+        }
+    )
+
+
+def test_bar_color(data):
+    ax = tufte.facetplot("x", "y", data=data, by="g", kind="bar", color="red")
+
+    (bars,) = [c for c in ax.collections if isinstance(c, PolyCollection)]
+    assert tuple(bars.get_facecolor()[0][:3]) == to_rgba("red")[:3]
+
+
+def test_kwargs_reach_the_artist(data):
+    ax = tufte.facetplot("x", "y", data=data, by="g", zorder=5, label="series")
+
+    (line,) = [line for line in ax.lines if line.get_label() == "series"]
+    assert line.get_zorder() == 5
+
+
+def test_unknown_kwargs_are_rejected(data):
+    with pytest.raises(AttributeError):
+        tufte.facetplot("x", "y", data=data, by="g", colour="red")
+
+    with pytest.raises(TypeError):
+        tufte.facetplot(y="y", data=data, by="g", kind="box", zorder=5)
+
+
+def test_tick_labels_do_not_overlap(data):
+    ax = tufte.facetplot("x", "y", data=data, by="g", ticklabelsize=40, figsize=(4, 4))
+
+    fig = ax.figure
+    renderer = fig.canvas.get_renderer()
+    labels = [text for text in ax.texts if text.get_ha() == "center"]
+    labels = [text for text in labels if text.get_va() == "top"]
+    boxes = [text.get_window_extent(renderer) for text in labels]
+    for i, box in enumerate(boxes):
+        for other in boxes[i + 1 :]:
+            assert not box.overlaps(other)
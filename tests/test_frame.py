@@ -0,0 +1,97 @@
+import warnings
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from tufte.base import FrameStats, frame_stats, set_axis_frame
+from tufte.tufte import all_ints, range_frame
+
+
+@pytest.fixture
+def ax():
+    fig, ax = plt.subplots(figsize=(6, 4))
+    yield ax
+    plt.close(fig)
+
+
+def test_non_finite_values_only():
+    stats = frame_stats(np.array([np.nan, np.inf, -np.inf]))
+
+    assert stats.count == 0 and not stats.finite
+    assert frame_stats([]) == FrameStats()
+
+
+def test_single_value(ax):
+    stats = frame_stats(np.array([3.0]))
+    assert (stats.min, stats.max, stats.count, stats.is_int) == (3.0, 3.0, 1, True)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        set_axis_frame(ax, "x", stats)
+
+    assert ax.get_xlim() == (2.95, 3.05)
+    assert ax.get_xticks().tolist() == [3.0]
+
+
+@pytest.mark.parametrize(
+    "values, is_int",
+    [
+        (np.arange(10), True),
+        (np.arange(10.0), True),
+        (np.array([1.0, 2.5]), False),
+        (np.array([1.0, np.nan, 3.0]), True),
+        (np.array([True, False]), True),
+    ],
+)
+def test_int_detection(values, is_int):
+    assert frame_stats(values).is_int is is_int
+
+
+def test_nan_values_are_not_all_ints():
+    assert all_ints([1, 2, 3])
+    assert not all_ints(np.array([1.0, np.nan]))
+    with pytest.raises(TypeError):
+        all_ints((1, 2))
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 1000, 2**16])
+def test_blocks_give_the_stats_of_the_whole(block_size):
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal(10**4)
+    values[rng.integers(0, 10**4, 100)] = np.nan
+    whole = FrameStats(
+        min=np.nanmin(values),
+        max=np.nanmax(values),
+        finite=False,
+        is_int=False,
+        count=int(np.isfinite(values).sum()),
+    )
+
+    assert frame_stats(values, block_size) == whole
+
+
+def test_legacy_range_frame(ax):
+    range_frame(10, ax, x=[0, 1, 2, 3, 10], y=[0.5, 2.25, 7.0])
+
+    assert ax.spines["bottom"].get_bounds() == (0, 10)
+    assert ax.spines["left"].get_bounds() == (0.5, 7.0)
+    assert ax.get_xlim() == pytest.approx((-0.5, 10.5))
+    assert ax.get_ylim() == pytest.approx((0.175, 7.325))
+    xlabels = [label.get_text() for label in ax.get_xticklabels()]
+    ylabels = [label.get_text() for label in ax.get_yticklabels()]
+    assert (xlabels[0], xlabels[-1]) == ("0", "10")
+    assert (ylabels[0], ylabels[-1]) == ("0.5", "7.0")
+
+
+def test_end_ticks_are_kept_when_labels_crowd(ax):
+    ax.figure.set_size_inches(1, 1)
+    range_frame(30, ax, x=np.linspace(0, 1000, 7), y=[0, 1], dimension="x")
+
+    ticks = ax.get_xticks()
+    assert (ticks[0], ticks[-1]) == (0, 1000)
+    assert len(ticks) == 2
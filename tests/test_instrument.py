@@ -0,0 +1,58 @@
+import threading
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+import tufte
+from tufte.instrument import add_listener, instrument, remove_listener
+
+
+def plot():
+    ax = tufte.lineplot([0, 1, 2], [1, 0, 2])
+    plt.close(ax.figure)
+
+
+def test_instrument_ignores_other_threads():
+    with instrument() as events:
+        thread = threading.Thread(target=plot)
+        thread.start()
+        thread.join()
+        assert events == []
+
+        plot()
+
+    assert "plot" in [event.stage for event in events]
+
+
+def test_nested_instrument_blocks_both_collect():
+    with instrument() as outer:
+        with instrument() as inner:
+            plot()
+        plot()
+
+    assert len(outer) == 2 * len(inner) > 0
+
+
+def test_add_listener_receives_every_thread():
+    events = []
+    add_listener(events.append)
+    try:
+        thread = threading.Thread(target=plot)
+        thread.start()
+        thread.join()
+
+    finally:
+        remove_listener(events.append)
+
+    assert "plot" in [event.stage for event in events]
+
+
+def test_export_reports_savefig():
+    ax = tufte.lineplot([0, 1, 2], [1, 0, 2])
+    with instrument() as events:
+        tufte.export(ax, "png", close=True)
+
+    assert [event.stage for event in events] == ["savefig"]
@@ -0,0 +1,78 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+
+from tufte.line import Line
+
+pytestmark = pytest.mark.filterwarnings("ignore:Marker options")
+
+Y = np.random.default_rng(0).standard_normal(40).cumsum()
+
+
+@pytest.fixture
+def line():
+    line = Line(xlabel="x", ylabel="y", figsize=(6, 4), dpi=100)
+    line.plot(np.arange(20), Y[:20])
+    line.update(headroom=1.0)
+    return line
+
+
+def test_append_grows_the_line(line):
+    line.append([20, 21], [0.0, 1.0])
+
+    assert len(line.line.get_xdata()) == 22
+    assert line.line.get_ydata()[-2:].tolist() == [0.0, 1.0]
+
+
+def test_append_moves_the_range_frame(line):
+    low = Y[:20].min() - 1
+    line.append([20], [low])
+
+    assert line.frames["y"].min == low
+    assert line.frames["x"].max == 20
+    assert line.ax.spines["left"].get_bounds()[0] == low
+    assert line.ax.spines["bottom"].get_bounds()[1] == 20
+    assert line.ax.get_yticks()[0] == low
+
+
+def test_append_within_the_limits_does_not_redraw(line, monkeypatch):
+    draws = []
+    monkeypatch.setattr(line.fig.canvas, "draw", lambda: draws.append(1))
+
+    for i in range(20, 30):
+        line.append([i], [Y[i]])
+
+    assert draws == []
+
+
+def test_append_leaving_the_limits_redraws(line, monkeypatch):
+    draws = []
+    draw = line.fig.canvas.draw
+    monkeypatch.setattr(line.fig.canvas, "draw", lambda: draws.append(draw()))
+
+    line.append([20], [Y[:20].max() + 100])
+
+    assert draws
+    assert line.ax.get_ylim()[1] > Y[:20].max() + 100
+
+
+def test_append_matches_a_full_redraw(line):
+    for i in range(20, 30):
+        line.append([i], [Y[i]])
+    blitted = np.asarray(line.fig.canvas.buffer_rgba()).astype(int)
+
+    line.fig.canvas.draw()
+    full = np.asarray(line.fig.canvas.buffer_rgba()).astype(int)
+
+    # Up to the path simplification of the whole line
+    assert np.abs(blitted - full).max() <= 8
+
+
+def test_append_before_plot_raises():
+    line = Line(xlabel="x", ylabel="y")
+
+    with pytest.raises(RuntimeError):
+        line.append([0], [0])
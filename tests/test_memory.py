@@ -0,0 +1,40 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import pytest
+
+import tufte
+from benchmarks import bench_memory
+from benchmarks.bench_memory import LIFECYCLES, MAX_GROWTH_MB, soak
+
+# Line plots warn that their default marker options are ignored
+pytestmark = pytest.mark.filterwarnings("ignore:Marker options")
+
+RENDERS = 100
+WARMUP = 20
+
+
+@pytest.mark.parametrize("lifecycle", list(LIFECYCLES))
+def test_soak_is_bounded(lifecycle):
+    fignums = plt.get_fignums()
+
+    growth, figures = soak(lifecycle, RENDERS, WARMUP)
+
+    assert figures <= 0
+    assert growth < MAX_GROWTH_MB
+    assert plt.get_fignums() == fignums
+
+
+def test_soak_detects_leaked_figures(monkeypatch):
+    leaked = []
+
+    def render_leak(i):
+        x, y = bench_memory.make_data(i)
+        leaked.append(tufte.lineplot(x, y, figsize=(4, 3), dpi=72, pyplot=False))
+
+    monkeypatch.setitem(LIFECYCLES, "leak", render_leak)
+    _, figures = soak("leak", 20, 5)
+
+    assert figures == 15
@@ -0,0 +1,79 @@
+import gc
+import io
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+import tufte
+from tufte.base import FigurePool
+
+X = np.arange(50.0)
+Y = np.sin(X / 5) * X
+DATA = pd.DataFrame({"group": np.repeat(list("abc"), 20), "value": np.arange(60.0)})
+
+CHARTS = {
+    "line": lambda **kwargs: tufte.lineplot(X, Y, **kwargs),
+    "dotdash": lambda **kwargs: tufte.scatterplot(X, Y, dotdash=True, **kwargs),
+    "bar": lambda **kwargs: tufte.barplot(list("abcde"), [1, 3, 2, 5, 4], **kwargs),
+    "box": lambda **kwargs: tufte.boxplot(Y, **kwargs),
+    "grouped_box": lambda **kwargs: tufte.boxplot(
+        "value", data=DATA, by="group", **kwargs
+    ),
+    "facet": lambda **kwargs: tufte.facetplot(X, Y, by=X % 4, **kwargs),
+}
+
+
+def render(chart: str, pool: FigurePool = None) -> np.ndarray:
+    ax = CHARTS[chart](figsize=(8, 4), pool=pool)
+    buffer = io.BytesIO()
+    ax.figure.savefig(buffer, format="rgba", dpi=30)
+    if pool is None:
+        plt.close(ax.figure)
+    else:
+        pool.release(ax.figure)
+
+    return np.frombuffer(buffer.getvalue(), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("previous", CHARTS)
+@pytest.mark.parametrize("chart", CHARTS)
+def test_pooled_render_equals_fresh_render(previous, chart):
+    pool = FigurePool()
+    render(previous, pool)
+
+    np.testing.assert_array_equal(render(chart, pool), render(chart))
+
+
+def test_reset_removes_figure_texts_and_legends():
+    pool = FigurePool()
+    for _ in range(3):
+        ax = CHARTS["facet"](figsize=(8, 4), pool=pool)
+        ax.plot([0, 1], [0, 1], label="line")
+        ax.legend()
+        fig = ax.figure
+        pool.release(fig)
+
+    assert fig.texts == []
+    assert fig.axes[0].get_legend() is None
+
+
+def test_grouped_box_case_draws_groups():
+    ax = CHARTS["grouped_box"](figsize=(8, 4))
+
+    assert [label.get_text() for label in ax.get_xticklabels()] == list("abc")
+    plt.close(ax.figure)
+
+
+def test_figures_never_released_are_forgotten():
+    pool = FigurePool(pyplot=False)
+    for _ in range(5):
+        pool.acquire((4, 3))
+    gc.collect()
+
+    assert len(pool._owned) == 0
@@ -0,0 +1,53 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+
+import tufte
+
+pytestmark = pytest.mark.filterwarnings("ignore:Marker options")
+
+
+def images(ax) -> dict:
+    images = tufte.export(ax, ["svg", "pdf"], dpi=50, close=True)
+    return {fmt: images[fmt][50] for fmt in images}
+
+
+def test_dense_layers_are_rasterized():
+    x = np.arange(200)
+    ax = tufte.lineplot(x, np.sin(x), rasterize_above=100, figsize=(4, 3), dpi=50)
+
+    assert [line.get_rasterized() for line in ax.lines] == [True]
+    output = images(ax)
+    assert b"<image" in output["svg"]
+    assert b"/Subtype /Image" in output["pdf"]
+
+
+def test_sparse_layers_stay_vector():
+    x = np.arange(50)
+    ax = tufte.lineplot(x, np.sin(x), rasterize_above=100, figsize=(4, 3), dpi=50)
+
+    assert [line.get_rasterized() for line in ax.lines] == [False]
+    output = images(ax)
+    assert b"<image" not in output["svg"]
+    assert b"/Subtype /Image" not in output["pdf"]
+
+
+def test_only_data_layers_are_rasterized():
+    rng = np.random.default_rng(0)
+    x, y = rng.random((2, 500))
+    ax = tufte.scatterplot(x, y, rasterize_above=100, figsize=(4, 3), dpi=50)
+
+    assert ax.collections
+    assert all(points.get_rasterized() for points in ax.collections)
+    assert not any(spine.get_rasterized() for spine in ax.spines.values())
+    assert not any(label.get_rasterized() for label in ax.get_xticklabels())
+
+
+def test_rasterization_can_be_disabled():
+    x = np.arange(200)
+    ax = tufte.lineplot(x, np.sin(x), rasterize_above=None, figsize=(4, 3), dpi=50)
+
+    assert b"<image" not in images(ax)["svg"]
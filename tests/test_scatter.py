@@ -0,0 +1,72 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.collections import LineCollection
+
+import tufte
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    rng = np.random.default_rng(0)
+    path = tmp_path / "points.csv"
+    pd.DataFrame(
+        {"x": rng.uniform(0, 10, 10**4), "y": rng.uniform(-1, 1, 10**4)}
+    ).to_csv(path, index=False)
+
+    return path
+
+
+def test_density_reads_chunk_iterators_once_with_limits(csv_path):
+    reader = pd.read_csv(csv_path, chunksize=1000)
+    ax = tufte.scatterplot(
+        "x", "y", data=reader, mode="density", limits=((0, 10), (-1, 1)), bins=50
+    )
+
+    counts = ax.images[0].get_array()
+    assert counts.sum() == 10**4
+    assert ax.get_xlim()[0] <= 0 and ax.get_xlim()[1] >= 10
+    assert ax.get_ylim()[0] <= -1 and ax.get_ylim()[1] >= 1
+
+
+def test_density_rejects_chunk_iterators_without_limits(csv_path):
+    reader = pd.read_csv(csv_path, chunksize=1000)
+    with pytest.raises(ValueError, match="limits"):
+        tufte.scatterplot("x", "y", data=reader, mode="density")
+
+
+@pytest.mark.filterwarnings("ignore:Marker options")
+@pytest.mark.parametrize("mode", ["points", "density"])
+def test_dotdash_rugs_are_thinned_to_pixels(mode):
+    rng = np.random.default_rng(0)
+    x, y = rng.standard_normal((2, 10**5))
+    ax = tufte.scatterplot(x, y, mode=mode, dotdash=True, figsize=(4, 3), dpi=50)
+
+    rugs = [c for c in ax.collections if isinstance(c, LineCollection)]
+    assert len(rugs) == 2
+    x_rug, y_rug = rugs
+    width, height = ax.bbox.width, ax.bbox.height
+    # One tick per occupied pixel, however many values share it
+    assert 0 < len(x_rug.get_segments()) <= width
+    assert 0 < len(y_rug.get_segments()) <= height
+    ticks = np.array([segment[0, 0] for segment in x_rug.get_segments()])
+    assert np.all(np.diff(ticks) > 0)
+    assert ax.get_xlim()[0] < ticks[0] and ticks[-1] < ax.get_xlim()[1]
+    assert not ax.spines["bottom"].get_visible()
+    assert not ax.spines["left"].get_visible()
+
+
+@pytest.mark.filterwarnings("ignore:Marker options")
+def test_dotdash_rug_marks_every_value():
+    x = np.array([1.0, 2.0, 2.0, 3.0])
+    ax = tufte.scatterplot(x, x, dotdash=True, figsize=(4, 3), dpi=50)
+
+    x_rug = [c for c in ax.collections if isinstance(c, LineCollection)][0]
+    ticks = [segment[0, 0] for segment in x_rug.get_segments()]
+    assert len(ticks) == 3
+    step = np.diff(ax.get_xlim())[0] / ax.bbox.width
+    assert np.allclose(ticks, [1.0, 2.0, 3.0], atol=step)
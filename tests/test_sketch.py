@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from tufte.sketch import QuantileSketch
+
+K = 200
+# Rank error of the sketch, about 1.7 / k, with some slack
+EPSILON = 2 / K
+Q = np.linspace(0, 1, 101)
+
+
+def rank_error(sketch: QuantileSketch, values: np.ndarray) -> float:
+    values = np.sort(values)
+    estimates = sketch.quantile(Q)
+    lower = np.searchsorted(values, estimates, side="left") / len(values)
+    upper = np.searchsorted(values, estimates, side="right") / len(values)
+
+    return float(np.max(np.maximum(lower - Q, Q - upper).clip(0)))
+
+
+@pytest.mark.parametrize("n", [10**5, 10**6])
+def test_quantiles_are_within_the_rank_error(n):
+    values = np.random.default_rng(0).lognormal(size=n)
+    sketch = QuantileSketch.from_chunks(np.array_split(values, 10), k=K, seed=0)
+
+    assert rank_error(sketch, values) <= EPSILON
+    assert sum(len(level) for level in sketch.levels) <= 3 * K + len(sketch.levels)
+
+
+def test_merge_matches_one_sketch_of_all_values():
+    rng = np.random.default_rng(1)
+    a, b = rng.normal(size=60_000), rng.exponential(size=40_000)
+    merged = QuantileSketch(k=K, seed=0).update(a).merge(
+        QuantileSketch(k=K, seed=1).update(b)
+    )
+    whole = QuantileSketch(k=K, seed=0).update(np.concatenate((a, b)))
+
+    values = np.sort(np.concatenate((a, b)))
+    assert merged.count == whole.count == len(values)
+    assert rank_error(merged, values) <= EPSILON
+    ranks = [
+        np.searchsorted(values, sketch.quantile(Q)) / len(values)
+        for sketch in (merged, whole)
+    ]
+    assert np.max(np.abs(ranks[0] - ranks[1])) <= 2 * EPSILON
+
+
+def test_moments_are_exact():
+    rng = np.random.default_rng(2)
+    chunks = [rng.normal(loc=i, size=1000 + i) for i in range(20)]
+    chunks[3][::5] = np.nan
+    values = np.concatenate(chunks)
+    values = values[np.isfinite(values)]
+
+    sketch = QuantileSketch.from_chunks(chunks[:10]).merge(
+        QuantileSketch.from_chunks(chunks[10:])
+    )
+
+    assert sketch.count == len(values)
+    assert sketch.stats.min == values.min() and sketch.stats.max == values.max()
+    assert sketch.quantile([0, 1]).tolist() == [values.min(), values.max()]
+    assert sketch.mean == pytest.approx(values.mean(), rel=1e-12)
+    assert sketch.std == pytest.approx(values.std(), rel=1e-12)
+
+
+def test_empty_sketch():
+    sketch = QuantileSketch().update([np.nan])
+
+    assert sketch.count == 0
+    assert np.isnan(sketch.quantile(0.5)) and np.isnan(sketch.std)
@@ -0,0 +1,76 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import tufte
+from tufte.base import Plot, frame_stats
+from tufte.stream import Chunks, iter_columns, reduce_chunks
+
+N = 10**4
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    y = rng.standard_normal(N)
+    y[::97] = np.nan
+    return pd.DataFrame({"x": np.arange(N, dtype=np.float64), "y": y})
+
+
+def stats_of(x, y):
+    *_, xstats, ystats = reduce_chunks(iter_columns(x, y), "minmax", 100, 50)
+    return xstats, ystats
+
+
+def test_npy_memmap(frame, tmp_path):
+    path = tmp_path / "y.npy"
+    np.save(path, frame["y"].to_numpy())
+    y = Plot.fit(str(path))
+
+    assert isinstance(y, Chunks)
+    assert stats_of(frame["x"].to_numpy(), y)[1] == frame_stats(frame["y"])
+
+
+def test_csv_reader(frame, tmp_path):
+    path = tmp_path / "frame.csv"
+    frame.to_csv(path, index=False)
+    reader = pd.read_csv(path, chunksize=999)
+
+    assert stats_of(Plot.fit("x", reader), Plot.fit("y", reader)) == (
+        frame_stats(frame["x"]),
+        frame_stats(frame["y"]),
+    )
+
+
+def test_parquet_row_groups(frame, tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "frame.parquet"
+    frame.to_parquet(path, row_group_size=999)
+
+    xstats, ystats = stats_of(
+        Chunks(str(path), "x", chunksize=1234), Chunks(str(path), "y", chunksize=1234)
+    )
+
+    assert (xstats, ystats) == (frame_stats(frame["x"]), frame_stats(frame["y"]))
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_tables_need_a_column(frame, tmp_path, suffix):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / f"frame{suffix}"
+    getattr(frame, f"to_{suffix[1:]}")(path, index=False)
+
+    with pytest.raises(ValueError, match="column"):
+        tufte.lineplot(np.arange(N), str(path))
+
+
+def test_readers_need_a_column(frame, tmp_path):
+    path = tmp_path / "frame.csv"
+    frame.to_csv(path, index=False)
+
+    with pytest.raises(ValueError, match="column"):
+        tufte.lineplot(np.arange(N), pd.read_csv(path, chunksize=999))
@@ -0,0 +1,43 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from tufte import text
+from tufte.text import clear_cache, max_text_width, text_extent
+
+
+@pytest.mark.parametrize("dpi", [72, 100, 200])
+@pytest.mark.parametrize("family", ["DejaVu Sans", "DejaVu Serif", "DejaVu Sans Mono"])
+@pytest.mark.parametrize("fontsize", [8, 12, 30])
+def test_extent_matches_the_drawn_text(dpi, family, fontsize):
+    fig = Figure(dpi=dpi)
+    FigureCanvasAgg(fig)
+    renderer = fig.canvas.get_renderer()
+
+    for label in ["1,000", "Wide label", "ygq", "$x^2$"]:
+        drawn = fig.text(0, 0, label, fontsize=fontsize, family=family)
+        extent = drawn.get_window_extent(renderer)
+
+        assert text_extent(label, fontsize, family, dpi) == pytest.approx(
+            (extent.width, extent.height)
+        )
+
+
+def test_widest_label():
+    labels = [str(10**i) for i in range(100)]
+
+    assert max_text_width(labels, 10) == text_extent(labels[-1], 10)[0]
+    assert max_text_width([], 10) == 0.0
+
+
+def test_clear_cache():
+    text_extent("cached", 10)
+    assert text._measure.cache_info().currsize > 0
+
+    clear_cache()
+
+    assert text._measure.cache_info().currsize == 0
@@ -1,6 +1,41 @@
 __version__ = "0.2.3"
 
-from tufte.bar import main as barplot
-from tufte.box import main as boxplot
-from tufte.line import main as lineplot
-from tufte.scatter import main as scatterplot
+# Imported eagerly (it has no dependencies), as importing the tufte.instrument
+# module would otherwise bind the module over the lazy function of that name
+from tufte.instrument import instrument
+
+# Plot modules pull in matplotlib, so they are only imported on first access
+_LAZY = {
+    "barplot": ("tufte.bar", "main"),
+    "boxplot": ("tufte.box", "main"),
+    "lineplot": ("tufte.line", "main"),
+    "scatterplot": ("tufte.scatter", "main"),
+    "facetplot": ("tufte.facet", "main"),
+    "densityplot": ("tufte.density", "main"),
+    # Not tufte.export, which importing would bind over the function
+    "export": ("tufte._export", "export"),
+    "sparklines": ("tufte.sparkline", "sparklines"),
+    "render_many": ("tufte.batch", "render_many"),
+    "render_async": ("tufte.aio", "render_async"),
+    "AsyncRenderer": ("tufte.aio", "AsyncRenderer"),
+    "RenderCache": ("tufte.cache", "RenderCache"),
+}
+
+__all__ = ["__version__", "instrument", *_LAZY]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    module, attr = _LAZY[name]
+    value = getattr(import_module(module), attr)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
@@ -0,0 +1,175 @@
+import io
+from collections.abc import Iterable
+from typing import Union
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import RendererAgg
+from matplotlib.figure import Figure
+
+from tufte.instrument import stage
+
+# Encoded from one Agg rendering per resolution
+RASTER_FORMATS = ("png", "jpg", "jpeg", "rgba", "raw")
+VECTOR_FORMATS = ("svg", "pdf", "ps", "eps")
+FORMATS = RASTER_FORMATS + VECTOR_FORMATS
+PNG_COMPRESSION = 6
+
+
+def render_rgba(fig: Figure, dpi: float) -> np.ndarray:
+    """Draw a figure with Agg at a resolution
+
+    The figure keeps its canvas and resolution.
+
+    Args:
+        fig (Figure): Figure.
+        dpi (float): Resolution.
+
+    Returns:
+        np.ndarray: (height, width, 4) RGBA pixels.
+    """
+    original = fig.dpi
+    fig.dpi = dpi
+    try:
+        width, height = fig.bbox.size
+        renderer = RendererAgg(width, height, dpi)
+        fig.draw(renderer)
+
+    finally:
+        fig.dpi = original
+
+    return np.asarray(renderer.buffer_rgba())
+
+
+def encode(
+    rgba: np.ndarray,
+    format: str,
+    dpi: float,
+    png_compression: int = PNG_COMPRESSION,
+) -> bytes:
+    """Encode RGBA pixels as a raster image
+
+    Args:
+        rgba (np.ndarray): (height, width, 4) RGBA pixels.
+        format (str): One of RASTER_FORMATS.
+        dpi (float): Resolution stored in the image.
+        png_compression (int, optional): zlib level of PNG output, from 0
+            (fastest, largest) to 9 (slowest, smallest). Defaults to
+            PNG_COMPRESSION.
+
+    Returns:
+        bytes: Image.
+    """
+    from PIL import Image
+
+    if format in ("rgba", "raw"):
+        return rgba.tobytes()
+
+    image = Image.fromarray(rgba, "RGBA")
+    buffer = io.BytesIO()
+    if format == "png":
+        image.save(
+            buffer, format="png", dpi=(dpi, dpi), compress_level=png_compression
+        )
+    else:
+        # JPEG has no transparency
+        image.convert("RGB").save(buffer, format="jpeg", dpi=(dpi, dpi))
+
+    return buffer.getvalue()
+
+
+def export(
+    ax: Union[Axes, Figure],
+    formats: Union[str, Iterable[str]] = "png",
+    dpi: Union[float, Iterable[float]] = None,
+    png_compression: int = PNG_COMPRESSION,
+    close: bool = False,
+) -> dict:
+    """Render a chart to several formats and resolutions in memory
+
+    The figure is laid out once. Raster formats are encoded from a single Agg
+    rendering per resolution, and a vector format is rendered once for all
+    resolutions unless the figure has rasterized layers, whose pixels depend on
+    the resolution.
+
+    Args:
+        ax (Union[Axes, Figure]): Axes returned by a plot function, or figure.
+        formats (Union[str, Iterable[str]], optional): Formats among FORMATS.
+            Defaults to "png".
+        dpi (Union[float, Iterable[float]], optional): Resolutions. Defaults to
+            None (the figure resolution).
+        png_compression (int, optional): zlib level of PNG output, from 0
+            (fastest, largest) to 9 (slowest, smallest). Defaults to
+            PNG_COMPRESSION, as savefig.
+        close (bool, optional): Close the figure once exported, so that pyplot
+            does not keep it alive. Pooled figures should be released to their
+            pool instead. Defaults to False.
+
+    Raises:
+        ValueError: If a format is unknown or the compression level is not
+            between 0 and 9.
+
+    Returns:
+        dict: Bytes of every format and resolution, as {format: {dpi: bytes}}.
+
+    Example:
+        >>> ax = tufte.lineplot(x, y)
+        >>> images = tufte.export(ax, ["png", "svg"], dpi=[72, 200])
+        >>> png = images["png"][200]
+    """
+    fig = ax if isinstance(ax, Figure) else ax.figure
+    formats = [formats] if isinstance(formats, str) else list(formats)
+    unknown = [format for format in formats if format not in FORMATS]
+    if unknown:
+        raise ValueError(f"Expected formats among {FORMATS}. Got {unknown}")
+
+    if not 0 <= png_compression <= 9:
+        raise ValueError(
+            f"Expected png_compression between 0 and 9. Got {png_compression}"
+        )
+
+    resolutions = [dpi] if dpi is None or np.ndim(dpi) == 0 else list(dpi)
+    resolutions = [float(fig.dpi if value is None else value) for value in resolutions]
+    rasterized = any(
+        artist.get_rasterized() for artist in fig.findobj(include_self=False)
+    )
+
+    images = {format: {} for format in formats}
+    engine = fig.get_layout_engine()
+    if engine is not None:
+        with stage("layout"):
+            fig.draw_without_rendering()
+        # The layout does not depend on the resolution
+        fig.set_layout_engine("none")
+
+    try:
+        raster = [format for format in formats if format in RASTER_FORMATS]
+        for value in resolutions if raster else []:
+            with stage("savefig") as event:
+                rgba = render_rgba(fig, value)
+                for format in raster:
+                    images[format][value] = encode(rgba, format, value, png_compression)
+                event.n = rgba.shape[0] * rgba.shape[1]
+
+        for format in formats:
+            if format in RASTER_FORMATS:
+                continue
+
+            content = None
+            for value in resolutions:
+                if content is None or rasterized:
+                    buffer = io.BytesIO()
+                    with stage("savefig"):
+                        fig.savefig(buffer, format=format, dpi=value)
+                    content = buffer.getvalue()
+                images[format][value] = content
+
+    finally:
+        if engine is not None:
+            fig.set_layout_engine(engine)
+        if close:
+            import matplotlib.pyplot as plt
+
+            plt.close(fig)
+
+    return images
@@ -0,0 +1,234 @@
+import asyncio
+import io
+import os
+import threading
+from concurrent.futures import (
+    CancelledError,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+from tufte.batch import KINDS
+
+
+def render_bytes(
+    kind: str,
+    format: str = "png",
+    dpi: float = None,
+    kwargs: dict = None,
+    cancelled: threading.Event = None,
+) -> bytes:
+    """Render a chart to bytes on a figure unknown to pyplot
+
+    Args:
+        kind (str): Either line, scatter, bar, box or density.
+        format (str, optional): Output format. Defaults to "png".
+        dpi (float, optional): Output resolution. Defaults to None.
+        kwargs (dict, optional): Arguments of the plot function. Defaults to None.
+        cancelled (threading.Event, optional): Set to stop rendering before the
+            next stage. Defaults to None.
+
+    Raises:
+        ValueError: If the kind is unknown or the chart targets given axes.
+        CancelledError: If cancelled was set.
+
+    Returns:
+        bytes: Rendered chart.
+    """
+    import tufte
+    from tufte.base import new_figure, params
+    from tufte.instrument import stage
+
+    if kind not in KINDS:
+        raise ValueError(f"Expected kind to be one of {tuple(KINDS)}. Got {kind}")
+
+    kwargs = dict(kwargs or {})
+    if kwargs.get("ax") is not None or kwargs.get("pool") is not None:
+        raise ValueError("Charts rendered to bytes own their figure")
+
+    if cancelled is not None and cancelled.is_set():
+        raise CancelledError
+
+    fig, kwargs["ax"] = new_figure(kwargs.pop("figsize", (20, 10)), dpi)
+    getattr(tufte, KINDS[kind])(**kwargs)
+
+    if cancelled is not None and cancelled.is_set():
+        raise CancelledError
+
+    buffer = io.BytesIO()
+    with stage("savefig", kind):
+        fig.savefig(
+            buffer, format=format, dpi=dpi, facecolor=params["savefig.facecolor"]
+        )
+
+    return buffer.getvalue()
+
+
+class AsyncRenderer:
+    """Renders charts off the event loop, a bounded number at a time.
+
+    Charts are rendered on an executor, on figures that pyplot does not know
+    about, so rendering neither blocks the loop nor touches pyplot's global
+    state. At most max_concurrency charts render at once: further requests
+    wait their turn, and are rejected once max_pending requests are already
+    waiting or rendering. Cancelling a request that is still waiting removes
+    it, and cancelling one that is rendering stops it before its next stage.
+
+    The concurrency limit is enforced within one event loop at a time: a
+    renderer first used in another loop starts over with a new limit, so a
+    renderer should not be shared by loops running at once, e.g. in several
+    threads.
+
+    Args:
+        max_concurrency (int, optional): Charts rendered at once. Defaults to
+            min(4, os.cpu_count()).
+        max_pending (int, optional): Requests waiting or rendering above which
+            new ones are rejected. Defaults to None (unbounded).
+        executor (Executor, optional): Executor rendering the charts, e.g. a
+            ProcessPoolExecutor for CPU-bound services. Defaults to None (a
+            thread pool of max_concurrency threads).
+
+    Example:
+        >>> renderer = AsyncRenderer(max_concurrency=2)
+        >>> png = await renderer.render("line", x=[0, 1, 2], y=[1, 0, 2])
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = None,
+        max_pending: int = None,
+        executor: Executor = None,
+    ):
+        self.max_concurrency = max_concurrency or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="tufte-render"
+        )
+        self.pending = 0
+        self._semaphore = None
+        self._loop = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Semaphores belong to the loop they are first used in
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+
+        return self._semaphore
+
+    async def render(
+        self,
+        kind: str,
+        format: str = "png",
+        dpi: float = None,
+        **kwargs,
+    ) -> bytes:
+        """Render a chart without blocking the event loop
+
+        Args:
+            kind (str): Either line, scatter, bar, box or density.
+            format (str, optional): Output format. Defaults to "png".
+            dpi (float, optional): Output resolution. Defaults to None.
+            **kwargs: Arguments of the plot function.
+
+        Raises:
+            asyncio.QueueFull: If max_pending requests are already pending.
+            ValueError: If the kind is unknown or the chart targets given axes.
+
+        Returns:
+            bytes: Rendered chart.
+        """
+        if self.max_pending is not None and self.pending >= self.max_pending:
+            raise asyncio.QueueFull(f"{self.pending} charts are already pending")
+
+        semaphore = self._get_semaphore()
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        try:
+            await semaphore.acquire()
+            # Events cannot be sent to other processes
+            cancelled = (
+                None
+                if isinstance(self.executor, ProcessPoolExecutor)
+                else threading.Event()
+            )
+            try:
+                future = self.executor.submit(
+                    render_bytes, kind, format, dpi, kwargs, cancelled
+                )
+
+            except BaseException:
+                semaphore.release()
+                raise
+
+            def release(_):
+                # The slot is freed when rendering ends, even if the request
+                # was cancelled while the chart was rendering, unless the loop
+                # was closed meanwhile, with its semaphore
+                if not loop.is_closed():
+                    try:
+                        loop.call_soon_threadsafe(semaphore.release)
+
+                    except RuntimeError:
+                        # Closed between the check and the call
+                        pass
+
+            future.add_done_callback(release)
+            try:
+                return await asyncio.wrap_future(future)
+
+            except asyncio.CancelledError:
+                if cancelled is not None:
+                    cancelled.set()
+                raise
+
+        finally:
+            self.pending -= 1
+
+    def shutdown(self, wait: bool = True):
+        """Stop the executor
+
+        Args:
+            wait (bool, optional): Wait for running charts. Defaults to True.
+        """
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_default = None
+
+
+async def render_async(
+    kind: str,
+    format: str = "png",
+    dpi: float = None,
+    renderer: AsyncRenderer = None,
+    **kwargs,
+) -> bytes:
+    """Render a chart to bytes without blocking the event loop
+
+    Args:
+        kind (str): Either line, scatter, bar, box or density.
+        format (str, optional): Output format. Defaults to "png".
+        dpi (float, optional): Output resolution. Defaults to None.
+        renderer (AsyncRenderer, optional): Renderer bounding concurrency.
+            Defaults to None (a shared AsyncRenderer with default limits,
+            bound to a single event loop at a time: pass a renderer per loop
+            when several loops render at once).
+        **kwargs: Arguments of the plot function, e.g. x and y.
+
+    Returns:
+        bytes: Rendered chart.
+
+    Example:
+        >>> png = await tufte.render_async("line", x=[0, 1, 2], y=[1, 0, 2])
+    """
+    global _default
+
+    if renderer is None:
+        if _default is None:
+            _default = AsyncRenderer()
+        renderer = _default
+
+    return await renderer.render(kind, format, dpi, **kwargs)
@@ -1,22 +1,25 @@
-from gettext import ngettext
-import sys
 import warnings
-from pathlib import Path
 from typing import Iterable, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from matplotlib.axes import Axes
+from matplotlib.collections import PolyCollection
+from matplotlib.transforms import ScaledTranslation
 
-PROJECT_ROOT = Path.cwd().resolve().parent
-sys.path.append(str(PROJECT_ROOT))
-
-from tufte.base import Plot
+from tufte.base import RASTERIZE_ABOVE, FigurePool, Plot, as_values
+from tufte.instrument import timed
+from tufte.stream import Chunks, iter_columns
+from tufte.text import max_text_width, text_extent
 
 
 class Bar(Plot):
     # TODO: redo this class!
+    # Bars above which they are drawn as one collection, with thinned labels
+    BATCH_ABOVE = 100
+
+    @timed("plot")
     def plot(
         self,
         x: str | Iterable,
@@ -27,18 +30,41 @@ class Bar(Plot):
         edgecolor: str = "none",
         width: float = 0.5,
         gridcolor: str = "white",
+        dtype: str = None,
         **kwargs,
     ):
 
         x = self.fit(x, data)
-        y = self.fit(y, data)
-        _ = self.get_canvas({"x": x, "y": y, "pad": 0.05})
+        y = self.fit(y, data, dtype)
+        if isinstance(x, Chunks) or isinstance(y, Chunks):
+            # One row per bar, so the chunks are small enough to be joined
+            x, y = self.join_chunks(x, y)
+            if dtype is not None:
+                y = y.astype(dtype, copy=False)
 
-        bars = self.ax.bar(
-            x, y, align=align, color=color, edgecolor=edgecolor, width=width
-        )
+        _ = self.get_canvas({"y": y, "pad": 0.05, "is_bar": True})
+
+        positions, categories = self.get_positions(x)
+        if positions is None or len(positions) <= self.BATCH_ABOVE:
+            bars = self.ax.bar(
+                x if positions is None else positions,
+                y,
+                align=align,
+                color=color,
+                edgecolor=edgecolor,
+                width=width,
+            )
+            self.ax.bar_label(bars, fmt="%.1f", label_type="edge")
+
+        else:
+            self.plot_batch(positions, as_values(y), align, color, edgecolor, width)
 
-        self.ax.bar_label(bars, fmt="%.1f", label_type="edge")
+        if categories is not None:
+            ticks = np.arange(len(categories))
+            visible = self.get_visible_labels(
+                ticks, categories, plt.rcParams["xtick.labelsize"]
+            )
+            self.ax.set_xticks(ticks[visible], categories[visible])
 
         self.set_bar_spines()
 
@@ -49,6 +75,148 @@ class Bar(Plot):
 
         return self.ax
 
+    def plot_batch(
+        self,
+        positions: np.ndarray,
+        y: np.ndarray,
+        align: str = "center",
+        color: str = "gray",
+        edgecolor: str = "none",
+        width: float = 0.5,
+    ):
+        """Draws every bar as a polygon of one collection, labelling the bars
+        whose labels fit side by side
+
+        Args:
+            positions (np.ndarray): x position of each bar.
+            y (np.ndarray): Height of each bar.
+            align (str, optional): Either "center" or "edge". Defaults to "center".
+            color (str, optional): Bar colour. Defaults to "gray".
+            edgecolor (str, optional): Bar edge colour. Defaults to "none".
+            width (float, optional): Bar width. Defaults to 0.5.
+        """
+        mask = np.isfinite(positions) & np.isfinite(y)
+        if not mask.all():
+            positions, y = positions[mask], y[mask]
+
+        left = positions - (width / 2 if align == "center" else 0)
+        right = left + width
+        bottom = np.zeros_like(y, dtype=np.float64)
+        self.bars = PolyCollection(
+            np.stack(
+                [
+                    np.stack([left, bottom], axis=-1),
+                    np.stack([left, y], axis=-1),
+                    np.stack([right, y], axis=-1),
+                    np.stack([right, bottom], axis=-1),
+                ],
+                axis=1,
+            ),
+            facecolors=color,
+            edgecolors=edgecolor,
+        )
+        self.ax.add_collection(self.bars)
+        self.rasterize_dense(self.bars, len(y))
+        self.ax.autoscale_view(scaley=False)
+
+        labels = np.char.mod("%.1f", y)
+        centers = (left + right) / 2
+        visible = self.get_visible_labels(centers, labels, plt.rcParams["font.size"])
+        for above, offset, va in ((True, 3, "bottom"), (False, -3, "top")):
+            transform = self.ax.transData + ScaledTranslation(
+                0, offset / 72, self.fig.dpi_scale_trans
+            )
+            for index in visible[(y[visible] >= 0) == above]:
+                self.ax.text(
+                    centers[index],
+                    y[index],
+                    labels[index],
+                    transform=transform,
+                    ha="center",
+                    va=va,
+                )
+
+    @staticmethod
+    def get_positions(x) -> tuple:
+        """Bar positions of x
+
+        Categorical values are placed at their codes, and other non-numeric
+        values in the order of their first appearance, as matplotlib does.
+
+        Args:
+            x: x values.
+
+        Returns:
+            tuple: Positions, None for dates, and category labels, None unless
+                x is categorical.
+        """
+        if isinstance(x, pd.Series | pd.Index) and isinstance(
+            x.dtype, pd.CategoricalDtype
+        ):
+            x = x.array
+
+        if isinstance(x, pd.Categorical):
+            # Missing values have code -1, and no bar
+            codes = np.where(x.codes < 0, np.nan, x.codes)
+            return codes, np.asarray(x.categories).astype(str)
+
+        values = np.asarray(x).ravel()
+        if values.dtype.kind in "mM":
+            return None, None
+
+        if values.dtype.kind in "biuf":
+            return values, None
+
+        codes, categories = pd.factorize(values)
+        codes = np.where(codes < 0, np.nan, codes)
+
+        return codes, np.asarray(categories).astype(str)
+
+    def get_visible_labels(
+        self, positions: np.ndarray, labels: np.ndarray, fontsize: float
+    ) -> np.ndarray:
+        """Indices of evenly spaced labels that fit side by side along x
+
+        Args:
+            positions (np.ndarray): x position of each label.
+            labels (np.ndarray): Labels.
+            fontsize (float): Font size.
+
+        Returns:
+            np.ndarray: Indices of the labels to draw.
+        """
+        order = np.argsort(positions, kind="stable")
+        if len(order) < 2:
+            return order
+
+        xmin, xmax = self.ax.get_xlim()
+        pitch = np.min(np.diff(positions[order])) * self.ax.bbox.width / (xmax - xmin)
+        # With a space between neighbouring labels
+        label_width = max_text_width(labels, fontsize, dpi=self.fig.dpi) + (
+            text_extent(" ", fontsize, dpi=self.fig.dpi)[0]
+        )
+        step = max(int(np.ceil(label_width / max(pitch, 1e-9))), 1)
+
+        return order[::step]
+
+    @staticmethod
+    def join_chunks(x, y) -> tuple:
+        """Read chunked x and y in one pass and concatenate them
+
+        Args:
+            x: x values or Chunks.
+            y: y values or Chunks.
+
+        Returns:
+            tuple: x and y arrays.
+        """
+        xs, ys = [], []
+        for x_chunk, y_chunk in iter_columns(x, y):
+            xs.append(x_chunk)
+            ys.append(y_chunk)
+
+        return np.concatenate(xs or [[]]), np.concatenate(ys or [[]])
+
     def set_bar_spines(self):
         self.ax.spines["left"].set_visible(False)
         self.ax.spines["bottom"].set_visible(False)
@@ -59,19 +227,20 @@ class Bar(Plot):
         super().set_plot_title(title)
 
     def auto_rotate_xticklabel(self):
-        figw = self.fig.get_figwidth()
-        nticks = len(self.ax.xaxis.get_majorticklocs())
-        tick_spacing = figw / float(nticks)
-        font_size = [v.get_fontsize() for v in self.ax.xaxis.get_majorticklabels()][0]
-        FONT_RATE = 0.01
-        char_width = font_size * FONT_RATE
-        max_labelwidth = (
-            max(len(v.get_text()) for v in self.ax.xaxis.get_majorticklabels())
-            * char_width
+        """Rotate the x tick labels if the widest one does not fit between ticks"""
+        labels = self.ax.xaxis.get_majorticklabels()
+        if not labels:
+            return None
+
+        tick_spacing = self.ax.bbox.width / len(labels)
+        max_labelwidth = max_text_width(
+            [label.get_text() for label in labels],
+            labels[0].get_fontsize(),
+            dpi=self.fig.dpi,
         )
 
-        if float(max_labelwidth) / tick_spacing >= 0.90:
-            plt.xticks(rotation=90)
+        if max_labelwidth / tick_spacing >= 0.90:
+            self.ax.tick_params(axis="x", labelrotation=90)
 
 
 def main(
@@ -81,9 +250,14 @@ def main(
     xlabel: str = "x",
     ylabel: str = "y",
     title: str = None,
+    dtype: str = None,
     figsize: tuple = (20, 10),
     fontsize: int = 12,
     ax: Axes = None,
+    dpi: float = None,
+    pool: FigurePool = None,
+    rasterize_above: int = RASTERIZE_ABOVE,
+    pyplot: bool = True,
     **kwargs,
 ):
     bar = Bar(
@@ -92,6 +266,10 @@ def main(
         figsize=figsize,
         fontsize=fontsize,
         ax=ax,
+        dpi=dpi,
+        pool=pool,
+        rasterize_above=rasterize_above,
+        pyplot=pyplot,
     )
     bar.set_plot_title(title)
 
@@ -99,5 +277,6 @@ def main(
         x=x,
         y=y,
         data=data,
+        dtype=dtype,
         **kwargs,
     )
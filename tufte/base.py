@@ -1,14 +1,21 @@
+import weakref
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from collections.abc import Generator, Iterable
-from dataclasses import dataclass
-from re import X
-from typing import Union
+from dataclasses import dataclass, field
+from typing import Optional, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.artist import Artist
 from matplotlib.axes import Axes
-from pkg_resources import yield_lines
+from matplotlib.figure import Figure
+from matplotlib.ticker import AutoLocator, FixedLocator, ScalarFormatter
+from matplotlib.transforms import Bbox
+
+from tufte.downsample import downsample, pixel
+from tufte.instrument import stage, timed
 
 params = {  #'figure.dpi' : 200,
     "figure.facecolor": "white",
@@ -17,8 +24,512 @@ params = {  #'figure.dpi' : 200,
     "savefig.facecolor": "white",
 }
 
-for (k, v) in params.items():
-    plt.rcParams[k] = v
+
+def style():
+    """Scoped Tufte rcParams, applied when a figure is created
+
+    Returns:
+        Context manager setting params.
+    """
+    return plt.rc_context(params)
+
+
+def new_figure(figsize: tuple = (20, 10), dpi: float = None) -> tuple:
+    """Create a figure and axes without pyplot
+
+    The figure is not registered with pyplot, so it can be built and rendered
+    from any thread, and is freed as soon as it is no longer referenced. The
+    Tufte params are set on the figure rather than through rcParams.
+
+    Args:
+        figsize (tuple, optional): Size of canvas. Defaults to (20, 10).
+        dpi (float, optional): Figure resolution. Defaults to None.
+
+    Returns:
+        tuple: Figure, drawn with Agg, and axes.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor=params["figure.facecolor"])
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_axisbelow(params["axes.axisbelow"])
+
+    return fig, ax
+
+
+BLOCK_SIZE = 2**16
+# Data layers with more points are rasterized in vector (SVG, PDF) output
+RASTERIZE_ABOVE = 5000
+
+
+@dataclass(frozen=True)
+class FrameStats:
+    """Summary of the values spanned by a range frame.
+
+    Args:
+        min (float): Smallest finite value.
+        max (float): Largest finite value.
+        finite (bool): Whether every value is finite (no NaN or inf).
+        is_int (bool): Whether every finite value is integral.
+        count (int): Number of finite values.
+    """
+
+    min: float = np.inf
+    max: float = -np.inf
+    finite: bool = True
+    is_int: bool = True
+    count: int = 0
+
+    def merge(self, other: "FrameStats") -> "FrameStats":
+        """Combine the statistics of two disjoint sets of values.
+
+        Args:
+            other (FrameStats): Statistics of the other set of values.
+
+        Returns:
+            FrameStats: Statistics of the union of both sets.
+        """
+        return FrameStats(
+            min=min(self.min, other.min),
+            max=max(self.max, other.max),
+            finite=self.finite and other.finite,
+            is_int=self.is_int and other.is_int,
+            count=self.count + other.count,
+        )
+
+
+def as_values(array) -> np.ndarray:
+    """Flatten an array-like container into a 1D numeric NumPy array.
+
+    Args:
+        array: List, NumPy array, Series or DataFrame.
+
+    Raises:
+        TypeError: If the values are not numeric.
+
+    Returns:
+        np.ndarray: Flat view (or copy, for object containers) of the values.
+    """
+    values = np.asarray(array)
+
+    if values.dtype.kind not in "biuf":
+        try:
+            values = values.astype(np.float64)
+
+        except (TypeError, ValueError) as error:
+            raise TypeError(f"Values of dtype {values.dtype} are not numeric") from error
+
+    return values.ravel()
+
+
+def _module(obj) -> str:
+    return type(obj).__module__.split(".")[0]
+
+
+def as_array(array, dtype: str = None):
+    """Convert array-likes to NumPy, without copying whenever possible.
+
+    Arrow arrays and Arrow-backed pandas columns, Polars Series and objects
+    exposing the buffer protocol become views of their memory. Numeric values
+    are cast to dtype, if given. pandas objects are otherwise returned as is.
+
+    Args:
+        array: Values.
+        dtype (str, optional): Type of numeric values, e.g. "float32" to halve
+            the memory of float64 data. Defaults to None (unchanged).
+
+    Returns:
+        Values as a NumPy array, or a pandas object.
+    """
+    if isinstance(array, pd.Series | pd.Index) and isinstance(
+        array.dtype, pd.ArrowDtype
+    ):
+        array = array.array.__arrow_array__()
+
+    if _module(array) == "pyarrow":
+        if getattr(array, "num_chunks", None) == 1:
+            array = array.chunk(0)
+        # Primitive arrays without nulls are viewed, others are copied once
+        array = array.to_numpy(zero_copy_only=False)
+
+    elif _module(array) == "polars":
+        array = array.to_numpy()
+
+    elif not isinstance(
+        array, np.ndarray | pd.Series | pd.Index | pd.DataFrame | pd.Categorical
+    ):
+        try:
+            array = np.asarray(memoryview(array))
+
+        except TypeError:
+            array = np.array(array)
+
+    kind = getattr(getattr(array, "dtype", None), "kind", "O")
+    if dtype is None or kind not in "biuf":
+        return array
+
+    if isinstance(array, pd.Series | pd.Index):
+        return array.to_numpy(dtype=dtype, copy=False)
+
+    return array.astype(dtype, copy=False)
+
+
+def select(data, columns):
+    """Project the columns of a pandas, Arrow or Polars table
+
+    Args:
+        data: DataFrame, Arrow Table or RecordBatch, or Polars DataFrame.
+        columns: Column name or list of column names.
+
+    Raises:
+        TypeError: If data is None.
+
+    Returns:
+        The column, or a pandas DataFrame of the columns.
+    """
+    if _module(data) not in ("pyarrow", "polars") or not isinstance(
+        columns, str | list
+    ):
+        return data[columns]
+
+    if isinstance(columns, str):
+        return data.column(columns) if _module(data) == "pyarrow" else data[columns]
+
+    return pd.DataFrame(
+        {name: as_array(select(data, name)) for name in columns}, copy=False
+    )
+
+
+def frame_stats(array, block_size: int = BLOCK_SIZE) -> FrameStats:
+    """Compute min, max, finiteness and integrality of values in one pass.
+
+    The values are scanned in cache-sized blocks, and NaN and inf are ignored
+    by min and max.
+
+    Args:
+        array: Values spanned by the frame.
+        block_size (int, optional): Number of values per block. Defaults to BLOCK_SIZE.
+
+    Returns:
+        FrameStats: Summary of the values.
+    """
+    values = as_values(array)
+
+    if values.size == 0:
+        return FrameStats()
+
+    if values.dtype.kind in "biu":
+        return FrameStats(
+            min=values.min().item(),
+            max=values.max().item(),
+            count=values.size,
+        )
+
+    stats = FrameStats()
+    for start in range(0, values.size, block_size):
+        block = values[start : start + block_size]
+        mask = np.isfinite(block)
+        finite = bool(mask.all())
+        if not finite:
+            block = block[mask]
+
+        if block.size == 0:
+            stats = stats.merge(FrameStats(finite=False))
+            continue
+
+        stats = stats.merge(
+            FrameStats(
+                min=block.min().item(),
+                max=block.max().item(),
+                finite=finite,
+                is_int=bool(np.equal(block, np.trunc(block)).all()),
+                count=block.size,
+            )
+        )
+
+    return stats
+
+
+def format_ticks(ticks: np.ndarray, is_int: bool) -> list:
+    """Format tick locations as integers or as floats with one decimal.
+
+    Args:
+        ticks (np.ndarray): Tick locations.
+        is_int (bool): Whether the framed values are integral.
+
+    Returns:
+        list: Tick labels.
+    """
+    if is_int:
+        return np.char.mod("%d", np.rint(ticks).astype(np.int64)).tolist()
+
+    return np.char.mod("%.1f", ticks).tolist()
+
+
+def frame_ticks(locs, vmin: float, vmax: float, is_int: bool) -> np.ndarray:
+    """Ticks of a range frame: its ends and the locator values in between.
+
+    Args:
+        locs: Tick locations of a locator.
+        vmin (float): Lower end of the frame.
+        vmax (float): Upper end of the frame.
+        is_int (bool): Whether the framed values are integral, in which case
+            fractional locations are dropped.
+
+    Returns:
+        np.ndarray: Tick locations, the frame ends first and last.
+    """
+    if vmin == vmax:
+        return np.array([vmin])
+
+    locs = np.asarray(locs)
+    inner = locs[(locs > vmin) & (locs < vmax)]
+    if is_int:
+        inner = inner[np.equal(inner, np.trunc(inner))]
+
+    return np.concatenate(([vmin], inner, [vmax]))
+
+
+def fit_tick_labels(
+    ax: Axes,
+    axis: str,
+    ticks: np.ndarray,
+    labels: list,
+    fontsize: Union[float, str] = None,
+) -> np.ndarray:
+    """Drop the inner ticks whose labels would overlap the labels of the ends
+
+    Label extents are measured once per string and font, see tufte.text.
+
+    Args:
+        ax (Axes): Matplotlib axes.
+        axis (str): Either "x" or "y".
+        ticks (np.ndarray): Tick locations, the frame ends first and last.
+        labels (list): Tick labels.
+        fontsize (Union[float, str], optional): Tick label font size. Defaults
+            to None (rcParams).
+
+    Returns:
+        np.ndarray: Indices of the ticks to keep.
+    """
+    from tufte.text import text_extent
+
+    if len(ticks) < 3:
+        return np.arange(len(ticks))
+
+    fontsize = fontsize or plt.rcParams[f"{axis}tick.labelsize"]
+    lower, upper = getattr(ax, f"get_{axis}lim")()
+    length = ax.bbox.width if axis == "x" else ax.bbox.height
+    pixels = (ticks - lower) * length / ((upper - lower) or 1.0)
+    # Labels are side by side along x and stacked along y
+    extents = np.array(
+        [
+            text_extent(label, fontsize, dpi=ax.figure.dpi)[axis == "y"]
+            for label in labels
+        ]
+    )
+    space = text_extent(" ", fontsize, dpi=ax.figure.dpi)[0]
+
+    clear = np.ones(len(ticks), dtype=bool)
+    for end in (0, -1):
+        clear &= np.abs(pixels - pixels[end]) >= (
+            (extents + extents[end]) / 2 + space
+        )
+    clear[[0, -1]] = True
+
+    return np.flatnonzero(clear)
+
+
+def set_axis_frame(
+    ax: Axes,
+    axis: str,
+    stats: FrameStats,
+    pad: float = 0.05,
+    fontsize: int = None,
+    is_bar: bool = False,
+    limits: bool = True,
+) -> Axes:
+    """Restrict an axis spine to the data range and place ticks at its ends.
+
+    Args:
+        ax (Axes): Matplotlib axes.
+        axis (str): Either "x" or "y".
+        stats (FrameStats): Summary of the values along the axis.
+        pad (float, optional): Axes limits padding. Defaults to 0.05.
+        fontsize (int, optional): Tick label font size. Defaults to None.
+        is_bar (bool, optional): Anchor the frame at zero. Defaults to False.
+        limits (bool, optional): Set the axes limits. Defaults to True.
+
+    Returns:
+        Axes: Figure container
+    """
+    if stats.count == 0:
+        return ax
+
+    vmin, vmax = stats.min, stats.max
+    if is_bar:
+        vmin = min(vmin, 0)
+
+    # A single value gets a unit frame, as matplotlib cannot map empty limits
+    margin = ((vmax - vmin) or 1.0) * pad
+    spine = {"x": "bottom", "y": "left"}[axis]
+    if limits:
+        getattr(ax, f"set_{axis}lim")(vmin - (0 if is_bar else margin), vmax + margin)
+    ax.spines[spine].set_bounds(vmin, vmax)
+
+    axis_obj = getattr(ax, f"{axis}axis")
+    locator = axis_obj.get_major_locator()
+    if isinstance(locator, FixedLocator):
+        # Ticks of a previous frame
+        locator = AutoLocator()
+        locator.set_axis(axis_obj)
+    ticks = frame_ticks(locator(), vmin, vmax, stats.is_int)
+    labels = format_ticks(ticks, stats.is_int)
+    keep = fit_tick_labels(ax, axis, ticks, labels, fontsize)
+    getattr(ax, f"set_{axis}ticks")(ticks[keep])
+    getattr(ax, f"set_{axis}ticklabels")(
+        [labels[index] for index in keep], fontsize=fontsize
+    )
+
+    return ax
+
+
+class FigurePool:
+    """Reuses figures and axes across plots instead of building new ones
+
+    Figures are keyed by figsize and dpi. A released figure has its plot
+    artists, labels, limits and tick locators reset, while the figure, its
+    fonts and the styling shared by every plot are kept.
+
+    Args:
+        maxsize (int, optional): Maximum number of idle figures per key.
+            Defaults to 8.
+        pyplot (bool, optional): Register the figures with pyplot. Defaults to
+            True.
+
+    Example:
+        >>> pool = FigurePool()
+        >>> fig, ax = pool.acquire((4, 3))
+        >>> pool.release(fig)
+        >>> pool.acquire((4, 3))[0] is fig
+        True
+    """
+
+    def __init__(self, maxsize: int = 8, pyplot: bool = True):
+        self.maxsize = maxsize
+        self.pyplot = pyplot
+        self._idle = defaultdict(list)
+        # Keyed by figure, as ids of figures acquired and never released would
+        # be reused by new objects
+        self._owned = weakref.WeakKeyDictionary()
+
+    def acquire(self, figsize: tuple, dpi: float = None) -> tuple:
+        """Get an idle figure or create one
+
+        Args:
+            figsize (tuple): Size of canvas.
+            dpi (float, optional): Figure resolution. Defaults to None.
+
+        Returns:
+            tuple: Figure and axes.
+        """
+        key = (tuple(figsize), dpi)
+        if self._idle[key]:
+            return self._idle[key].pop()
+
+        if self.pyplot:
+            with style():
+                fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+        else:
+            fig, ax = new_figure(figsize, dpi)
+        spines = {
+            name: (spine.get_visible(), spine.get_linewidth(), spine.get_edgecolor())
+            for name, spine in ax.spines.items()
+        }
+        ticks = {
+            name: axis.get_tick_params(which="major")
+            for name, axis in (("x", ax.xaxis), ("y", ax.yaxis))
+        }
+        self._owned[fig] = (key, spines, ticks)
+
+        return fig, ax
+
+    def release(self, fig: Figure):
+        """Reset a figure and return it to the pool
+
+        Figures that were not acquired from the pool, or that exceed maxsize,
+        are closed instead.
+
+        Args:
+            fig (Figure): Figure obtained from acquire.
+        """
+        if fig not in self._owned:
+            plt.close(fig)
+            return None
+
+        key, spines, ticks = self._owned[fig]
+        if len(self._idle[key]) >= self.maxsize:
+            del self._owned[fig]
+            plt.close(fig)
+            return None
+
+        ax = fig.axes[0]
+        self.reset(ax, spines, ticks)
+        self._idle[key].append((fig, ax))
+
+        return None
+
+    @staticmethod
+    def reset(ax: Axes, spines: dict, ticks: dict = None):
+        """Return the axes to the state they were acquired in
+
+        Plot artists, figure texts and legends are removed, and the spines and
+        ticks are restored, so that a plot on a pooled figure renders the same
+        as on a new one.
+
+        Args:
+            ax (Axes): Axes to be reset.
+            spines (dict): Visibility, linewidth and edge colour of each spine.
+            ticks (dict, optional): Major tick parameters of the x and y axes,
+                from Axis.get_tick_params. Defaults to None (unchanged).
+        """
+        for artist in [
+            *ax.lines,
+            *ax.collections,
+            *ax.patches,
+            *ax.texts,
+            *ax.images,
+            *ax.artists,
+            *ax.tables,
+        ]:
+            artist.remove()
+        ax.containers.clear()
+        if ax.legend_ is not None:
+            ax.legend_.remove()
+        # Figure labels of facets
+        for artist in [*ax.figure.texts, *ax.figure.legends]:
+            artist.remove()
+
+        ax.set_axis_on()
+        for axis in (ax.xaxis, ax.yaxis):
+            axis.set_major_locator(AutoLocator())
+            axis.set_major_formatter(ScalarFormatter())
+            axis.set_visible(True)
+        ax.tick_params(axis="both", labelrotation=0)
+        for name, params in (ticks or {}).items():
+            ax.tick_params(axis=name, which="major", reset=True, **params)
+
+        for name, (visible, linewidth, edgecolor) in spines.items():
+            ax.spines[name].set_bounds(None, None)
+            ax.spines[name].set_visible(visible)
+            ax.spines[name].set_linewidth(linewidth)
+            ax.spines[name].set_edgecolor(edgecolor)
+
+        ax.set(title="", xlabel="", ylabel="")
+        ax.dataLim.set(Bbox.null())
+        ax.ignore_existing_data_limits = True
+        ax.set_autoscale_on(True)
 
 
 @dataclass
@@ -31,6 +542,20 @@ class Canvas(ABC):
         xlabel (str): Name of x axis.
         ylabel (str): Name of y axis.
         ax (Axes, optional): Matplotlib axes. Defaults to None.
+        dpi (float, optional): Figure resolution. Defaults to None.
+        pool (FigurePool, optional): Pool the figure is taken from. Defaults to None.
+        rasterize_above (int, optional): Number of points above which a data
+            layer is rasterized, at the savefig dpi, in vector output. Spines,
+            ticks and text stay vector. None disables it. Defaults to
+            RASTERIZE_ABOVE.
+        pyplot (bool, optional): Register a new figure with pyplot, so that
+            plt.show can display it. Unregistered figures are freed once no
+            longer referenced, without plt.close. Defaults to True.
+
+    Example:
+        >>> with Line(xlabel="x", ylabel="y") as line:
+        ...     line.plot(x, y)
+        ...     images = tufte.export(line.ax, ["png", "svg"])
     """
 
     xlabel: str
@@ -38,10 +563,54 @@ class Canvas(ABC):
     ax: Axes = None
     fontsize: int = 18
     figsize: tuple = (20, 10)
+    dpi: float = field(default=None, repr=False)
+    pool: FigurePool = field(default=None, repr=False)
+    rasterize_above: int = field(default=RASTERIZE_ABOVE, repr=False)
+    pyplot: bool = field(default=True, repr=False)
 
     def __post_init__(self):
-        if self.ax is None:
-            self.fig, self.ax = plt.subplots(figsize=self.figsize)
+        # Figures passed in through ax belong to the caller
+        self.owns_figure = self.ax is None
+        with stage("canvas", self.__class__.__name__.lower()):
+            if self.ax is None and self.pool is not None:
+                self.fig, self.ax = self.pool.acquire(self.figsize, self.dpi)
+
+            elif self.ax is None and not self.pyplot:
+                self.fig, self.ax = new_figure(self.figsize, self.dpi)
+
+            elif self.ax is None:
+                with style():
+                    self.fig, self.ax = plt.subplots(
+                        figsize=self.figsize, dpi=self.dpi
+                    )
+
+            else:
+                self.fig = self.ax.figure
+
+        self.frames = {}
+
+    def __enter__(self) -> "Canvas":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self):
+        """Free the figure, returning it to its pool if it was taken from one
+
+        Figures passed in through ax are left to the caller.
+        """
+        if not self.owns_figure:
+            return None
+
+        if self.pool is not None:
+            self.pool.release(self.fig)
+        else:
+            plt.close(self.fig)
+        self.owns_figure = False
+
+        return None
 
     def set_spines(self):
         """Set figure spines"""
@@ -56,12 +625,61 @@ class Canvas(ABC):
         )
 
         self.ax.xaxis.label.set_color("#4B4B4B")
+        self.ax.xaxis.set_ticks_position("bottom")
+
         self.ax.spines["top"].set_visible(False)
         self.ax.spines["right"].set_visible(False)
-        self.ax.xaxis.set_ticks_position("bottom")
 
         return None
 
+    @timed("range_frame")
+    def set_range_frame(
+        self,
+        x=None,
+        y=None,
+        pad: float = 0.05,
+        ticklabelsize: int = None,
+        is_bar: bool = False,
+    ):
+        """Set range frame on the axes that have numeric values
+
+        Args:
+            x (optional): x values or their FrameStats. Defaults to None.
+            y (optional): y values or their FrameStats. Defaults to None.
+            pad (float, optional): Axes limits padding. Defaults to 0.05.
+            ticklabelsize (int, optional): Tick label font size. Defaults to None.
+            is_bar (bool, optional): Anchor the y frame at zero. Defaults to False.
+        """
+        for axis, values in (("x", x), ("y", y)):
+            if values is None:
+                continue
+
+            try:
+                stats = (
+                    values if isinstance(values, FrameStats) else frame_stats(values)
+                )
+
+            except TypeError:
+                # Categorical axes have no range frame
+                continue
+
+            self.frames[axis] = stats
+            set_axis_frame(
+                self.ax,
+                axis,
+                stats,
+                pad=pad,
+                fontsize=ticklabelsize,
+                is_bar=is_bar and axis == "y",
+            )
+
+        return None
+
+    @timed("savefig")
+    def savefig(self, *args, **kwargs):
+        """Save the figure, see Figure.savefig"""
+        return self.fig.savefig(*args, **kwargs)
+
     def set_axes_labels(self):
         self.ax.set(xlabel=f"{self.xlabel}", ylabel=f"{self.ylabel}")
 
@@ -72,14 +690,18 @@ class Canvas(ABC):
             x (Iterable[int  |  float]): x axes.
             y (Iterable[int  |  float]): y axes.
             pad (float, optional): Axes bounds padding. Defaults to 0.05.
+            ticklabelsize (int, optional): Tick label font size.
+            is_bar (bool, optional): Anchor the y frame at zero.
 
         Returns:
             Axes: Figure container
         """
-        self.set_spines()
-        getattr(
-            self, f"set_{self.__class__.__name__.lower()}_spines"
-        )  # Set specific spines
+        with stage("spines"):
+            self.set_spines()
+            getattr(
+                self, f"set_{self.__class__.__name__.lower()}_spines"
+            )()  # Set specific spines
+        self.set_range_frame(**kwargs)
         self.set_axes_labels()
 
         return self.ax
@@ -107,16 +729,123 @@ class Plot(Canvas):
     def fit(
         array: Union[str, Generator, Iterable],
         data: pd.DataFrame = None,
+        dtype: str = None,
     ) -> np.ndarray:
+        """Select the values to be plotted
 
-        try:
-            array = data[array]
+        Only the requested columns of data are read, and Arrow, Polars and
+        buffer-protocol values are viewed instead of copied. Chunked sources
+        (memory-mapped arrays, .npy, .csv or .parquet paths, chunked readers
+        and generators) are not loaded, but wrapped in Chunks that are read in
+        one streaming pass by the plot.
 
-        except TypeError:
-            array = np.array(array)
+        Args:
+            array (Union[str, Generator, Iterable]): Values or column name.
+            data (pd.DataFrame, optional): DataFrame, Arrow Table, Polars
+                DataFrame or chunked source containing the column. Defaults to
+                None.
+            dtype (str, optional): Type of numeric values, e.g. "float32".
+                Defaults to None (unchanged).
+
+        Returns:
+            np.ndarray: Values, or Chunks of a chunked source.
+        """
+        from tufte.stream import Chunks, is_chunked
+
+        if data is not None and is_chunked(data):
+            return Chunks(data, array)
+
+        if data is None and is_chunked(array):
+            return array if isinstance(array, Chunks) else Chunks(array)
+
+        with stage("fit") as event:
+            try:
+                array = select(data, array)
+
+            except TypeError:
+                pass
+
+            array = as_array(array, dtype)
+            event.n = getattr(array, "size", None)
 
         return array
 
+    @timed("stream")
+    def stream(self, x, y, method: Union[str, int]) -> tuple:
+        """Read chunked x and y once, keeping only what the axes can show
+
+        Args:
+            x: x values or Chunks.
+            y: y values or Chunks.
+            method (Union[str, int]): "lttb", "minmax", "pixel" or a LTTB target
+                number of points.
+
+        Returns:
+            tuple: Reduced x and y, and the FrameStats of all x and y values.
+        """
+        from tufte.stream import iter_columns, reduce_chunks
+
+        width, height = self.get_pixel_size()
+
+        return reduce_chunks(iter_columns(x, y), method, width, height)
+
+    def rasterize_dense(self, artist: Artist, n: int) -> Artist:
+        """Rasterize a data layer drawing more than rasterize_above points
+
+        Args:
+            artist (Artist): Data layer.
+            n (int): Number of points drawn by the artist.
+
+        Returns:
+            Artist: The artist.
+        """
+        if self.rasterize_above is not None and n > self.rasterize_above:
+            artist.set_rasterized(True)
+
+        return artist
+
+    def get_pixel_size(self) -> tuple:
+        """Size of the axes in display pixels
+
+        Returns:
+            tuple: Width and height in pixels.
+        """
+        return self.ax.bbox.width, self.ax.bbox.height
+
+    def reduce(
+        self,
+        x: Iterable,
+        y: Iterable,
+        method: Union[str, int] = None,
+    ) -> tuple:
+        """Reduce the data to what the axes pixels can show
+
+        Args:
+            x (Iterable): x values.
+            y (Iterable): y values.
+            method (Union[str, int], optional): "lttb", "minmax", "pixel" or a LTTB
+                target number of points. Defaults to None (no reduction).
+
+        Returns:
+            tuple: Reduced x and y.
+        """
+        if method is None:
+            return x, y
+
+        with stage("downsample", n=np.size(x)):
+            width, height = self.get_pixel_size()
+            if method == "pixel":
+                x = np.asarray(x).ravel()
+                y = np.asarray(y).ravel()
+                indices = pixel(
+                    x, y, self.ax.get_xlim(), self.ax.get_ylim(), width, height
+                )
+                return x[indices], y[indices]
+
+            n_out = int(width) * (2 if method == "minmax" else 1)
+
+            return downsample(x, y, method, n_out)
+
     @abstractmethod
     def set_plot_title(self, title: str = None):
         self.ax.set(title=title)
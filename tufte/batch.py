@@ -0,0 +1,298 @@
+import os
+from collections.abc import Generator, Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+KINDS = {
+    "line": "lineplot",
+    "scatter": "scatterplot",
+    "bar": "barplot",
+    "box": "boxplot",
+    "density": "densityplot",
+}
+COLUMN_ARGS = ("x", "y", "array", "by")
+# Pending charts per worker: enough to keep every worker busy
+WINDOW = 2
+
+
+@dataclass
+class RenderResult:
+    """Outcome of rendering one chart spec.
+
+    Args:
+        name (str): Name of the chart.
+        path (Path): Output file, None if rendering failed.
+        error (str): Error message, None if rendering succeeded.
+    """
+
+    name: str
+    path: Path = None
+    error: str = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class SharedColumn:
+    """Picklable handle of a column stored in shared memory."""
+
+    shm_name: str
+    dtype: str
+    length: int
+
+    def attach(self) -> tuple:
+        shm = shared_memory.SharedMemory(name=self.shm_name)
+        array = np.ndarray((self.length,), dtype=self.dtype, buffer=shm.buf)
+        return shm, array
+
+
+class SharedBlocks:
+    """Shared-memory copies of the DataFrame columns of pending charts.
+
+    A column is copied once while charts using it are pending, and its block
+    is closed and unlinked as soon as the last of them finishes, so that the
+    number of open blocks is bounded by the pending charts rather than by the
+    whole batch. The DataFrames are referenced while they have blocks, so that
+    their ids cannot be reused by new DataFrames.
+    """
+
+    def __init__(self):
+        # id(data) -> (data, {column name: SharedColumn})
+        self._columns = {}
+        # Block name -> [SharedMemory, number of pending charts, id(data), column]
+        self._blocks = {}
+
+    def share(self, data: pd.DataFrame, name: str) -> SharedColumn:
+        """Shared-memory handle of a column, copying it if it has no block
+
+        Every call must be matched by a release of the block name.
+        """
+        _, columns = self._columns.setdefault(id(data), (data, {}))
+        if name not in columns:
+            values = data[name].to_numpy()
+            shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+            columns[name] = SharedColumn(shm.name, values.dtype.str, len(values))
+            self._blocks[shm.name] = [shm, 0, id(data), name]
+
+        self._blocks[columns[name].shm_name][1] += 1
+
+        return columns[name]
+
+    def release(self, shm_names: Iterable[str]):
+        """Free the blocks that no pending chart uses anymore"""
+        for shm_name in shm_names:
+            block = self._blocks[shm_name]
+            block[1] -= 1
+            if block[1] > 0:
+                continue
+
+            shm, _, data_id, name = self._blocks.pop(shm_name)
+            shm.close()
+            shm.unlink()
+            columns = self._columns[data_id][1]
+            del columns[name]
+            if not columns:
+                del self._columns[data_id]
+
+    def close(self):
+        """Free every block"""
+        for shm, *_ in self._blocks.values():
+            shm.close()
+            shm.unlink()
+        self._blocks.clear()
+        self._columns.clear()
+
+
+def _pack(spec: dict, blocks: SharedBlocks) -> tuple:
+    """Replace the DataFrame of a spec by shared-memory handles of the columns it
+    uses
+
+    Returns:
+        tuple: Packed spec and names of the blocks it uses.
+    """
+    spec = dict(spec)
+    data = spec.pop("data", None)
+    if data is None:
+        return spec, []
+
+    columns, used = {}, []
+    try:
+        for arg in COLUMN_ARGS:
+            names = spec.get(arg)
+            for name in [names] if isinstance(names, str) else names or []:
+                if not isinstance(name, str) or name in columns:
+                    continue
+
+                column = data[name]
+                if column.dtype.kind not in "biufcmM":
+                    # Object columns cannot live in a raw buffer
+                    columns[name] = column.to_numpy()
+                    continue
+
+                columns[name] = blocks.share(data, name)
+                used.append(columns[name].shm_name)
+
+    except BaseException:
+        blocks.release(used)
+        raise
+
+    spec["data"] = columns
+
+    return spec, used
+
+
+def _init_worker():
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render(spec: dict, out_dir: str, cache: str = None) -> str:
+    import matplotlib.pyplot as plt
+
+    import tufte
+    from tufte.cache import RenderCache
+    from tufte.instrument import stage
+
+    spec = dict(spec)
+    name = spec.pop("name")
+    kind = spec.pop("kind")
+    fmt = spec.pop("format", "png")
+    dpi = spec.pop("dpi", None)
+
+    handles = []
+    columns = spec.pop("data", None)
+    if columns is not None:
+        data = {}
+        for column, value in columns.items():
+            if isinstance(value, SharedColumn):
+                shm, value = value.attach()
+                handles.append(shm)
+            data[column] = value
+        spec["data"] = pd.DataFrame(data, copy=False)
+
+    try:
+        path = Path(out_dir) / f"{name}.{fmt}"
+        if cache is not None:
+            path.write_bytes(RenderCache(cache).render(kind, fmt, dpi, **spec))
+
+        else:
+            ax = getattr(tufte, KINDS[kind])(**spec)
+            with stage("savefig", kind):
+                ax.figure.savefig(path, format=fmt, dpi=dpi)
+            plt.close(ax.figure)
+
+    finally:
+        spec.pop("data", None)
+        for shm in handles:
+            try:
+                shm.close()
+
+            except BufferError:
+                # Artists still hold views, the mapping is released with them
+                pass
+
+    return str(path)
+
+
+def render_many(
+    specs: Iterable[dict],
+    out_dir: str,
+    workers: int = None,
+    cache: str = None,
+    window: int = WINDOW,
+) -> Generator[RenderResult, None, None]:
+    """Render many charts on a process pool.
+
+    Every spec is a dict with a "kind" (line, scatter, bar, box or density), an
+    optional "name", "format" (defaults to png) and "dpi", and the keyword
+    arguments of the corresponding plot function. Columns of a "data" DataFrame
+    that are referenced by the spec are placed once in shared memory instead of
+    being pickled for every chart.
+
+    At most window charts per worker are pending at once, and specs are read
+    lazily, so that a batch of any length keeps a bounded number of shared
+    memory blocks and file descriptors open.
+
+    Args:
+        specs (Iterable[dict]): Chart specs.
+        out_dir (str): Directory of the output files.
+        workers (int, optional): Number of processes. Defaults to os.cpu_count().
+        cache (str, optional): Directory of a RenderCache shared by the workers.
+            Defaults to None (no cache).
+        window (int, optional): Pending charts per worker. Defaults to WINDOW.
+
+    Yields:
+        RenderResult: Outcome of each chart, in order of completion.
+
+    Example:
+        >>> specs = [{"kind": "line", "name": "a", "x": [0, 1], "y": [1, 2]}]
+        >>> [result.ok for result in render_many(specs, "/tmp", workers=1)]
+        [True]
+    """
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count()
+    blocks = SharedBlocks()
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker
+        ) as executor:
+            # Future -> (chart name, shared blocks it uses)
+            pending = {}
+
+            def finish(future) -> RenderResult:
+                name, used = pending.pop(future)
+                blocks.release(used)
+                try:
+                    return RenderResult(name, path=Path(future.result()))
+
+                except Exception as error:
+                    return RenderResult(name, error=f"{type(error).__name__}: {error}")
+
+            for i, spec in enumerate(specs):
+                name = str(spec.get("name", i))
+                if spec.get("kind") not in KINDS:
+                    yield RenderResult(name, error=f"Unknown kind {spec.get('kind')}")
+                    continue
+
+                # Specs are packed only when a worker is about to be free, so
+                # that the open blocks stay bounded
+                while len(pending) >= window * workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield finish(future)
+
+                try:
+                    packed, used = _pack({**spec, "name": name}, blocks)
+
+                except Exception as error:
+                    yield RenderResult(name, error=f"{type(error).__name__}: {error}")
+                    continue
+
+                try:
+                    future = executor.submit(_render, packed, str(out_dir), cache)
+
+                except BaseException:
+                    blocks.release(used)
+                    raise
+                pending[future] = (name, used)
+
+            for future in as_completed(list(pending)):
+                yield finish(future)
+
+    finally:
+        blocks.close()
@@ -1,28 +1,51 @@
-import sys
 import warnings
-from pathlib import Path
 from typing import Iterable, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.ticker import FixedLocator, FuncFormatter
 
-PROJECT_ROOT = Path.cwd().resolve().parent
-sys.path.append(str(PROJECT_ROOT))
-
-from tufte.base import Plot
+from tufte.base import RASTERIZE_ABOVE, FigurePool, Plot, as_values, frame_stats
+from tufte.instrument import timed
+from tufte.sketch import QuantileSketch
+from tufte.stream import Chunks
 
 
 class Box(Plot):
+    MAX_XTICKS = 50
+
+    @timed("plot")
     def plot(
         self,
-        array: Union[str, Iterable],
+        array: Union[str, Iterable, QuantileSketch],
+        data: pd.DataFrame = None,
         ticklabelsize: int = 10,
+        method: str = "exact",
+        by: Union[str, Iterable] = None,
+        dtype: str = None,
         **kwargs,
     ):
-        array = self.fit(array)
-        summary_stats = self.get_summary_statistics(array)
+        if not isinstance(array, (QuantileSketch, pd.DataFrame)):
+            array = self.fit(array, data, dtype)
+
+        if isinstance(array, Chunks):
+            if by is not None:
+                raise ValueError(
+                    "Grouped box plots of chunked sources are not supported"
+                )
+
+            # Out-of-core input is summarised in one pass with bounded memory
+            array = QuantileSketch.from_chunks(array)
+
+        if by is not None or (np.ndim(array) == 2 and np.shape(array)[1] > 1):
+            return self.plot_groups(
+                array, by=by, data=data, ticklabelsize=ticklabelsize
+            )
+
+        summary_stats = self.get_summary_statistics(array, method=method)
         self.ax.plot(
             [0, 0],
             [summary_stats["lower_bound"], summary_stats["25%"]],
@@ -37,38 +60,220 @@ class Box(Plot):
         )
         self.ax.scatter([0], [summary_stats["50%"]], color="black", s=5)
         self.ax.axes.get_xaxis().set_visible(False)
-        self.get_canvas({"array": array, "pad": 0.05})
 
-        # Plot "outliers"
+        if isinstance(array, QuantileSketch):
+            # A sketch keeps no individual samples, hence no "outliers"
+            self.get_canvas(
+                {"y": array.stats, "pad": 0.05, "ticklabelsize": ticklabelsize}
+            )
+            self.set_box_spines()
+
+            return self.ax
+
+        self.get_canvas({"y": array, "pad": 0.05, "ticklabelsize": ticklabelsize})
 
-        mask = (array > summary_stats["upper_bound"]).all(axis=1) | (
-            array < summary_stats["lower_bound"]
-        ).all(axis=1)
-        self.ax.scatter(
-            [0] * len(array[mask, :]),
-            array[mask, :],
+        # Plot "outliers"
+        values = as_values(array)
+        mask = (values > summary_stats["upper_bound"]) | (
+            values < summary_stats["lower_bound"]
+        )
+        outliers = self.ax.scatter(
+            np.zeros(np.count_nonzero(mask)),
+            values[mask],
             color="grey",
             s=5,
             marker="o",
         )
+        self.rasterize_dense(outliers, np.count_nonzero(mask))
+
+        self.set_box_spines()
+
+        return self.ax
+
+    def plot_groups(
+        self,
+        array: Union[pd.DataFrame, Iterable],
+        by: Union[str, Iterable] = None,
+        data: pd.DataFrame = None,
+        ticklabelsize: int = 10,
+    ):
+        """Draws one box per group with a fixed number of artists.
+
+        Args:
+            array (Union[pd.DataFrame, Iterable]): Values, or a DataFrame with one
+                column per group.
+            by (Union[str, Iterable], optional): Group of each value. Defaults to
+                None.
+            data (pd.DataFrame, optional): DataFrame containing by. Defaults to None.
+            ticklabelsize (int, optional): Tick label font size. Defaults to 10.
+
+        Returns:
+            Axes: Figure container
+        """
+        values, codes, labels = self.get_groups(array, by, data)
+        summary_stats = self.get_grouped_summary_statistics(values, codes, len(labels))
+        positions = np.arange(len(labels), dtype=np.float64)
+
+        lower = np.stack([positions, summary_stats["lower_bound"]], axis=-1)
+        q25 = np.stack([positions, summary_stats["25%"]], axis=-1)
+        q75 = np.stack([positions, summary_stats["75%"]], axis=-1)
+        upper = np.stack([positions, summary_stats["upper_bound"]], axis=-1)
+        whiskers = np.concatenate(
+            (np.stack([lower, q25], axis=1), np.stack([q75, upper], axis=1))
+        )
+        self.ax.add_collection(
+            LineCollection(whiskers, colors="black", linewidths=0.5),
+            autolim=False,
+        )
+        self.ax.scatter(positions, summary_stats["50%"], color="black", s=5)
+
+        mask = (values > summary_stats["upper_bound"][codes]) | (
+            values < summary_stats["lower_bound"][codes]
+        )
+        outliers = self.ax.scatter(
+            codes[mask], values[mask], color="grey", s=5, marker="o"
+        )
+        self.rasterize_dense(outliers, np.count_nonzero(mask))
 
+        self.get_canvas(
+            {"y": frame_stats(values), "pad": 0.05, "ticklabelsize": ticklabelsize}
+        )
+        self.ax.set_xlim(-0.5, len(labels) - 0.5)
+        self.ax.xaxis.set_major_locator(
+            FixedLocator(positions, nbins=min(len(labels), self.MAX_XTICKS))
+        )
+        self.ax.xaxis.set_major_formatter(
+            FuncFormatter(lambda v, pos: str(labels[int(round(v))]))
+        )
         self.set_box_spines()
 
         return self.ax
 
+    @staticmethod
+    def get_groups(
+        array: Union[pd.DataFrame, Iterable],
+        by: Union[str, Iterable] = None,
+        data: pd.DataFrame = None,
+    ) -> tuple:
+        """Flattens grouped values into values, integer group codes and labels.
+
+        Args:
+            array (Union[pd.DataFrame, Iterable]): Values, or a DataFrame with one
+                column per group.
+            by (Union[str, Iterable], optional): Group of each value. Defaults to
+                None.
+            data (pd.DataFrame, optional): DataFrame containing by. Defaults to None.
+
+        Returns:
+            tuple: Finite values, their group codes and the group labels.
+        """
+        if by is None:
+            frame = pd.DataFrame(array)
+            values = as_values(frame.to_numpy().T)
+            codes = np.repeat(np.arange(frame.shape[1]), frame.shape[0])
+            labels = np.asarray(frame.columns)
+
+        else:
+            values = as_values(array)
+            groups = Plot.fit(by, data)
+            codes, labels = pd.factorize(np.asarray(groups).ravel(), sort=True)
+            labels = np.asarray(labels)
+
+        mask = np.isfinite(values) & (codes >= 0)
+        if not mask.all():
+            values, codes = values[mask], codes[mask]
+
+        return values, codes, labels
+
+    @staticmethod
+    def get_grouped_summary_statistics(
+        values: np.ndarray,
+        codes: np.ndarray,
+        n_groups: int,
+    ) -> dict:
+        """Calculates the quartiles of every group after a single sort.
+
+        Quantiles are linearly interpolated as in np.percentile.
+
+        Args:
+            values (np.ndarray): Finite values.
+            codes (np.ndarray): Group code of each value.
+            n_groups (int): Number of groups.
+
+        Returns:
+            dict: Arrays of summary statistics indexed by group code.
+        """
+        order = np.lexsort((values, codes))
+        values = values[order]
+        counts = np.bincount(codes, minlength=n_groups)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        summary_stats = {}
+        for q, key in zip([0, 0.25, 0.5, 0.75, 1], ["min", "25%", "50%", "75%", "max"]):
+            position = starts + q * np.maximum(counts - 1, 0)
+            below = np.floor(position).astype(np.int64)
+            above = np.ceil(position).astype(np.int64)
+            with np.errstate(invalid="ignore"):
+                quantile = values[np.minimum(below, len(values) - 1)] + (
+                    position - below
+                ) * (
+                    values[np.minimum(above, len(values) - 1)]
+                    - values[np.minimum(below, len(values) - 1)]
+                )
+            summary_stats[key] = np.where(counts > 0, quantile, np.nan)
+
+        summary_stats["iqr"] = summary_stats["75%"] - summary_stats["25%"]
+        summary_stats["lower_bound"] = summary_stats["25%"] - 1.5 * summary_stats["iqr"]
+        summary_stats["upper_bound"] = summary_stats["75%"] + 1.5 * summary_stats["iqr"]
+
+        return summary_stats
+
     def set_box_spines(self):
         self.ax.spines["left"].set_visible(False)
         self.ax.spines["bottom"].set_visible(False)
         self.ax.tick_params(axis="y", left="on")
 
-    def get_summary_statistics(self, array: Iterable[Union[int, float]]):
-        summary_stats = {"min": np.min(array)}
-        summary_stats["25%"] = np.percentile(array, 25)
-        summary_stats["50%"] = np.median(array)
-        summary_stats["75%"] = np.percentile(array, 75)
-        summary_stats["max"] = np.max(array)
-        summary_stats["mean"] = np.mean(array)
-        summary_stats["std"] = np.std(array)
+    def get_summary_statistics(
+        self,
+        array: Union[Iterable[Union[int, float]], QuantileSketch],
+        method: str = "exact",
+    ):
+        """Calculates the quantiles, mean and standard deviation of the values.
+
+        Args:
+            array (Union[Iterable[Union[int, float]], QuantileSketch]): Values or
+                a sketch of them.
+            method (str, optional): "exact" computes all quantiles with a single
+                partition. "sketch" uses a QuantileSketch. Defaults to "exact".
+
+        Raises:
+            ValueError: If the method is unknown.
+
+        Returns:
+            dict: Summary statistics.
+        """
+        if method not in ("exact", "sketch"):
+            raise ValueError(f"Expected method to be exact or sketch. Got {method}")
+
+        if method == "sketch" and not isinstance(array, QuantileSketch):
+            array = QuantileSketch().update(array)
+
+        if isinstance(array, QuantileSketch):
+            quantiles = array.quantile([0, 0.25, 0.5, 0.75, 1])
+            mean, std = array.mean, array.std
+
+        else:
+            values = as_values(array)
+            finite = np.isfinite(values)
+            if not finite.all():
+                values = values[finite]
+            quantiles = np.percentile(values, [0, 25, 50, 75, 100])
+            mean = values.mean()
+            std = np.sqrt(np.square(values - mean).mean())
+
+        summary_stats = dict(zip(["min", "25%", "50%", "75%", "max"], quantiles))
+        summary_stats["mean"] = mean
+        summary_stats["std"] = std
         summary_stats["iqr"] = summary_stats["75%"] - summary_stats["25%"]
         summary_stats["lower_bound"] = summary_stats["25%"] - 1.5 * summary_stats["iqr"]
         summary_stats["upper_bound"] = summary_stats["75%"] + 1.5 * summary_stats["iqr"]
@@ -106,7 +311,7 @@ class Box(Plot):
 
 
 def main(
-    array: Union[str, Iterable],
+    array: Union[str, Iterable, QuantileSketch],
     data: pd.DataFrame = None,
     xlabel: str = "x",
     ylabel: str = "y",
@@ -117,9 +322,16 @@ def main(
     alpha: float = 0.9,
     ticklabelsize: int = 10,
     markersize: int = 10,
+    method: str = "exact",
+    by: Union[str, Iterable] = None,
+    dtype: str = None,
     figsize: tuple = (20, 10),
     fontsize: int = 12,
     ax: Axes = None,
+    dpi: float = None,
+    pool: FigurePool = None,
+    rasterize_above: int = RASTERIZE_ABOVE,
+    pyplot: bool = True,
     **kwargs,
 ):
     box = Box(
@@ -128,6 +340,10 @@ def main(
         figsize=figsize,
         fontsize=fontsize,
         ax=ax,
+        dpi=dpi,
+        pool=pool,
+        rasterize_above=rasterize_above,
+        pyplot=pyplot,
     )
     box.set_plot_title(title)
 
@@ -140,5 +356,8 @@ def main(
         alpha=alpha,
         ticklabelsize=ticklabelsize,
         markersize=markersize,
+        method=method,
+        by=by,
+        dtype=dtype,
         **kwargs,
     )
@@ -0,0 +1,345 @@
+import hashlib
+import io
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from tufte.batch import COLUMN_ARGS, KINDS
+from tufte.instrument import stage
+from tufte.stream import SUFFIXES
+
+TEMP_PREFIX = ".tmp-"
+# rcParams that do not change rendered output
+RC_IGNORED = (
+    "animation.",
+    "backend",
+    "figure.raise_window",
+    "interactive",
+    "keymap.",
+    "macosx.",
+    "savefig.directory",
+    "tk.",
+    "toolbar",
+    "webagg.",
+)
+# Puts between two scans of the directory, which pick up the writes of other
+# processes and expired entries
+SCAN_EVERY = 1024
+# Eviction frees space down to this fraction of max_bytes, so that a full cache
+# is not scanned again at the next put
+LOW_WATER = 0.9
+
+
+def rc_digest() -> str:
+    """Hash of the matplotlib version and the rcParams that affect rendering"""
+    import matplotlib
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(matplotlib.__version__.encode())
+    for name, value in sorted(matplotlib.rcParams.items()):
+        if not name.startswith(RC_IGNORED):
+            digest.update(repr((name, value)).encode())
+
+    return digest.hexdigest()
+
+
+def _update(digest, value):
+    """Feed a plot argument into a hash, using the raw buffer of arrays"""
+    if isinstance(value, pd.DataFrame | pd.Series | pd.Index):
+        names = value.columns if isinstance(value, pd.DataFrame) else [value.name]
+        digest.update(repr(list(names)).encode())
+        columns = [value[name] for name in names] if value.ndim == 2 else [value]
+        for column in columns:
+            _update(digest, column.to_numpy())
+        return
+
+    if isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            digest.update(repr(key).encode())
+            _update(digest, value[key])
+        return
+
+    if isinstance(value, str) and Path(value).suffix.lower() in SUFFIXES:
+        # Files are keyed by path, size and modification time
+        stat = os.stat(value)
+        digest.update(repr((value, stat.st_size, stat.st_mtime_ns)).encode())
+        return
+
+    if isinstance(value, np.ndarray | list | tuple | range) and not (
+        isinstance(value, tuple) and all(np.ndim(item) == 0 for item in value)
+    ):
+        array = np.asarray(value)
+        if array.dtype.kind == "O":
+            array = pd.util.hash_array(array.ravel())
+        digest.update(repr((array.dtype.str, array.shape)).encode())
+        digest.update(memoryview(np.ascontiguousarray(array)).cast("B"))
+        return
+
+    if isinstance(value, np.generic):
+        # NumPy scalars are keyed as the Python values they stand for
+        digest.update(repr(value.item()).encode())
+        return
+
+    if value is None or isinstance(value, str | bytes | int | float | bool | tuple):
+        digest.update(repr(value).encode())
+        return
+
+    raise TypeError(f"Arguments of type {type(value).__name__} cannot be cached")
+
+
+def render_key(kind: str, fmt: str = "png", dpi: float = None, **kwargs) -> str:
+    """Content hash of a chart
+
+    Arrays and the DataFrame columns referenced by the chart are hashed by
+    their raw buffers, together with the other arguments, the tufte and
+    matplotlib versions and the rcParams that affect rendering.
+
+    Args:
+        kind (str): Either line, scatter, bar, box or density.
+        fmt (str, optional): Output format. Defaults to "png".
+        dpi (float, optional): Output resolution. Defaults to None.
+        **kwargs: Arguments of the plot function.
+
+    Raises:
+        TypeError: If an argument cannot be hashed, e.g. an iterator.
+
+    Returns:
+        str: Hexadecimal key.
+    """
+    from tufte import __version__
+
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr((__version__, rc_digest(), kind, fmt, dpi)).encode())
+
+    data = kwargs.pop("data", None)
+    if isinstance(data, pd.DataFrame):
+        names = set()
+        for arg in COLUMN_ARGS:
+            value = kwargs.get(arg)
+            for name in [value] if isinstance(value, str) else value or []:
+                if isinstance(name, str) and name in data.columns:
+                    names.add(name)
+        # Only the columns used by the chart are part of the key
+        data = data[sorted(names)] if names else data
+    kwargs["data"] = data
+
+    for name in sorted(kwargs):
+        digest.update(name.encode())
+        _update(digest, kwargs[name])
+
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """On-disk cache of rendered charts, keyed by the hash of their inputs.
+
+    Entries are written to a temporary file and atomically renamed, so that
+    several processes can share the directory. Reads refresh the modification
+    time of an entry, which is what eviction uses to drop the least recently
+    used entries first.
+
+    Writes keep a running estimate of the cache size. The directory is only
+    scanned when the estimate exceeds max_bytes, down to LOW_WATER of it, or
+    every scan_every writes, which accounts for other processes and expired
+    entries.
+
+    Args:
+        directory (str): Cache directory.
+        max_bytes (int, optional): Total size of the entries. Defaults to 1 GiB.
+        max_age (float, optional): Seconds after which an unused entry expires.
+            Defaults to None (no expiry).
+        scan_every (int, optional): Writes between two scans of the directory.
+            Defaults to SCAN_EVERY.
+
+    Example:
+        >>> cache = RenderCache("/tmp/tufte-cache")
+        >>> png = cache.render("line", x=[0, 1, 2], y=[1, 0, 2])
+        >>> png == cache.render("line", x=[0, 1, 2], y=[1, 0, 2])
+        True
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 2**30,
+        max_age: float = None,
+        scan_every: int = SCAN_EVERY,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.scan_every = scan_every
+        self.hits = 0
+        self.misses = 0
+        # Estimated size of the entries, None until the first scan
+        self.size = None
+        self._puts = 0
+
+    def path(self, key: str, fmt: str) -> Path:
+        return self.directory / key[:2] / f"{key}.{fmt}"
+
+    def get(self, key: str, fmt: str) -> bytes:
+        """Read an entry
+
+        Args:
+            key (str): Key of the chart.
+            fmt (str): Output format.
+
+        Returns:
+            bytes: Rendered chart, None if it is not cached or has expired.
+        """
+        path = self.path(key, fmt)
+        try:
+            if self.max_age is not None and time.time() - path.stat().st_mtime > (
+                self.max_age
+            ):
+                return None
+            content = path.read_bytes()
+            os.utime(path)
+
+        except FileNotFoundError:
+            # Missing, or evicted by another process
+            return None
+
+        return content
+
+    def put(self, key: str, fmt: str, content: bytes):
+        """Write an entry atomically and evict old entries if the cache is full
+
+        Args:
+            key (str): Key of the chart.
+            fmt (str): Output format.
+            content (bytes): Rendered chart.
+        """
+        path = self.path(key, fmt)
+        path.parent.mkdir(exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=path.parent, prefix=TEMP_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(temp, path)
+
+        except BaseException:
+            Path(temp).unlink(missing_ok=True)
+            raise
+
+        self._puts += 1
+        if self.size is not None:
+            # Overwritten entries are counted twice until the next scan
+            self.size += len(content)
+        if (
+            self.size is None
+            or self.size > self.max_bytes
+            or self._puts >= self.scan_every
+        ):
+            self.evict()
+
+    def render(
+        self,
+        kind: str,
+        format: str = "png",
+        dpi: float = None,
+        **kwargs,
+    ) -> bytes:
+        """Render a chart, or read it from the cache
+
+        Args:
+            kind (str): Either line, scatter, bar, box or density.
+            format (str, optional): Output format. Defaults to "png".
+            dpi (float, optional): Output resolution. Defaults to None.
+            **kwargs: Arguments of the plot function.
+
+        Raises:
+            ValueError: If the kind is unknown or the chart targets given axes.
+
+        Returns:
+            bytes: Rendered chart.
+        """
+        if kind not in KINDS:
+            raise ValueError(f"Expected kind to be one of {tuple(KINDS)}. Got {kind}")
+
+        if kwargs.get("ax") is not None:
+            raise ValueError("Charts drawn on existing axes cannot be cached")
+
+        pool = kwargs.pop("pool", None)
+        try:
+            key = render_key(kind, format, dpi, **kwargs)
+
+        except TypeError:
+            key = None
+
+        content = None if key is None else self.get(key, format)
+        if content is not None:
+            self.hits += 1
+            return content
+
+        self.misses += 1
+        content = self._render(kind, format, dpi, pool, kwargs)
+        if key is not None:
+            self.put(key, format, content)
+
+        return content
+
+    @staticmethod
+    def _render(kind: str, fmt: str, dpi: float, pool, kwargs: dict) -> bytes:
+        import matplotlib.pyplot as plt
+
+        import tufte
+
+        ax = getattr(tufte, KINDS[kind])(pool=pool, **kwargs)
+        buffer = io.BytesIO()
+        with stage("savefig", kind):
+            ax.figure.savefig(buffer, format=fmt, dpi=dpi)
+        if pool is None:
+            plt.close(ax.figure)
+        else:
+            pool.release(ax.figure)
+
+        return buffer.getvalue()
+
+    def evict(self):
+        """Remove expired entries, then the least recently used ones until the
+        cache fits in LOW_WATER of max_bytes if it exceeds max_bytes"""
+        now = time.time()
+        entries, total = [], 0
+        for path in self.directory.glob("*/*"):
+            try:
+                stat = path.stat()
+
+            except FileNotFoundError:
+                continue
+
+            age = now - stat.st_mtime
+            if path.name.startswith(TEMP_PREFIX):
+                # Left behind by a writer that died before renaming
+                if age > 3600:
+                    path.unlink(missing_ok=True)
+                continue
+
+            if self.max_age is not None and age > self.max_age:
+                path.unlink(missing_ok=True)
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        target = self.max_bytes * LOW_WATER if total > self.max_bytes else total
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+        self.size = total
+        self._puts = 0
+
+    def clear(self):
+        """Remove every entry"""
+        for path in self.directory.glob("*/*"):
+            path.unlink(missing_ok=True)
+        self.size = 0
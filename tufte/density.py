@@ -0,0 +1,425 @@
+from collections.abc import Iterator
+from dataclasses import replace
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+
+from tufte.base import RASTERIZE_ABOVE, FigurePool, FrameStats, Plot, frame_stats
+from tufte.instrument import stage, timed
+from tufte.stream import Chunks
+
+MODES = ("kde", "histogram")
+BANDWIDTHS = ("scott", "silverman")
+GRIDSIZE = 2**11
+
+
+def linear_binning(
+    values: np.ndarray,
+    lower: float,
+    upper: float,
+    gridsize: int = GRIDSIZE,
+    counts: np.ndarray = None,
+    block_size: int = 2**20,
+) -> np.ndarray:
+    """Spread every value over its two nearest points of a regular grid.
+
+    Each value adds 1 - w to the grid point below it and w to the one above,
+    w being its distance to the point below in grid steps, so that the
+    binned counts keep the mean of the values. Values outside the grid and
+    non-finite values are ignored.
+
+    Args:
+        values (np.ndarray): Values.
+        lower (float): First grid point.
+        upper (float): Last grid point.
+        gridsize (int, optional): Number of grid points. Defaults to GRIDSIZE.
+        counts (np.ndarray, optional): Counts to add to, e.g. those of the
+            previous chunks. Defaults to None (zeros).
+        block_size (int, optional): Number of values binned at once. Defaults
+            to 2**20.
+
+    Returns:
+        np.ndarray: Weight of each grid point.
+    """
+    if counts is None:
+        counts = np.zeros(gridsize)
+    delta = (upper - lower) / (gridsize - 1)
+
+    values = np.asarray(values).ravel()
+    for start in range(0, values.size, block_size):
+        position = (values[start : start + block_size] - lower) / delta
+        position = position[(position >= 0) & (position <= gridsize - 1)]
+        below = np.minimum(position.astype(np.int64), gridsize - 2)
+        weight = position - below
+        counts += np.bincount(below, 1 - weight, minlength=gridsize)
+        counts += np.bincount(below + 1, weight, minlength=gridsize)
+
+    return counts
+
+
+def get_bandwidth(
+    counts: np.ndarray,
+    grid: np.ndarray,
+    method: Union[str, float] = "scott",
+) -> float:
+    """Gaussian kernel bandwidth, from the binned values
+
+    Both rules scale min(standard deviation, interquartile range / 1.349) by
+    n ** (-1 / 5), with a factor of 1.059 (Scott) or 0.9 (Silverman).
+
+    Args:
+        counts (np.ndarray): Weight of each grid point.
+        grid (np.ndarray): Grid points.
+        method (Union[str, float], optional): "scott", "silverman" or the
+            bandwidth itself. Defaults to "scott".
+
+    Raises:
+        ValueError: If the method is unknown.
+
+    Returns:
+        float: Bandwidth.
+    """
+    if not isinstance(method, str):
+        return float(method)
+
+    if method not in BANDWIDTHS:
+        raise ValueError(f"Expected bandwidth to be one of {BANDWIDTHS}. Got {method}")
+
+    n = counts.sum()
+    mean = np.dot(counts, grid) / n
+    std = np.sqrt(np.dot(counts, (grid - mean) ** 2) / n)
+    quartiles = np.interp([0.25 * n, 0.75 * n], np.cumsum(counts), grid)
+    spread = min(std, (quartiles[1] - quartiles[0]) / 1.349) or std
+    factor = 1.059 if method == "scott" else 0.9
+
+    return factor * spread * n ** (-1 / 5)
+
+
+def gaussian_kde(counts: np.ndarray, delta: float, bandwidth: float) -> tuple:
+    """Gaussian kernel density of binned values, by FFT convolution
+
+    Args:
+        counts (np.ndarray): Weight of each grid point.
+        delta (float): Grid step.
+        bandwidth (float): Kernel standard deviation.
+
+    Returns:
+        tuple: Density at each point of the grid extended by 4 bandwidths on
+            both sides, and the number of points added on each side.
+    """
+    # The tails are cut at 4 bandwidths, and at the grid length
+    half = int(min(np.ceil(4 * bandwidth / delta), counts.size))
+    offsets = np.arange(-half, half + 1) * delta / bandwidth
+    kernel = np.exp(-0.5 * offsets**2) / (
+        np.sqrt(2 * np.pi) * bandwidth * counts.sum()
+    )
+
+    length = counts.size + 2 * half
+    size = 1 << (length - 1).bit_length()
+    density = np.fft.irfft(
+        np.fft.rfft(counts, size) * np.fft.rfft(kernel, size), size
+    )[:length]
+
+    return np.maximum(density, 0), half
+
+
+class Density(Plot):
+    """
+    Distribution of a sample, as a kernel density estimate or a histogram.
+
+    Values are binned on a regular grid in one streaming pass and the kernel
+    is applied to the bins by FFT, so the cost is O(n + m log m) for n values
+    and m grid points instead of O(n m).
+
+    Args:
+        Plot: Plot class.
+
+    Example:
+        >>> density = Density(xlabel="latency", ylabel="density")
+        >>> ax = density.plot(np.random.standard_normal(10**6), rug=True)
+    """
+
+    @timed("plot")
+    def plot(
+        self,
+        array: Union[str, Iterable],
+        data: pd.DataFrame = None,
+        mode: str = "kde",
+        bandwidth: Union[str, float] = "scott",
+        bins: int = None,
+        gridsize: int = GRIDSIZE,
+        limits: tuple = None,
+        rug: bool = False,
+        color: str = None,
+        linewidth: float = 1.0,
+        ticklabelsize: int = 10,
+        dtype: str = None,
+        **kwargs,
+    ):
+        """Draws the distribution of the values
+
+        Args:
+            array (Union[str, Iterable]): Values, column name or chunked source.
+            data (pd.DataFrame, optional): DataFrame containing the column.
+                Defaults to None.
+            mode (str, optional): Either "kde" or "histogram". Defaults to "kde".
+            bandwidth (Union[str, float], optional): "scott", "silverman" or the
+                kernel standard deviation. Defaults to "scott".
+            bins (int, optional): Number of histogram bars. Defaults to None
+                (Freedman-Diaconis rule).
+            gridsize (int, optional): Number of grid points. Defaults to GRIDSIZE.
+            limits (tuple, optional): Range of the values. Given limits let
+                chunked input be read in a single pass, which iterators
+                require. Defaults to None (the extent of the values).
+            rug (bool, optional): Mark the values along the x axis, at most one
+                tick per grid point. Defaults to False.
+            color (str, optional): Colour of the curve or of the bars. Defaults
+                to None (black curve, gray bars).
+            linewidth (float, optional): Line width. Defaults to 1.0.
+            ticklabelsize (int, optional): Tick label font size. Defaults to 10.
+            dtype (str, optional): Type of numeric values, e.g. "float32".
+                Defaults to None (unchanged).
+            **kwargs: Properties of the curve (Line2D) or of the bars
+                (StepPatch), e.g. alpha or linestyle.
+
+        Raises:
+            ValueError: If the mode is unknown, or if chunked input would have
+                to be read twice from an iterator.
+
+        Returns:
+            Axes: Figure container
+        """
+        if mode not in MODES:
+            raise ValueError(f"Expected mode to be one of {MODES}. Got {mode}")
+
+        array = self.fit(array, data, dtype)
+        chunks = array if isinstance(array, Chunks) else [array]
+        if mode == "histogram" and bins is not None:
+            # Histogram bars are made of whole grid bins
+            gridsize = bins * int(np.ceil(gridsize / bins))
+
+        if limits is not None:
+            stats = FrameStats(min=limits[0], max=limits[1], is_int=False)
+
+        elif isinstance(array, Chunks) and isinstance(array.source, Iterator):
+            raise ValueError(
+                "Chunked iterators are read twice unless limits are given"
+            )
+
+        else:
+            stats = FrameStats()
+            for chunk in chunks:
+                stats = stats.merge(frame_stats(chunk))
+        if stats.count == 0 and limits is None:
+            raise ValueError("There are no finite values to plot")
+
+        lower, upper = stats.min, stats.max
+        if lower == upper:
+            lower, upper = lower - 0.5, upper + 0.5
+            stats = replace(stats, min=lower, max=upper)
+
+        with stage("binning") as event:
+            if mode == "kde":
+                counts = None
+                for chunk in chunks:
+                    counts = linear_binning(chunk, lower, upper, gridsize, counts)
+
+            else:
+                counts = np.zeros(gridsize, dtype=np.int64)
+                for chunk in chunks:
+                    values = np.asarray(chunk).ravel()
+                    counts += np.histogram(values, gridsize, (lower, upper))[0]
+                edges = np.linspace(lower, upper, gridsize + 1)
+            event.n = int(counts.sum())
+        if limits is not None:
+            # The frame spans the limits even when no value falls within them
+            stats = replace(stats, count=max(int(counts.sum()), 1))
+
+        if mode == "kde":
+            grid = np.linspace(lower, upper, gridsize)
+            rug_positions = grid[counts > 0]
+            delta = grid[1] - grid[0]
+            curve, half = gaussian_kde(
+                counts, delta, get_bandwidth(counts, grid, bandwidth)
+            )
+            grid = lower + np.arange(-half, gridsize + half) * delta
+            y_frame = FrameStats(min=0, max=curve.max(), is_int=False, count=1)
+
+        else:
+            centers = (edges[:-1] + edges[1:]) / 2
+            rug_positions = centers[counts > 0]
+            bins = bins or self.get_bins(counts, centers)
+            counts = counts.reshape(bins, -1).sum(axis=1)
+            edges = edges[:: gridsize // bins]
+            y_frame = FrameStats(min=0, max=int(counts.max()), count=1)
+
+        self.get_canvas(
+            {
+                "x": stats,
+                "y": y_frame,
+                "pad": 0.05,
+                "ticklabelsize": ticklabelsize,
+                "is_bar": True,
+            }
+        )
+
+        if mode == "kde":
+            self.set_density_ticklabels()
+            xmin, xmax = self.ax.get_xlim()
+            visible = (grid >= xmin - delta) & (grid <= xmax + delta)
+            (self.line,) = self.ax.plot(
+                grid[visible],
+                curve[visible],
+                color=color or "black",
+                linewidth=linewidth,
+                **kwargs,
+            )
+
+        else:
+            self.bars = self.ax.stairs(
+                counts,
+                edges,
+                fill=True,
+                color=color or "gray",
+                edgecolor="none",
+                **kwargs,
+            )
+
+        if rug:
+            self.plot_rug(rug_positions)
+
+        return self.ax
+
+    @staticmethod
+    def get_bins(counts: np.ndarray, centers: np.ndarray) -> int:
+        """Number of histogram bars by the Freedman-Diaconis rule
+
+        The width 2 IQR n ** (-1 / 3) is rounded to a whole number of grid bins
+        dividing the grid.
+
+        Args:
+            counts (np.ndarray): Number of values per grid bin.
+            centers (np.ndarray): Grid bin centres.
+
+        Returns:
+            int: Number of bars, a divisor of the number of grid bins.
+        """
+        n = counts.sum()
+        quartiles = np.interp([0.25 * n, 0.75 * n], np.cumsum(counts), centers)
+        span = centers[-1] - centers[0] + (centers[1] - centers[0])
+        width = 2 * (quartiles[1] - quartiles[0]) * n ** (-1 / 3)
+        target = span / width if width > 0 else 10
+
+        divisors = np.flatnonzero(counts.size % np.arange(1, counts.size + 1) == 0)
+        divisors = divisors + 1
+
+        return int(divisors[np.argmin(np.abs(np.log(divisors / target)))])
+
+    def set_density_ticklabels(self):
+        """Label the density ticks with as many decimals as their spacing needs
+
+        Densities are often below one, where one decimal would repeat labels.
+        """
+        ticks = self.ax.get_yticks()
+        if len(ticks) < 2:
+            return
+
+        step = np.min(np.diff(ticks))
+        decimals = max(1, int(np.ceil(-np.log10(step))) if step > 0 else 1)
+        self.ax.set_yticks(ticks, np.char.mod(f"%.{decimals}f", ticks).tolist())
+
+    def plot_rug(self, positions: np.ndarray):
+        """Marks the values along the bottom of the axes as one collection
+
+        Values sharing a grid point are marked once, so that the rug costs the
+        same for a thousand values as for a billion.
+
+        Args:
+            positions (np.ndarray): Occupied grid points.
+        """
+        self.rug = LineCollection(
+            np.stack(
+                [
+                    np.stack([positions, np.zeros_like(positions)], axis=-1),
+                    np.stack([positions, np.full_like(positions, 0.03)], axis=-1),
+                ],
+                axis=1,
+            ),
+            colors="#4B4B4B",
+            linewidths=0.5,
+            transform=self.ax.get_xaxis_transform(),
+        )
+        self.ax.add_collection(self.rug, autolim=False)
+        self.rasterize_dense(self.rug, len(positions))
+
+    def set_density_spines(self):
+        self.ax.spines["left"].set_linewidth(0.75)
+        self.ax.spines["bottom"].set_linewidth(0.75)
+        self.ax.spines["left"].set_edgecolor("#4B4B4B")
+        self.ax.spines["bottom"].set_edgecolor("#4B4B4B")
+
+        # Ensure that the axis ticks only show up on the bottom and left of the plot.
+        self.ax.get_xaxis().tick_bottom()
+        self.ax.get_yaxis().tick_left()
+
+    def set_plot_title(self, title: str = None):
+        title = title or f"Distribution of {self.xlabel}"
+        super().set_plot_title(title)
+
+
+def main(
+    array: Union[str, Iterable],
+    data: pd.DataFrame = None,
+    xlabel: str = "x",
+    ylabel: str = None,
+    title: str = None,
+    mode: str = "kde",
+    bandwidth: Union[str, float] = "scott",
+    bins: int = None,
+    gridsize: int = GRIDSIZE,
+    limits: tuple = None,
+    rug: bool = False,
+    color: str = None,
+    linewidth: float = 1.0,
+    ticklabelsize: int = 10,
+    dtype: str = None,
+    figsize: tuple = (20, 10),
+    fontsize: int = 12,
+    ax: Axes = None,
+    dpi: float = None,
+    pool: FigurePool = None,
+    rasterize_above: int = RASTERIZE_ABOVE,
+    pyplot: bool = True,
+    **kwargs,
+):
+    density = Density(
+        xlabel=xlabel,
+        ylabel=ylabel or ("density" if mode == "kde" else "count"),
+        figsize=figsize,
+        fontsize=fontsize,
+        ax=ax,
+        dpi=dpi,
+        pool=pool,
+        rasterize_above=rasterize_above,
+        pyplot=pyplot,
+    )
+    density.set_plot_title(title)
+
+    return density.plot(
+        array=array,
+        data=data,
+        mode=mode,
+        bandwidth=bandwidth,
+        bins=bins,
+        gridsize=gridsize,
+        limits=limits,
+        rug=rug,
+        color=color,
+        linewidth=linewidth,
+        ticklabelsize=ticklabelsize,
+        dtype=dtype,
+        **kwargs,
+    )
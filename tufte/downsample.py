@@ -0,0 +1,241 @@
+from typing import Union
+
+import numpy as np
+
+METHODS = ("lttb", "minmax", "pixel")
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, for every bucket in between, the
+    point that forms the largest triangle with the previously selected point
+    and the average of the next bucket.
+
+    Args:
+        x (np.ndarray): Sorted x values.
+        y (np.ndarray): y values.
+        n_out (int): Number of points to keep.
+
+    Returns:
+        np.ndarray: Indices of the selected points.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Averages of every bucket, with the last point as the bucket after the last
+    counts = np.diff(edges)
+    x_avg = np.add.reduceat(x[1 : n - 1], edges[:-1] - 1) / counts
+    y_avg = np.add.reduceat(y[1 : n - 1], edges[:-1] - 1) / counts
+    x_avg = np.append(x_avg[1:], x[-1])
+    y_avg = np.append(y_avg[1:], y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i, (start, stop) in enumerate(zip(edges[:-1], edges[1:])):
+        ax, ay = x[a], y[a]
+        area = np.abs(
+            (ax - x_avg[i]) * (y[start:stop] - ay)
+            - (ax - x[start:stop]) * (y_avg[i] - ay)
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+def minmax(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Keep the minimum and maximum of every bucket.
+
+    Args:
+        y (np.ndarray): y values ordered by x.
+        n_out (int): Approximate number of points to keep.
+
+    Returns:
+        np.ndarray: Sorted indices of the selected points.
+    """
+    n = len(y)
+    n_buckets = max(n_out // 2, 1)
+    if n_out >= n:
+        return np.arange(n)
+
+    size = -(-n // n_buckets)
+    padding = size * n_buckets - n
+    lower = np.append(y, np.full(padding, np.inf)).reshape(n_buckets, size)
+    upper = np.append(y, np.full(padding, -np.inf)).reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    indices = np.concatenate(
+        (
+            [0, n - 1],
+            offsets + np.argmin(lower, axis=1),
+            offsets + np.argmax(upper, axis=1),
+        )
+    )
+
+    return np.unique(indices[indices < n])
+
+
+def pixel(
+    x: np.ndarray,
+    y: np.ndarray,
+    xlim: tuple,
+    ylim: tuple,
+    width: int,
+    height: int,
+) -> np.ndarray:
+    """Keep one point per pixel of the axes.
+
+    Args:
+        x (np.ndarray): x values.
+        y (np.ndarray): y values.
+        xlim (tuple): x axis limits.
+        ylim (tuple): y axis limits.
+        width (int): Axes width in pixels.
+        height (int): Axes height in pixels.
+
+    Returns:
+        np.ndarray: Sorted indices of the selected points.
+    """
+    width, height = max(int(width), 1), max(int(height), 1)
+    xspan = (xlim[1] - xlim[0]) or 1.0
+    yspan = (ylim[1] - ylim[0]) or 1.0
+    col = np.clip(((x - xlim[0]) / xspan * width).astype(np.int64), 0, width - 1)
+    row = np.clip(((y - ylim[0]) / yspan * height).astype(np.int64), 0, height - 1)
+    _, indices = np.unique(row * width + col, return_index=True)
+
+    return np.sort(indices)
+
+
+def density(
+    x: np.ndarray,
+    y: np.ndarray,
+    xlim: tuple,
+    ylim: tuple,
+    width: int,
+    height: int,
+    counts: np.ndarray = None,
+    block_size: int = 2**20,
+) -> np.ndarray:
+    """Count the points falling in every cell of a width by height grid.
+
+    Points outside the limits and non-finite points are ignored. The points
+    are binned in blocks, so that the temporary indices stay small.
+
+    Args:
+        x (np.ndarray): x values.
+        y (np.ndarray): y values.
+        xlim (tuple): x limits of the grid.
+        ylim (tuple): y limits of the grid.
+        width (int): Number of columns.
+        height (int): Number of rows.
+        counts (np.ndarray, optional): Counts to add to, e.g. of a previous
+            chunk. Defaults to None.
+        block_size (int, optional): Number of points per block. Defaults to 2**20.
+
+    Returns:
+        np.ndarray: Counts of shape (height, width). Row 0 is at ylim[0].
+    """
+    width, height = max(int(width), 1), max(int(height), 1)
+    if counts is None:
+        counts = np.zeros((height, width), dtype=np.int64)
+
+    xscale = width / ((xlim[1] - xlim[0]) or 1.0)
+    yscale = height / ((ylim[1] - ylim[0]) or 1.0)
+    x, y = np.ravel(x), np.ravel(y)
+    for start in range(0, len(x), block_size):
+        # NaN fails both comparisons, hence is dropped with the outliers
+        col = (x[start : start + block_size] - xlim[0]) * xscale
+        row = (y[start : start + block_size] - ylim[0]) * yscale
+        mask = (col >= 0) & (col < width) & (row >= 0) & (row < height)
+        cells = row[mask].astype(np.int64) * width + col[mask].astype(np.int64)
+        counts += np.bincount(cells, minlength=width * height).reshape(
+            height, width
+        )
+
+    return counts
+
+
+def occupancy(
+    values: np.ndarray,
+    lim: tuple,
+    size: int,
+    occupied: np.ndarray = None,
+    block_size: int = 2**20,
+) -> np.ndarray:
+    """Find the pixels of one axis that hold at least one value.
+
+    Values outside the limits and non-finite values are ignored.
+
+    Args:
+        values (np.ndarray): Values.
+        lim (tuple): Axis limits.
+        size (int): Axis length in pixels.
+        occupied (np.ndarray, optional): Occupancy to add to, e.g. of a previous
+            chunk. Defaults to None.
+        block_size (int, optional): Number of values per block. Defaults to 2**20.
+
+    Returns:
+        np.ndarray: Boolean array of length size. Pixel 0 is at lim[0].
+    """
+    size = max(int(size), 1)
+    if occupied is None:
+        occupied = np.zeros(size, dtype=bool)
+
+    scale = size / ((lim[1] - lim[0]) or 1.0)
+    values = np.ravel(values)
+    for start in range(0, len(values), block_size):
+        position = (values[start : start + block_size] - lim[0]) * scale
+        position = position[(position >= 0) & (position < size)]
+        occupied[position.astype(np.int64)] = True
+
+    return occupied
+
+
+def downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    method: Union[str, int],
+    n_out: int,
+) -> tuple:
+    """Reduce a series to what can be drawn within n_out pixels.
+
+    Both methods bucket the points in order, so x must be sorted.
+
+    Args:
+        x (np.ndarray): Sorted x values.
+        y (np.ndarray): y values.
+        method (Union[str, int]): Either "lttb" or "minmax". An int is a LTTB target.
+        n_out (int): Number of points to keep, ignored when method is an int.
+
+    Raises:
+        ValueError: If the method is unknown.
+
+    Returns:
+        tuple: Downsampled x and y.
+    """
+    x = np.asarray(x).ravel()
+    y = np.asarray(y).ravel()
+
+    if isinstance(method, (int, np.integer)) and not isinstance(method, bool):
+        method, n_out = "lttb", int(method)
+
+    if method not in ("lttb", "minmax"):
+        raise ValueError(f"Expected one of {METHODS[:2]} or an int. Got {method}")
+
+    if len(x) <= n_out:
+        return x, y
+
+    mask = np.isfinite(x) & np.isfinite(y)
+    if not mask.all():
+        x, y = x[mask], y[mask]
+
+    if method == "lttb":
+        indices = lttb(x.astype(np.float64), y.astype(np.float64), n_out)
+
+    else:
+        indices = minmax(y, n_out)
+
+    return x[indices], y[indices]
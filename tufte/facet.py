@@ -0,0 +1,544 @@
+from dataclasses import dataclass, replace
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.markers import TICKDOWN, TICKLEFT
+from matplotlib.ticker import MaxNLocator
+from matplotlib.transforms import ScaledTranslation
+
+from tufte.base import (
+    RASTERIZE_ABOVE,
+    FigurePool,
+    FrameStats,
+    Plot,
+    as_values,
+    fit_tick_labels,
+    format_ticks,
+    frame_stats,
+    frame_ticks,
+)
+from tufte.box import Box
+from tufte.instrument import stage, timed
+from tufte.line import TufteLine
+from tufte.stream import Chunks
+
+KINDS = ("line", "scatter", "bar", "box")
+FRAME_COLOR = "#4B4B4B"
+# Bars of all the panels above which values are read from ticks, not labels
+MAX_BAR_LABELS = 500
+
+
+@dataclass
+class Facet(Plot):
+    """
+    Small multiples: one panel per group, all sharing the same range frames.
+
+    The panels are cells of a single axes rather than one axes each, which is
+    what makes large grids cheap: the data are split with one sort of the
+    group codes, the frames are computed once, and each layer of the grid
+    (data, spines, ticks) is a single artist whatever the number of panels.
+
+    Args:
+        Plot: Plot class
+        kind (str, optional): Either line, scatter, bar or box. Defaults to line.
+        ncols (int, optional): Number of columns of the grid. Defaults to None
+            (as many as rows).
+
+    Example:
+        >>> data = pd.DataFrame({"g": [0, 0, 1], "x": [0, 1, 0], "y": [1, 2, 2]})
+        >>> facet = Facet(xlabel="x", ylabel="y", kind="line")
+        >>> ax = facet.plot("x", "y", data=data, by="g")
+    """
+
+    kind: str = "line"
+    ncols: int = None
+
+    def __post_init__(self):
+        if self.kind not in KINDS:
+            raise ValueError(f"Expected kind to be one of {KINDS}. Got {self.kind}")
+
+        super().__post_init__()
+
+    @timed("plot")
+    def plot(
+        self,
+        x: Union[str, Iterable] = None,
+        y: Union[str, Iterable] = None,
+        data: pd.DataFrame = None,
+        by: Union[str, Iterable] = None,
+        linestyle: str = "tufte",
+        linewidth: float = 1.0,
+        color: str = None,
+        alpha: float = 0.9,
+        ticklabelsize: int = 8,
+        markersize: int = 4,
+        pad: float = 0.05,
+        gap: float = 0.3,
+        dtype: str = None,
+        **kwargs,
+    ):
+        """Draws one panel per group
+
+        Args:
+            x (Union[str, Iterable], optional): x values, ignored by box plots.
+                Defaults to None.
+            y (Union[str, Iterable], optional): y values. Defaults to None.
+            data (pd.DataFrame, optional): DataFrame containing x, y and by.
+                Defaults to None.
+            by (Union[str, Iterable], optional): Group of each value. Defaults
+                to None.
+            linestyle (str, optional): Line style. Defaults to "tufte".
+            linewidth (float, optional): Line width. Defaults to 1.0.
+            color (str, optional): Colour of lines, points and bars. Defaults to
+                None (black, gray for bars).
+            alpha (float, optional): Opacity. Defaults to 0.9.
+            ticklabelsize (int, optional): Tick label font size. Defaults to 8.
+            markersize (int, optional): Marker area. Defaults to 4.
+            pad (float, optional): Padding of the frames within a panel.
+                Defaults to 0.05.
+            gap (float, optional): Space between panels, as a fraction of their
+                size. Defaults to 0.3.
+            dtype (str, optional): Type of numeric values, e.g. "float32".
+                Defaults to None (unchanged).
+            **kwargs: Properties of the artist drawing the lines, points or
+                bars of every panel.
+
+        Raises:
+            ValueError: If by is missing or a column is a chunked source.
+            TypeError: If box plots are given artist properties.
+
+        Returns:
+            Axes: Figure container
+        """
+        if by is None:
+            raise ValueError("Facets need the group of each value in by")
+
+        if kwargs and self.kind == "box":
+            raise TypeError(f"Box facets take no artist properties. Got {kwargs}")
+
+        columns = [self.fit(by, data)]
+        columns.append(self.fit(y, data, dtype))
+        if self.kind != "box":
+            columns.append(self.fit(x, data, dtype))
+        if any(isinstance(column, Chunks) for column in columns):
+            raise ValueError("Facets of chunked sources are not supported")
+
+        with stage("groupby", n=np.size(columns[0])):
+            # One stable sort splits every column into contiguous groups
+            codes, labels = pd.factorize(np.asarray(columns[0]).ravel(), sort=True)
+            order = np.argsort(codes, kind="stable")
+            order = order[np.searchsorted(codes[order], 0) :]
+            codes = codes[order]
+            y = np.asarray(columns[1]).ravel()[order]
+            x = np.asarray(columns[2]).ravel()[order] if len(columns) > 2 else None
+            self.labels = np.asarray(labels)
+            self.bounds = np.searchsorted(codes, np.arange(len(labels) + 1))
+
+        self.set_grid(len(self.labels), gap)
+        self.pad = pad
+        self.ticklabelsize = ticklabelsize
+        style = {"color": color, "alpha": alpha, "linewidth": linewidth, **kwargs}
+        getattr(self, f"plot_{self.kind}")(x, y, codes, linestyle, markersize, style)
+
+        for label, (left, bottom) in zip(self.labels, self.origins):
+            self.ax.text(
+                left + 0.5,
+                bottom + 1,
+                str(label),
+                ha="center",
+                va="bottom",
+                fontsize=ticklabelsize,
+                color=FRAME_COLOR,
+            )
+        self.set_axes_labels()
+
+        return self.ax
+
+    def set_grid(self, n_panels: int, gap: float):
+        """Lay the panels out as unit squares of the axes, row by row from the top
+
+        Args:
+            n_panels (int): Number of panels.
+            gap (float): Space between panels.
+        """
+        self.ncols = self.ncols or max(int(np.ceil(np.sqrt(n_panels))), 1)
+        self.nrows = max(int(np.ceil(n_panels / self.ncols)), 1)
+        panels = np.arange(n_panels)
+        self.origins = np.stack(
+            [
+                (panels % self.ncols) * (1 + gap),
+                (self.nrows - 1 - panels // self.ncols) * (1 + gap),
+            ],
+            axis=-1,
+        )
+
+        self.ax.set_axis_off()
+        self.ax.set_xlim(-gap / 2, self.ncols * (1 + gap) - gap / 2)
+        self.ax.set_ylim(-gap / 2, self.nrows * (1 + gap) - gap / 2)
+
+    def scale(self, values, stats: FrameStats, is_bar: bool = False) -> np.ndarray:
+        """Map values into [0, 1], the padded frame limits of a panel
+
+        Args:
+            values: Values.
+            stats (FrameStats): Summary of the values along the axis.
+            is_bar (bool, optional): Anchor the frame at zero. Defaults to False.
+
+        Returns:
+            np.ndarray: Position of the values within a panel.
+        """
+        vmin = min(stats.min, 0) if is_bar else stats.min
+        margin = ((stats.max - vmin) or 1.0) * self.pad
+        lower = vmin if is_bar else vmin - margin
+
+        return (np.asarray(values, dtype=np.float64) - lower) / (
+            stats.max + margin - lower
+        )
+
+    def plot_line(self, x, y, codes, linestyle, markersize, style):
+        style["color"] = style["color"] or "black"
+        gx, gy = self.set_frames(x, y, codes)
+        # A NaN between groups breaks the line, so one artist draws every panel
+        gx = np.insert(gx, self.bounds[1:-1], np.nan)
+        gy = np.insert(gy, self.bounds[1:-1], np.nan)
+
+        if linestyle == "tufte":
+            line = self.ax.add_line(
+                TufteLine(gx, gy, markersize=markersize, linestyle="-", **style)
+            )
+
+        else:
+            (line,) = self.ax.plot(gx, gy, linestyle=linestyle, **style)
+        self.rasterize_dense(line, len(y))
+
+    def plot_scatter(self, x, y, codes, linestyle, markersize, style):
+        style["color"] = style["color"] or "black"
+        gx, gy = self.set_frames(x, y, codes)
+        style.pop("linewidth")
+        points = self.ax.scatter(gx, gy, marker="o", s=markersize, **style)
+        self.rasterize_dense(points, len(y))
+
+    def plot_bar(self, x, y, codes, linestyle, markersize, style):
+        positions, categories = pd.factorize(x, sort=True)
+        stats = self.frames["y"] = frame_stats(y)
+        width = 1 / (len(categories) + 1)
+        centers = (np.arange(len(categories)) + 1) * width
+        base = self.scale(0, stats, is_bar=True)
+
+        left = centers[positions] + self.origins[codes, 0] - width / 4
+        right = left + width / 2
+        bottom = base + self.origins[codes, 1]
+        top = self.scale(y, stats, is_bar=True) + self.origins[codes, 1]
+        # Every bar of every panel is a polygon of one collection
+        self.ax.add_collection(
+            PolyCollection(
+                np.stack(
+                    [
+                        np.stack([left, bottom], axis=-1),
+                        np.stack([left, top], axis=-1),
+                        np.stack([right, top], axis=-1),
+                        np.stack([right, bottom], axis=-1),
+                    ],
+                    axis=1,
+                ),
+                facecolors=style.pop("color") or "gray",
+                edgecolors="none",
+                alpha=style.pop("alpha"),
+                **{key: value for key, value in style.items() if key != "linewidth"},
+            ),
+            autolim=False,
+        )
+        if len(y) > MAX_BAR_LABELS:
+            # Too many labels to read, the panels get a y range frame instead
+            self.draw_frame_ticks("y", replace(stats, is_int=False), is_bar=True)
+
+        else:
+            for mask, offset, va in ((y >= 0, 3, "bottom"), (y < 0, -3, "top")):
+                transform = self.ax.transData + ScaledTranslation(
+                    0, offset / 72, self.fig.dpi_scale_trans
+                )
+                for position, value, label in zip(
+                    left[mask] + width / 4, top[mask], np.char.mod("%.1f", y[mask])
+                ):
+                    self.ax.text(
+                        position,
+                        value,
+                        label,
+                        transform=transform,
+                        ha="center",
+                        va=va,
+                        fontsize=self.ticklabelsize,
+                    )
+        self.draw_ticks("x", centers, [str(c) for c in categories], marks=False)
+
+    def plot_box(self, x, y, codes, linestyle, markersize, style):
+        values = as_values(y)
+        mask = np.isfinite(values)
+        if not mask.all():
+            values, codes = values[mask], codes[mask]
+        self.set_frames(None, values, codes, spines=False)
+
+        summary_stats = Box.get_grouped_summary_statistics(
+            values, codes, len(self.labels)
+        )
+        left, bottom = self.origins.T + [[0.5], [0]]
+        ends = {
+            key: np.stack(
+                [left, bottom + self.scale(summary_stats[key], self.frames["y"])],
+                axis=-1,
+            )
+            for key in ("lower_bound", "25%", "50%", "75%", "upper_bound")
+        }
+        whiskers = np.concatenate(
+            (
+                np.stack([ends["lower_bound"], ends["25%"]], axis=1),
+                np.stack([ends["75%"], ends["upper_bound"]], axis=1),
+            )
+        )
+        self.ax.add_collection(
+            LineCollection(whiskers, colors="black", linewidths=0.5),
+            autolim=False,
+        )
+        self.ax.scatter(*ends["50%"].T, color="black", s=5)
+
+        mask = (values > summary_stats["upper_bound"][codes]) | (
+            values < summary_stats["lower_bound"][codes]
+        )
+        outliers = self.ax.scatter(
+            left[codes[mask]],
+            bottom[codes[mask]] + self.scale(values[mask], self.frames["y"]),
+            color="grey",
+            s=5,
+            marker="o",
+        )
+        self.rasterize_dense(outliers, np.count_nonzero(mask))
+
+    @timed("range_frame")
+    def set_frames(self, x, y, codes: np.ndarray, spines: bool = True) -> tuple:
+        """Compute the shared range frames once and draw them in every panel
+
+        Args:
+            x: x values, None for no x frame.
+            y: y values, None for no y frame.
+            codes (np.ndarray): Panel of each value.
+            spines (bool, optional): Draw the spines. Defaults to True.
+
+        Returns:
+            tuple: Positions of x and y in the grid.
+        """
+        positions = []
+        for axis, values in (("x", x), ("y", y)):
+            if values is None:
+                positions.append(None)
+                continue
+
+            stats = self.frames[axis] = frame_stats(values)
+            if stats.count == 0:
+                positions.append(np.full(len(codes), np.nan))
+                continue
+
+            if spines:
+                self.draw_spines(axis, self.scale([stats.min, stats.max], stats))
+            self.draw_frame_ticks(axis, stats)
+
+            offsets = self.origins[codes, 0 if axis == "x" else 1]
+            positions.append(self.scale(values, stats) + offsets)
+
+        return tuple(positions)
+
+    def draw_frame_ticks(self, axis: str, stats: FrameStats, is_bar: bool = False):
+        """Draws the ticks of a range frame in every panel
+
+        As set_axis_frame, the ticks are the frame ends and a few round values
+        in between, without the inner ones whose labels would overlap the
+        labels of the ends.
+
+        Args:
+            axis (str): Either "x" or "y".
+            stats (FrameStats): Summary of the values along the axis.
+            is_bar (bool, optional): Anchor the frame at zero. Defaults to False.
+        """
+        vmin = min(stats.min, 0) if is_bar else stats.min
+        ticks = frame_ticks(
+            MaxNLocator(nbins=4).tick_values(vmin, stats.max),
+            vmin,
+            stats.max,
+            stats.is_int,
+        )
+        labels = format_ticks(ticks, stats.is_int)
+        # Panels are unit squares of the grid, so the grid axes measure them
+        locations = self.scale(ticks, stats, is_bar)
+        keep = fit_tick_labels(self.ax, axis, locations, labels, self.ticklabelsize)
+        self.draw_ticks(axis, locations[keep], [labels[index] for index in keep])
+
+    def draw_spines(self, axis: str, bounds: np.ndarray):
+        """Draws the spine of an axis in every panel, as one collection
+
+        Args:
+            axis (str): Either "x" or "y".
+            bounds (np.ndarray): Ends of the spine within a panel.
+        """
+        left, bottom = self.origins.T
+        if axis == "x":
+            start = np.stack([left + bounds[0], bottom], axis=-1)
+            end = np.stack([left + bounds[1], bottom], axis=-1)
+
+        else:
+            start = np.stack([left, bottom + bounds[0]], axis=-1)
+            end = np.stack([left, bottom + bounds[1]], axis=-1)
+
+        self.ax.add_collection(
+            LineCollection(
+                np.stack([start, end], axis=1), colors=FRAME_COLOR, linewidths=0.75
+            ),
+            autolim=False,
+        )
+
+    def draw_ticks(
+        self, axis: str, locations: np.ndarray, labels: list, marks: bool = True
+    ):
+        """Draws the ticks of an axis in every panel, labelled on the outer ones
+
+        Tick marks are the markers of a single line, and only the panels on
+        the bottom row (x) or the first column (y) are labelled.
+
+        Args:
+            axis (str): Either "x" or "y".
+            locations (np.ndarray): Tick locations within a panel.
+            labels (list): Tick labels.
+            marks (bool, optional): Draw the tick marks. Defaults to True.
+        """
+        left, bottom = self.origins.T
+        panels = np.arange(len(left))
+        if axis == "x":
+            tx = np.add.outer(left, locations).ravel()
+            ty = np.repeat(bottom, len(locations))
+            outer = panels[panels + self.ncols >= len(panels)]
+            marker, offset = TICKDOWN, (0, -6 / 72)
+            align = {"ha": "center", "va": "top"}
+
+        else:
+            tx = np.repeat(left, len(locations))
+            ty = np.add.outer(bottom, locations).ravel()
+            outer = panels[panels % self.ncols == 0]
+            marker, offset = TICKLEFT, (-6 / 72, 0)
+            align = {"ha": "right", "va": "center"}
+
+        if marks:
+            self.ax.plot(
+                tx,
+                ty,
+                linestyle="none",
+                marker=marker,
+                markersize=3.5,
+                markeredgewidth=0.75,
+                color=FRAME_COLOR,
+            )
+
+        transform = self.ax.transData + ScaledTranslation(
+            *offset, self.fig.dpi_scale_trans
+        )
+        for panel in outer:
+            for location, label in zip(locations, labels):
+                self.ax.text(
+                    left[panel] + (location if axis == "x" else 0),
+                    bottom[panel] + (location if axis == "y" else 0),
+                    label,
+                    transform=transform,
+                    fontsize=self.ticklabelsize,
+                    color=FRAME_COLOR,
+                    **align,
+                )
+
+    def set_axes_labels(self):
+        # Plain figure texts, where supxlabel and supylabel would sit, so that
+        # pooled figures can remove them
+        self.fig.text(
+            0.5,
+            0.01,
+            self.xlabel,
+            color=FRAME_COLOR,
+            fontsize=self.fontsize,
+            ha="center",
+            va="bottom",
+        )
+        if self.kind != "bar":
+            self.fig.text(
+                0.02,
+                0.5,
+                self.ylabel,
+                color=FRAME_COLOR,
+                fontsize=self.fontsize,
+                ha="left",
+                va="center",
+                rotation="vertical",
+                rotation_mode="anchor",
+            )
+
+    def set_plot_title(self, title: str = None):
+        title = title or (
+            f"{self.kind.capitalize()} plots of {self.xlabel} and {self.ylabel}"
+        )
+        super().set_plot_title(title)
+
+
+def main(
+    x: Union[str, Iterable] = None,
+    y: Union[str, Iterable] = None,
+    data: pd.DataFrame = None,
+    by: Union[str, Iterable] = None,
+    kind: str = "line",
+    ncols: int = None,
+    xlabel: str = "x",
+    ylabel: str = "y",
+    title: str = None,
+    linestyle: str = "tufte",
+    linewidth: float = 1.0,
+    color: str = None,
+    alpha: float = 0.9,
+    ticklabelsize: int = 8,
+    markersize: int = 4,
+    gap: float = 0.3,
+    dtype: str = None,
+    figsize: tuple = (20, 10),
+    fontsize: int = 12,
+    ax: Axes = None,
+    dpi: float = None,
+    pool: FigurePool = None,
+    rasterize_above: int = RASTERIZE_ABOVE,
+    pyplot: bool = True,
+    **kwargs,
+):
+    facet = Facet(
+        xlabel=xlabel,
+        ylabel=ylabel,
+        figsize=figsize,
+        fontsize=fontsize,
+        ax=ax,
+        dpi=dpi,
+        pool=pool,
+        rasterize_above=rasterize_above,
+        pyplot=pyplot,
+        kind=kind,
+        ncols=ncols,
+    )
+    facet.set_plot_title(title)
+
+    return facet.plot(
+        x=x,
+        y=y,
+        data=data,
+        by=by,
+        linestyle=linestyle,
+        linewidth=linewidth,
+        color=color,
+        alpha=alpha,
+        ticklabelsize=ticklabelsize,
+        markersize=markersize,
+        gap=gap,
+        dtype=dtype,
+        **kwargs,
+    )
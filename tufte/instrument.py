@@ -0,0 +1,235 @@
+import contextvars
+import functools
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+# Process-wide listeners, see add_listener
+_listeners = []
+# Listeners of the instrument blocks enclosing the current context
+_scoped = contextvars.ContextVar("tufte_listeners", default=())
+_local = threading.local()
+
+
+def _active() -> bool:
+    return bool(_listeners) or bool(_scoped.get())
+
+
+@dataclass(frozen=True)
+class StageEvent:
+    """Timing of one stage of a plot.
+
+    Args:
+        stage (str): Stage name, e.g. fit, canvas, spines, range_frame,
+            downsample, plot or savefig.
+        plot (str): Plot type, e.g. line.
+        n (int): Number of points handled by the stage, None if unknown.
+        duration (float): Wall time in seconds.
+        memory (int): Peak bytes allocated during the stage, above what was
+            allocated when it started. None unless tracemalloc is tracing.
+        depth (int): Number of enclosing stages.
+    """
+
+    stage: str
+    plot: str
+    n: int
+    duration: float
+    memory: int = None
+    depth: int = 0
+
+
+class _Stage:
+    __slots__ = ("name", "plot", "n", "start", "memory", "peak", "parent")
+
+    def __init__(self, name: str, plot: str, n: int):
+        self.name = name
+        self.plot = plot
+        self.n = n
+
+    def __enter__(self) -> "_Stage":
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self.parent = stack[-1] if stack else None
+        if self.plot is None and self.parent is not None:
+            self.plot = self.parent.plot
+
+        self.memory = self.peak = None
+        if tracemalloc.is_tracing():
+            # The peak is reset for this stage, so the enclosing ones keep theirs
+            current, peak = tracemalloc.get_traced_memory()
+            for outer in stack:
+                outer.peak = max(outer.peak or 0, peak)
+            tracemalloc.reset_peak()
+            self.memory, self.peak = current, 0
+
+        stack.append(self)
+        self.start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter() - self.start
+        _local.stack.pop()
+
+        memory = None
+        if self.memory is not None and tracemalloc.is_tracing():
+            peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            if self.parent is not None:
+                self.parent.peak = max(self.parent.peak or 0, peak)
+            memory = max(peak - self.memory, 0)
+
+        event = StageEvent(
+            self.name, self.plot, self.n, duration, memory, len(_local.stack)
+        )
+        for listener in [*_listeners, *_scoped.get()]:
+            listener(event)
+
+        return False
+
+
+class _NullStage:
+    __slots__ = ()
+    n = None
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL = _NullStage()
+
+
+def stage(name: str, plot: str = None, n: int = None):
+    """Context manager timing a stage. Free of work when nobody listens.
+
+    Args:
+        name (str): Stage name.
+        plot (str, optional): Plot type. Defaults to the enclosing stage's.
+        n (int, optional): Number of points, can also be set on the returned
+            object inside the block. Defaults to None.
+
+    Returns:
+        Context manager.
+    """
+    if not _active():
+        return _NULL
+
+    return _Stage(name, plot, n)
+
+
+def _plot_type(obj) -> str:
+    return type(obj).__name__.lower()
+
+
+def _count(obj) -> int:
+    """Number of points plotted, from the range frames of a plot"""
+    frames = getattr(obj, "frames", None)
+    if not frames:
+        return None
+
+    return max(stats.count for stats in frames.values())
+
+
+def timed(name: str) -> Callable:
+    """Decorate a Canvas method so that its calls are reported as a stage
+
+    Args:
+        name (str): Stage name.
+
+    Returns:
+        Callable: Decorator.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not _active():
+                return method(self, *args, **kwargs)
+
+            with _Stage(name, _plot_type(self), None) as event:
+                result = method(self, *args, **kwargs)
+                event.n = _count(self)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def add_listener(callback: Callable[[StageEvent], None]):
+    """Send every StageEvent of the process to callback, e.g. to forward them
+    to metrics
+
+    Unlike instrument, the listener receives the events of every thread.
+
+    Args:
+        callback (Callable[[StageEvent], None]): Function called with each event,
+            from the thread that ran the stage.
+    """
+    _listeners.append(callback)
+
+
+def remove_listener(callback: Callable[[StageEvent], None]):
+    _listeners.remove(callback)
+
+
+@contextmanager
+def instrument(
+    callback: Callable[[StageEvent], None] = None,
+    memory: bool = False,
+) -> Generator[list, None, None]:
+    """Collect the StageEvents of the plots made within the block
+
+    Only the plots made in the context of the block are collected: the events
+    of other threads, e.g. of AsyncRenderer or render_many workers, are not,
+    unless their work runs in a copy of the context (contextvars.copy_context).
+    Use add_listener to receive the events of the whole process.
+
+    The savefig stage is reported by Canvas.savefig, tufte.export,
+    render_many and RenderCache. Saving the figure of the returned axes with
+    Figure.savefig is not reported, so export the chart to time it.
+
+    Args:
+        callback (Callable[[StageEvent], None], optional): Function called with
+            each event. Defaults to None (events are only collected).
+        memory (bool, optional): Trace allocations to report the peak memory of
+            each stage. Slows plotting down. Defaults to False.
+
+    Yields:
+        list: Events, appended as stages end.
+
+    Example:
+        >>> with instrument() as events:
+        ...     ax = tufte.lineplot([0, 1, 2], [1, 0, 2])
+        >>> [event.stage for event in events]
+        ['canvas', 'fit', 'fit', 'spines', 'range_frame', 'plot']
+    """
+    events = []
+
+    def listener(event: StageEvent):
+        events.append(event)
+        if callback is not None:
+            callback(event)
+
+    tracing = memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    token = _scoped.set((*_scoped.get(), listener))
+
+    try:
+        yield events
+
+    finally:
+        _scoped.reset(token)
+        if tracing:
+            tracemalloc.stop()
@@ -1,23 +1,113 @@
-import sys
 import warnings
-from pathlib import Path
 from typing import Iterable, Union
 
+import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.artist import allow_rasterization
 from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
+from matplotlib.markers import MarkerStyle
+from matplotlib.transforms import Bbox
 
-PROJECT_ROOT = Path.cwd().resolve().parent
-sys.path.append(str(PROJECT_ROOT))
+from tufte.base import (
+    RASTERIZE_ABOVE,
+    FigurePool,
+    Plot,
+    as_values,
+    frame_stats,
+    set_axis_frame,
+)
+from tufte.instrument import timed
+from tufte.stream import Chunks
 
-from tufte.base import Plot
+
+class TufteLine(Line2D):
+    """
+    Line with a white halo around each marker, drawn as a single artist.
+
+    The line, the halos and the markers share the line's vertices and
+    transformed path, so the data are copied and transformed only once.
+
+    Args:
+        x (Iterable): x values.
+        y (Iterable): y values.
+        markersize (float, optional): Marker area in points^2. Defaults to 10.
+        halo (float, optional): Halo area as a multiple of markersize. Defaults to 8.
+        markercolor (str, optional): Marker colour. Defaults to the line colour.
+        markeredgewidth (float, optional): Marker edge width in points. Defaults
+            to rcParams["patch.linewidth"], as in scatter.
+        **kwargs: Line2D properties.
+    """
+
+    def __init__(
+        self,
+        x: Iterable,
+        y: Iterable,
+        markersize: float = 10,
+        halo: float = 8,
+        markercolor: str = None,
+        markeredgewidth: float = None,
+        **kwargs,
+    ):
+        super().__init__(x, y, marker="None", **kwargs)
+        self.dot_area = markersize
+        self.halo = halo
+        self.markercolor = markercolor
+        self.dot_edgewidth = (
+            plt.rcParams["patch.linewidth"]
+            if markeredgewidth is None
+            else markeredgewidth
+        )
+        self.dot = MarkerStyle("o")
+
+    def update_from(self, other: Line2D):
+        super().update_from(other)
+        for attr in ("dot_area", "halo", "markercolor", "dot_edgewidth", "dot"):
+            if hasattr(other, attr):
+                setattr(self, attr, getattr(other, attr))
+
+    @allow_rasterization
+    def draw(self, renderer):
+        if not self.get_visible():
+            return
+
+        super().draw(renderer)
+
+        tpath, affine = self._get_transformed_path().get_transformed_points_and_affine()
+        if not len(tpath.vertices):
+            return
+
+        color = self.markercolor or self.get_color()
+        renderer.open_group("tufteline", self.get_gid())
+        for area, rgba in (
+            (self.dot_area * self.halo, mcolors.to_rgba("white")),
+            (self.dot_area, mcolors.to_rgba(color)),
+        ):
+            gc = renderer.new_gc()
+            self._set_gc_clip(gc)
+            gc.set_url(self.get_url())
+            gc.set_linewidth(self.dot_edgewidth)
+            gc.set_antialiased(self._antialiased)
+            gc.set_foreground(rgba, isRGBA=True)
+            marker_trans = self.dot.get_transform().frozen().scale(
+                renderer.points_to_pixels(np.sqrt(area))
+            )
+            renderer.draw_markers(
+                gc, self.dot.get_path(), marker_trans, tpath, affine.frozen(), rgba
+            )
+            gc.restore()
+        renderer.close_group("tufteline")
 
 
 class Line(Plot):
     """
     Implements Plot class for line plot.
 
+    The "lttb" and "minmax" downsampling methods bucket the points in the
+    order they are given, so x must be sorted for them.
+
     Args:
         Plot: Plot class
 
@@ -30,6 +120,7 @@ class Line(Plot):
         Line(xlabel='xlabel', ylabel='ylabel', ax=<AxesSubplot:>, fontsize=18, figsize=(20, 10))
     """
 
+    @timed("plot")
     def plot(
         self,
         x: Union[str, Iterable],
@@ -41,31 +132,46 @@ class Line(Plot):
         alpha: float = 0.9,
         ticklabelsize: int = 10,
         markersize: int = 10,
+        downsample: Union[str, int] = None,
+        dtype: str = None,
         **kwargs,
     ):
-        x = self.fit(x, data)
-        y = self.fit(y, data)
-        _ = self.get_canvas({"x": x, "y": y, "pad": 0.05})
+        x = self.fit(x, data, dtype)
+        y = self.fit(y, data, dtype)
+        x_frame, y_frame = x, y
+        if isinstance(x, Chunks) or isinstance(y, Chunks):
+            # Out-of-core input is always reduced to the axes pixels
+            downsample = downsample or "minmax"
+            x, y, x_frame, y_frame = self.stream(x, y, downsample)
+
+        _ = self.get_canvas(
+            {
+                "x": x_frame,
+                "y": y_frame,
+                "pad": 0.05,
+                "ticklabelsize": ticklabelsize,
+            }
+        )
+        x, y = self.reduce(x, y, downsample)
 
         if linestyle == "tufte":
             # if kwargs:
             warnings.warn("Marker options are being ignored")
-            self.ax.plot(
-                x,
-                y,
-                linestyle="-",
-                linewidth=linewidth,
-                color=color,
-                alpha=alpha,
-                zorder=1,
-            )
-            self.ax.scatter(
-                x, y, marker="o", s=markersize * 8, color="white", zorder=2  # type: ignore
+            self.line = self.ax.add_line(
+                TufteLine(
+                    np.asarray(x).ravel(),
+                    np.asarray(y).ravel(),
+                    markersize=markersize,
+                    linestyle="-",
+                    linewidth=linewidth,
+                    color=color,
+                    alpha=alpha,
+                    zorder=1,
+                )
             )
-            self.ax.scatter(x, y, marker="o", s=markersize, color=color, zorder=3)  # type: ignore
 
         else:
-            self.ax.plot(
+            (self.line,) = self.ax.plot(
                 x,
                 y,
                 linestyle=linestyle,
@@ -76,8 +182,270 @@ class Line(Plot):
                 **kwargs,
             )
 
+        self.pad = 0.05
+        self.ticklabelsize = ticklabelsize
+        self._n = len(self.line.get_xdata())
+        self.rasterize_dense(self.line, self._n)
+        # Allocated on the first append, so that static plots hold no copy
+        self._buffer = None
+        self._tail = None
+        self._tail_dots = None
+        self._blank = None
+
+        return self.ax
+
+    @timed("append")
+    def append(
+        self,
+        x_new: Iterable,
+        y_new: Iterable,
+        blit: bool = True,
+        headroom: float = 0.25,
+    ) -> Axes:
+        """Appends samples to the plotted line and redraws incrementally.
+
+        Only the box around the new samples is repainted, on top of the
+        previous frame, with the samples of x sorted data whose marks reach
+        it. The result matches a full redraw up to the path simplification of
+        matplotlib, within a few levels of grey. The spine bounds and end ticks
+        are redrawn only when the min or max of the data change, and the limits
+        (with headroom) only when the data leave them. Samples next to the
+        spines and dashed lines are redrawn in full.
+
+        Args:
+            x_new (Iterable): New x values.
+            y_new (Iterable): New y values.
+            blit (bool, optional): Redraw through blitting when the canvas
+                supports it. Defaults to True.
+            headroom (float, optional): Extra padding, as a fraction of the data
+                range, added when the limits are recomputed. Defaults to 0.25.
+
+        Returns:
+            Axes: Figure container
+        """
+        if not hasattr(self, "line"):
+            raise RuntimeError("plot must be called before append")
+
+        x_new = as_values(x_new).astype(np.float64, copy=False)
+        y_new = as_values(y_new).astype(np.float64, copy=False)
+        start = self._n
+        self._extend(x_new, y_new)
+
+        changed = []
+        for axis, values in (("x", x_new), ("y", y_new)):
+            if axis not in self.frames:
+                continue
+
+            stats = self.frames[axis].merge(frame_stats(values))
+            if (stats.min, stats.max) != (self.frames[axis].min, self.frames[axis].max):
+                changed.append(axis)
+            self.frames[axis] = stats
+
+        canvas = self.fig.canvas
+        if not blit or not canvas.supports_blit or self._blank is None:
+            return self.update(headroom=headroom, draw=blit and canvas.supports_blit)
+
+        for axis in changed:
+            lower, upper = getattr(self.ax, f"get_{axis}lim")()
+            if self.frames[axis].min < lower or self.frames[axis].max > upper:
+                return self.update(headroom=headroom)
+
+        # The box around the new samples is repainted from the blank background
+        # with every sample whose marks reach it, in the order of a full draw,
+        # as drawing over the marks already there would blend them twice
+        renderer = canvas.get_renderer()
+        radius = self._get_mark_radius(renderer)
+        points = self.ax.transData.transform(self._buffer[max(start - 1, 0) : self._n])
+        points = points[np.isfinite(points).all(axis=1)]
+        lower = np.floor(points.min(axis=0, initial=np.inf) - radius)
+        upper = np.ceil(points.max(axis=0, initial=-np.inf) + radius)
+        reach = lower
+        if changed:
+            # The range frames are repainted from a few pixels into the axes
+            corner = [[self.frames["x"].min, self.frames["y"].min]]
+            reach = np.minimum(lower, self.ax.transData.transform(corner)[0] - radius)
+
+        left, bottom, right, top = self.ax.bbox.extents
+        margin = np.ceil(renderer.points_to_pixels(0.75)) + 1
+        if (
+            self.line.get_linestyle() not in ("-", "None")
+            or np.any(reach < (left + margin, bottom + margin))
+            or np.any(upper > (right, top))
+        ):
+            # Marks next to the spines, which the blank background does not
+            # have, and dashes, whose phase depends on all previous segments
+            canvas.draw()
+            return self.ax
+
+        if changed:
+            self._redraw_frame(changed)
+        if len(points):
+            self._redraw_tail(start, (*lower, *upper), radius)
+        canvas.blit(self.fig.bbox if changed else self.ax.bbox)
+
+        return self.ax
+
+    def update(self, headroom: float = 0.25, draw: bool = True) -> Axes:
+        """Recomputes the range frame and limits and redraws the whole figure.
+
+        Args:
+            headroom (float, optional): Extra padding, as a fraction of the data
+                range, so that appended samples fit in the limits. Defaults to 0.25.
+            draw (bool, optional): Draw the canvas and keep the frames needed for
+                blitting. Defaults to True.
+
+        Returns:
+            Axes: Figure container
+        """
+        for axis, stats in self.frames.items():
+            set_axis_frame(
+                self.ax,
+                axis,
+                stats,
+                pad=self.pad + headroom,
+                fontsize=self.ticklabelsize,
+            )
+
+        if not draw:
+            self.fig.canvas.draw_idle()
+            return self.ax
+
+        if self._tail is None:
+            # Segments, then halos and markers, of the samples next to the new
+            # ones, as two artists since Agg clips them differently
+            self._tail = self.ax.add_line(Line2D([], []))
+            self._tail.update_from(self.line)
+            self._tail.set_marker("None")
+            self._tail.set_animated(True)
+            self._tail_dots = self.ax.add_line(type(self.line)([], []))
+            self._tail_dots.update_from(self.line)
+            self._tail_dots.set_linestyle("None")
+            self._tail_dots.set_animated(True)
+
+        # Snapshot of the figure without data and range frame
+        decorations = [
+            self.line,
+            self.ax.xaxis,
+            self.ax.yaxis,
+            self.ax.spines["left"],
+            self.ax.spines["bottom"],
+        ]
+        visible = [artist.get_visible() for artist in decorations]
+        for artist in decorations:
+            artist.set_visible(False)
+        self.fig.canvas.draw()
+        self._blank = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+
+        for artist, is_visible in zip(decorations, visible):
+            artist.set_visible(is_visible)
+        self.fig.canvas.draw()
+
         return self.ax
 
+    def _extend(self, x_new: np.ndarray, y_new: np.ndarray):
+        n = self._n + len(x_new)
+        if self._buffer is None:
+            x, y = self.line.get_xdata(), self.line.get_ydata()
+            dtype = np.result_type(np.asarray(x).dtype, np.asarray(y).dtype)
+            self._buffer = np.empty(
+                (max(n, 2 * self._n), 2),
+                dtype=dtype if dtype.kind == "f" else np.float64,
+            )
+            self._buffer[: self._n, 0] = as_values(x)
+            self._buffer[: self._n, 1] = as_values(y)
+
+        elif n > len(self._buffer):
+            buffer = np.empty((max(n, 2 * len(self._buffer)), 2), self._buffer.dtype)
+            buffer[: self._n] = self._buffer[: self._n]
+            self._buffer = buffer
+
+        self._buffer[self._n : n, 0] = x_new
+        self._buffer[self._n : n, 1] = y_new
+        self._n = n
+        self.rasterize_dense(self.line, n)
+
+        # Line2D.set_data copies the whole series, so the line is pointed at
+        # views of the buffer and recached on its next full draw only
+        self.line._xorig = self._buffer[:n, 0]
+        self.line._yorig = self._buffer[:n, 1]
+        self.line._invalidx = self.line._invalidy = True
+        self.line.stale = True
+
+    def _redraw_tail(self, start: int, extents: tuple, radius: float):
+        x0, y0, x1, y1 = extents
+        # Restored regions and markers include their last row and column,
+        # while paths are clipped before them
+        height = self.fig.bbox.height
+        self.fig.canvas.restore_region(
+            self._blank, bbox=(x0, height - y1, x1 - 1, height - y0 - 1), xy=(0, 0)
+        )
+        first = max(self._get_near_start(max(start - 1, 0), 2 * radius) - 1, 0)
+        tail = self._buffer[first : self._n]
+        for artist, box in (
+            (self._tail, Bbox.from_extents(x0, y0, x1, y1)),
+            (self._tail_dots, Bbox.from_extents(x0, y0 + 1, x1 - 1, y1)),
+        ):
+            artist.set_data(tail[:, 0], tail[:, 1])
+            artist.set_clip_box(box)
+            self.ax.draw_artist(artist)
+
+    def _get_mark_radius(self, renderer) -> float:
+        """Pixels around a sample that its halo, marker and segments may cover"""
+        size = self.line.get_markersize()
+        if isinstance(self.line, TufteLine):
+            size = np.sqrt(self.line.dot_area * self.line.halo)
+            size += self.line.dot_edgewidth
+
+        return renderer.points_to_pixels(size / 2 + self.line.get_linewidth()) + 2
+
+    def _get_near_start(self, start: int, radius: float, window: int = 4096) -> int:
+        """First sample, at most window samples back, that lies within radius
+        pixels of the bounding box of the samples from start on
+
+        Samples of x sorted series are contiguous, so that the samples from
+        there on include every sample whose segments reach the box.
+        """
+        first = max(start - window, 0)
+        points = self.ax.transData.transform(self._buffer[first : self._n])
+        lower = np.nanmin(points[start - first :], axis=0) - radius
+        upper = np.nanmax(points[start - first :], axis=0) + radius
+        old = points[: start - first]
+        near = np.all((old >= lower) & (old <= upper), axis=1)
+
+        return first + int(np.argmax(near)) if near.any() else start
+
+    def _redraw_frame(self, axes: list):
+        for axis in axes:
+            set_axis_frame(
+                self.ax,
+                axis,
+                self.frames[axis],
+                fontsize=self.ticklabelsize,
+                limits=False,
+            )
+
+        # Keep the data drawn so far and repaint the range frame of the
+        # changed axes around it
+        canvas = self.fig.canvas
+        margin = np.ceil(canvas.get_renderer().points_to_pixels(0.75)) + 1
+        x0, y0, x1, y1 = self.ax.bbox.extents
+        width, height = self.fig.bbox.width, self.fig.bbox.height
+        # Regions of copied buffers are indexed from the top left corner
+        regions = {
+            "x": ((0, height - y0 - margin, width, height), "bottom"),
+            "y": ((0, 0, x0 + margin, height), "left"),
+        }
+        interior = canvas.copy_from_bbox(
+            Bbox.from_extents(x0 + margin, y0 + margin, x1 - margin, y1 - margin)
+        )
+        for axis in axes:
+            canvas.restore_region(self._blank, bbox=regions[axis][0], xy=(0, 0))
+        canvas.restore_region(interior)
+
+        for axis in axes:
+            self.ax.draw_artist(self.ax.spines[regions[axis][1]])
+            self.ax.draw_artist(getattr(self.ax, f"{axis}axis"))
+
     def set_line_spines(self):
         self.ax.spines["left"].set_linewidth(0.75)
         self.ax.spines["bottom"].set_linewidth(0.75)
@@ -106,9 +474,15 @@ def main(
     alpha: float = 0.9,
     ticklabelsize: int = 10,
     markersize: int = 10,
+    downsample: Union[str, int] = None,
+    dtype: str = None,
     figsize: tuple = (20, 10),
     fontsize: int = 12,
     ax: Axes = None,
+    dpi: float = None,
+    pool: FigurePool = None,
+    rasterize_above: int = RASTERIZE_ABOVE,
+    pyplot: bool = True,
     **kwargs,
 ):
     line = Line(
@@ -117,6 +491,10 @@ def main(
         figsize=figsize,
         fontsize=fontsize,
         ax=ax,
+        dpi=dpi,
+        pool=pool,
+        rasterize_above=rasterize_above,
+        pyplot=pyplot,
     )
     line.set_plot_title(title)
 
@@ -130,5 +508,7 @@ def main(
         alpha=alpha,
         ticklabelsize=ticklabelsize,
         markersize=markersize,
+        downsample=downsample,
+        dtype=dtype,
         **kwargs,
     )
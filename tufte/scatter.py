@@ -1,23 +1,36 @@
-import sys
 import warnings
-from pathlib import Path
+from collections.abc import Iterator
+from dataclasses import replace
 from typing import Iterable, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.colors import LinearSegmentedColormap, LogNorm
 
-PROJECT_ROOT = Path.cwd().resolve().parent
-sys.path.append(str(PROJECT_ROOT))
+from tufte.base import RASTERIZE_ABOVE, FigurePool, FrameStats, Plot, frame_stats
+from tufte.downsample import density, occupancy
+from tufte.instrument import timed
+from tufte.stream import Chunks, iter_columns
 
-from tufte.base import Plot
+MODES = ("points", "density")
+# Light grey for a single point, so that sparse cells remain visible on white
+DENSITY_CMAP = LinearSegmentedColormap.from_list(
+    "tufte_density", ["#c8c8c8", "black"]
+)
+# Length of the dot-dash rug ticks, in points
+RUG_LENGTH = 6
 
 
 class Scatter(Plot):
     """
     Implements Plot class for line plot.
 
+    Points are downsampled to one per pixel ("pixel"), the other methods being
+    meant for series sorted by x.
+
     Args:
         Plot: Plot class.
 
@@ -30,6 +43,7 @@ class Scatter(Plot):
         Scatter(xlabel='xlabel', ylabel='ylabel', ax=<AxesSubplot:>, fontsize=18, figsize=(20, 10))
     """
 
+    @timed("plot")
     def plot(
         self,
         x: Union[str, Iterable],
@@ -41,16 +55,62 @@ class Scatter(Plot):
         alpha: float = 0.9,
         ticklabelsize: int = 10,
         markersize: int = 10,
+        downsample: Union[str, int] = None,
+        dtype: str = None,
+        mode: str = "points",
+        bins: Union[int, tuple] = None,
+        dotdash: bool = False,
+        limits: tuple = None,
         **kwargs,
     ):
-        x = self.fit(x, data)
-        y = self.fit(y, data)
-        _ = self.get_canvas({"x": x, "y": y, "pad": 0.05})
+        if mode not in MODES:
+            raise ValueError(f"Expected mode to be one of {MODES}. Got {mode}")
+
+        if downsample not in (None, "pixel"):
+            # LTTB and min/max buckets are ranges of a series sorted by x, and
+            # would keep only the edges of a point cloud
+            raise ValueError(
+                f"Expected downsample to be one of {(None, 'pixel')}. Got {downsample}"
+            )
+
+        x = self.fit(x, data, dtype)
+        y = self.fit(y, data, dtype)
+        if mode == "density":
+            return self.plot_density(
+                x,
+                y,
+                ticklabelsize=ticklabelsize,
+                bins=bins,
+                dotdash=dotdash,
+                limits=limits,
+            )
+
+        x_frame, y_frame = x, y
+        if isinstance(x, Chunks) or isinstance(y, Chunks):
+            # Out-of-core input is always reduced to the axes pixels
+            downsample = downsample or "pixel"
+            x, y, x_frame, y_frame = self.stream(x, y, downsample)
+
+        _ = self.get_canvas(
+            {
+                "x": x_frame,
+                "y": y_frame,
+                "pad": 0.05,
+                "ticklabelsize": ticklabelsize,
+            }
+        )
+        if dotdash:
+            width, height = self.get_pixel_size()
+            self.plot_rugs(
+                occupancy(x, self.ax.get_xlim(), width),
+                occupancy(y, self.ax.get_ylim(), height),
+            )
+        x, y = self.reduce(x, y, downsample)
 
         if linestyle == "tufte":
             # if kwargs:
             warnings.warn("Marker options are being ignored")
-            self.ax.scatter(
+            points = self.ax.scatter(
                 x,
                 y,
                 marker="o",
@@ -60,9 +120,171 @@ class Scatter(Plot):
                 alpha=alpha,
                 zorder=1,
             )
+            self.rasterize_dense(points, len(points.get_offsets()))
+
+        return self.ax
+
+    def plot_density(
+        self,
+        x: Union[Iterable, Chunks],
+        y: Union[Iterable, Chunks],
+        ticklabelsize: int = 10,
+        bins: Union[int, tuple] = None,
+        dotdash: bool = False,
+        limits: tuple = None,
+    ):
+        """Draws the number of points per cell of a grid as one greyscale image.
+
+        The range frame spans the true extent of the data, and the counts are
+        shown on a logarithmic scale so that isolated points stay visible.
+        Chunked input is read twice, first for its extent, unless the limits
+        are given.
+
+        Args:
+            x (Union[Iterable, Chunks]): x values.
+            y (Union[Iterable, Chunks]): y values.
+            ticklabelsize (int, optional): Tick label font size. Defaults to 10.
+            bins (Union[int, tuple], optional): Number of columns and rows, or
+                one number for both. Defaults to None (one cell per pixel).
+            dotdash (bool, optional): Replace the spines with rugs of the
+                occupied cells. Defaults to False.
+            limits (tuple, optional): ((xmin, xmax), (ymin, ymax)) range of the
+                values. Given limits let chunked input be read in a single pass,
+                which iterators such as read_csv(chunksize=...) require. Points
+                outside the axes are not counted. Defaults to None (the extent
+                of the values).
+
+        Raises:
+            ValueError: If chunked input would have to be read twice from an
+                iterator.
+
+        Returns:
+            Axes: Figure container
+        """
+        chunked = isinstance(x, Chunks) or isinstance(y, Chunks)
+        if limits is not None:
+            # The counted points are only known after the pass
+            x_frame, y_frame = (
+                FrameStats(min=lower, max=upper, is_int=False, count=1)
+                for lower, upper in limits
+            )
+
+        elif chunked:
+            if any(
+                isinstance(values, Chunks) and isinstance(values.source, Iterator)
+                for values in (x, y)
+            ):
+                raise ValueError(
+                    "Density mode reads chunked iterators twice unless limits are"
+                    " given. Pass limits, a path or an array"
+                )
+
+            x_frame, y_frame = FrameStats(), FrameStats()
+            for x_chunk, y_chunk in iter_columns(x, y):
+                x_frame = x_frame.merge(frame_stats(x_chunk))
+                y_frame = y_frame.merge(frame_stats(y_chunk))
+
+        else:
+            x_frame, y_frame = x, y
+
+        self.get_canvas(
+            {
+                "x": x_frame,
+                "y": y_frame,
+                "pad": 0.05,
+                "ticklabelsize": ticklabelsize,
+            }
+        )
+
+        if bins is None:
+            width, height = self.get_pixel_size()
+        else:
+            width, height = np.broadcast_to(bins, 2)
+
+        xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
+        counts = None
+        for x_chunk, y_chunk in iter_columns(x, y) if chunked else [(x, y)]:
+            counts = density(
+                np.asarray(x_chunk),
+                np.asarray(y_chunk),
+                xlim,
+                ylim,
+                width,
+                height,
+                counts=counts,
+            )
+
+        self.image = self.ax.imshow(
+            np.ma.masked_equal(counts, 0),
+            extent=(*xlim, *ylim),
+            origin="lower",
+            aspect="auto",
+            interpolation="nearest",
+            cmap=DENSITY_CMAP,
+            norm=LogNorm(vmin=1, vmax=max(counts.max(), 1)),
+            zorder=1,
+        )
+        # The image must not move the range frame limits
+        self.ax.set(xlim=xlim, ylim=ylim)
+        if limits is not None:
+            count = int(counts.sum())
+            self.frames = {
+                axis: replace(frame, count=count)
+                for axis, frame in self.frames.items()
+            }
+        if dotdash:
+            self.plot_rugs(counts.any(axis=0), counts.any(axis=1))
 
         return self.ax
 
+    def plot_rugs(self, x_occupied: np.ndarray, y_occupied: np.ndarray):
+        """Replaces the spines with marginal rugs of the values (dot-dash plot)
+
+        Each rug marks the occupied pixels of its axis once, as a single
+        LineCollection in the colour and width of the spines, so that its cost
+        depends on the size of the axes rather than on the number of points.
+
+        Args:
+            x_occupied (np.ndarray): Whether each column of the x limits holds
+                a value, see tufte.downsample.occupancy.
+            y_occupied (np.ndarray): Whether each row of the y limits holds a
+                value.
+        """
+        width, height = self.get_pixel_size()
+        length = RUG_LENGTH * self.ax.figure.dpi / 72
+        self.rugs = {}
+        for axis, occupied, lim, size in (
+            ("x", x_occupied, self.ax.get_xlim(), height),
+            ("y", y_occupied, self.ax.get_ylim(), width),
+        ):
+            spine = self.ax.spines["bottom" if axis == "x" else "left"]
+            # Pixel centres, in data coordinates
+            positions = lim[0] + (np.flatnonzero(occupied) + 0.5) * (
+                (lim[1] - lim[0]) / len(occupied)
+            )
+            along = np.broadcast_to(positions[:, np.newaxis], (len(positions), 2))
+            across = np.broadcast_to([0, length / size], along.shape)
+            # (n, 2, 2) segments from the spine inwards, (data, axes) for x
+            segments = np.stack(
+                [along, across] if axis == "x" else [across, along], axis=-1
+            )
+
+            rug = LineCollection(
+                segments,
+                colors=spine.get_edgecolor(),
+                linewidths=spine.get_linewidth(),
+                transform=(
+                    self.ax.get_xaxis_transform()
+                    if axis == "x"
+                    else self.ax.get_yaxis_transform()
+                ),
+            )
+            self.ax.add_collection(rug, autolim=False)
+            self.rugs[axis] = rug
+            # The rug is the axis: its labels keep their place, without ticks
+            spine.set_visible(False)
+            self.ax.tick_params(axis=axis, length=0)
+
     def set_scatter_spines(self):
         self.ax.spines["left"].set_linewidth(0.75)
         self.ax.spines["bottom"].set_linewidth(0.75)
@@ -91,9 +313,19 @@ def main(
     alpha: float = 0.9,
     ticklabelsize: int = 10,
     markersize: int = 10,
+    downsample: Union[str, int] = None,
+    dtype: str = None,
+    mode: str = "points",
+    bins: Union[int, tuple] = None,
+    dotdash: bool = False,
+    limits: tuple = None,
     figsize: tuple = (20, 10),
     fontsize: int = 12,
     ax: Axes = None,
+    dpi: float = None,
+    pool: FigurePool = None,
+    rasterize_above: int = RASTERIZE_ABOVE,
+    pyplot: bool = True,
     **kwargs,
 ):
     scatter = Scatter(
@@ -102,6 +334,10 @@ def main(
         figsize=figsize,
         fontsize=fontsize,
         ax=ax,
+        dpi=dpi,
+        pool=pool,
+        rasterize_above=rasterize_above,
+        pyplot=pyplot,
     )
     scatter.set_plot_title(title)
 
@@ -115,5 +351,11 @@ def main(
         alpha=alpha,
         ticklabelsize=ticklabelsize,
         markersize=markersize,
+        downsample=downsample,
+        dtype=dtype,
+        mode=mode,
+        bins=bins,
+        dotdash=dotdash,
+        limits=limits,
         **kwargs,
     )
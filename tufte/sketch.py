@@ -0,0 +1,163 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+from tufte.base import FrameStats, as_values, frame_stats
+
+
+class QuantileSketch:
+    """Mergeable streaming quantile sketch (KLL).
+
+    Values are added in chunks with `update` and partial sketches built on
+    different workers are combined with `merge`. Memory is bounded by roughly
+    3k values regardless of the number of samples, while min, max, mean and
+    standard deviation are tracked exactly.
+
+    Args:
+        k (int, optional): Accuracy parameter. The rank error is about 1.7 / k.
+            Defaults to 200.
+        seed (int, optional): Seed of the compaction coin flips. Defaults to None.
+
+    Example:
+        >>> sketch = QuantileSketch()
+        >>> for chunk in np.array_split(np.arange(1000), 10):
+        ...     sketch.update(chunk)
+        >>> sketch.count
+        1000
+    """
+
+    C = 2 / 3
+
+    def __init__(self, k: int = 200, seed: int = None):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.stats = FrameStats()
+        self.mean = 0.0
+        self.m2 = 0.0
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable, **kwargs) -> "QuantileSketch":
+        """Build a sketch from an iterable of arrays.
+
+        Args:
+            chunks (Iterable): Arrays, Series or DataFrames.
+
+        Returns:
+            QuantileSketch: Sketch of all chunks.
+        """
+        sketch = cls(**kwargs)
+        for chunk in chunks:
+            sketch.update(chunk)
+
+        return sketch
+
+    @property
+    def count(self) -> int:
+        return self.stats.count
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / self.count)) if self.count else np.nan
+
+    def update(self, values: Iterable) -> "QuantileSketch":
+        """Add a chunk of values. Non-finite values are ignored.
+
+        Args:
+            values (Iterable): Chunk of values.
+
+        Returns:
+            QuantileSketch: The sketch itself.
+        """
+        values = as_values(values).astype(np.float64, copy=False)
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return self
+
+        mean = values.mean()
+        m2 = np.square(values - mean).sum()
+        self._merge_moments(frame_stats(values), mean, m2)
+        self.levels[0] = np.concatenate((self.levels[0], values))
+        self._compress()
+
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Add the values summarised by another sketch.
+
+        Args:
+            other (QuantileSketch): Sketch to be merged in place into this one.
+
+        Returns:
+            QuantileSketch: The sketch itself.
+        """
+        if other.count == 0:
+            return self
+
+        self._merge_moments(other.stats, other.mean, other.m2)
+        for h, level in enumerate(other.levels):
+            if h == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = np.concatenate((self.levels[h], level))
+        self._compress()
+
+        return self
+
+    def quantile(self, q):
+        """Approximate quantiles. The 0 and 1 quantiles are exact.
+
+        Args:
+            q: Quantile or sequence of quantiles in [0, 1].
+
+        Returns:
+            Quantile values with the shape of q.
+        """
+        q = np.asarray(q, dtype=np.float64)
+        if self.count == 0:
+            return np.full(q.shape, np.nan)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level), 2**h) for h, level in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        ranks = np.cumsum(weights[order])
+        indices = np.searchsorted(ranks, q * ranks[-1], side="left")
+        result = items[np.clip(indices, 0, len(items) - 1)]
+        result = np.where(q <= 0, self.stats.min, result)
+        result = np.where(q >= 1, self.stats.max, result)
+
+        return result if result.ndim else result.item()
+
+    def _merge_moments(self, stats: FrameStats, mean: float, m2: float):
+        # Chan et al. parallel variance update
+        n_a, n_b = self.count, stats.count
+        n = n_a + n_b
+        delta = mean - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2 + delta**2 * n_a * n_b / n
+        self.stats = self.stats.merge(stats)
+
+    def _capacity(self, h: int) -> int:
+        depth = len(self.levels) - h - 1
+        return max(int(np.ceil(self.k * self.C**depth)), 2)
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) <= self._capacity(h):
+                h += 1
+                continue
+
+            if h + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+
+            level = np.sort(level)
+            # An odd item out stays at this level
+            keep = level[len(level) - len(level) % 2 :]
+            promoted = level[self._rng.integers(2) : len(level) - len(keep) : 2]
+            self.levels[h] = keep
+            self.levels[h + 1] = np.concatenate((self.levels[h + 1], promoted))
+            h = 0
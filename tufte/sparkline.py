@@ -0,0 +1,264 @@
+import base64
+import io
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+from matplotlib import colors as mcolors
+from matplotlib.backends.backend_agg import RendererAgg
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D, IdentityTransform
+
+from tufte.base import as_values
+from tufte.downsample import downsample
+
+FORMATS = ("png", "svg")
+MARKERS = ("min", "max", "last")
+MARKER_COLORS = {"min": "#1f5fa8", "max": "#1f5fa8", "last": "#d62728"}
+MIME_TYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+
+class Sparklines:
+    """Renders word-sized line charts in bulk, without figures or axes.
+
+    Every series is drawn straight onto one reused Agg renderer (PNG), or
+    written as an SVG polyline, so a sparkline costs a path and a PNG
+    encoding instead of a whole Canvas. Series longer than twice the width
+    are reduced to the minimum and maximum of each pixel column first.
+
+    Args:
+        width (int, optional): Width in pixels. Defaults to 100.
+        height (int, optional): Height in pixels. Defaults to 20.
+        color (str, optional): Line colour. Defaults to "black".
+        linewidth (float, optional): Line width in pixels. Defaults to 1.
+        markers (Iterable[str], optional): Points to mark among "min", "max"
+            and "last". Defaults to MARKERS.
+        markersize (float, optional): Marker diameter in pixels. Defaults to 3.
+        scale (float, optional): Pixels per CSS pixel of PNG output, e.g. 2 for
+            high density screens. Defaults to 1.
+
+    Example:
+        >>> renderer = Sparklines(width=80, height=16)
+        >>> uris = renderer.render([[1, 3, 2], [4, 1, 5]], uri=True)
+        >>> uris[0][:22]
+        'data:image/png;base64,'
+    """
+
+    def __init__(
+        self,
+        width: int = 100,
+        height: int = 20,
+        color: str = "black",
+        linewidth: float = 1.0,
+        markers: Iterable[str] = MARKERS,
+        markersize: float = 3.0,
+        scale: float = 1.0,
+    ):
+        unknown = set(markers) - set(MARKERS)
+        if unknown:
+            raise ValueError(f"Expected markers among {MARKERS}. Got {unknown}")
+
+        self.width = width
+        self.height = height
+        self.color = color
+        self.linewidth = linewidth
+        self.markers = tuple(markers)
+        self.markersize = markersize
+        self.scale = scale
+        # Room for the line and markers at the edges
+        self.margin = max(markersize, linewidth) / 2 + 0.5
+        self._renderer = None
+
+    def get_points(self, values: Iterable) -> tuple:
+        """Position a series and its marked points in the box of a sparkline
+
+        Args:
+            values (Iterable): Values of the series.
+
+        Returns:
+            tuple: (n, 2) array of the pixel positions of the line, y upwards,
+                and a dict of the pixel position of each marked point.
+        """
+        y = as_values(values)
+        x = np.arange(y.size, dtype=np.float64)
+        mask = np.isfinite(y)
+        if not mask.all():
+            x, y = x[mask], y[mask]
+        if y.size == 0:
+            return np.empty((0, 2)), {}
+
+        ends = {"min": np.argmin(y), "max": np.argmax(y), "last": y.size - 1}
+        marked = np.array([[x[ends[name]], y[ends[name]]] for name in self.markers])
+        xlim, ylim = (x[0], x[-1]), (y[ends["min"]], y[ends["max"]])
+        x, y = downsample(x, y, "minmax", 2 * int(self.width))
+
+        points = np.stack([x, y], axis=-1)
+        if len(marked):
+            points = np.concatenate((points, marked))
+        for axis, (lower, upper), size in zip(
+            range(2), (xlim, ylim), (self.width, self.height)
+        ):
+            if upper == lower:
+                points[:, axis] = size / 2
+                continue
+            points[:, axis] = self.margin + (points[:, axis] - lower) / (
+                upper - lower
+            ) * (size - 2 * self.margin)
+
+        return points[: len(x)], dict(zip(self.markers, points[len(x) :]))
+
+    def to_png(self, values: Iterable) -> bytes:
+        """Render a series as PNG
+
+        Args:
+            values (Iterable): Values of the series.
+
+        Returns:
+            bytes: PNG image with a transparent background.
+        """
+        from PIL import Image
+
+        width = int(round(self.width * self.scale))
+        height = int(round(self.height * self.scale))
+        if self._renderer is None or (
+            (self._renderer.width, self._renderer.height) != (width, height)
+        ):
+            # 72 dpi, so that points are pixels
+            self._renderer = RendererAgg(width, height, 72)
+        renderer = self._renderer
+        renderer.clear()
+
+        points, marked = self.get_points(values)
+        transform = Affine2D().scale(self.scale)
+        gc = renderer.new_gc()
+        gc.set_antialiased(True)
+        gc.set_capstyle("round")
+        gc.set_joinstyle("round")
+        if len(points) > 1:
+            gc.set_linewidth(self.linewidth * self.scale)
+            gc.set_foreground(self.color)
+            renderer.draw_path(gc, Path(points), transform)
+
+        gc.set_linewidth(0)
+        dot = Path.unit_circle()
+        dot_transform = Affine2D().scale(self.markersize * self.scale / 2)
+        for name, point in marked.items():
+            rgba = mcolors.to_rgba(MARKER_COLORS[name])
+            gc.set_foreground(rgba, isRGBA=True)
+            renderer.draw_markers(
+                gc,
+                dot,
+                dot_transform,
+                Path(transform.transform(point[np.newaxis])),
+                IdentityTransform(),
+                rgba,
+            )
+        gc.restore()
+
+        buffer = io.BytesIO()
+        Image.frombuffer(
+            "RGBA", (width, height), renderer.buffer_rgba(), "raw", "RGBA", 0, 1
+        ).save(buffer, format="png")
+
+        return buffer.getvalue()
+
+    def to_svg(self, values: Iterable) -> str:
+        """Render a series as an SVG document
+
+        Args:
+            values (Iterable): Values of the series.
+
+        Returns:
+            str: SVG element, sized in pixels.
+        """
+        points, marked = self.get_points(values)
+        # SVG y axis points down
+        points[:, 1] = self.height - points[:, 1]
+        marked = {name: (x, self.height - y) for name, (x, y) in marked.items()}
+
+        elements = []
+        if len(points) > 1:
+            coordinates = " ".join(np.char.mod("%.1f", points).ravel())
+            elements.append(
+                f'<polyline points="{coordinates}" fill="none"'
+                f' stroke="{mcolors.to_hex(self.color)}"'
+                f' stroke-width="{self.linewidth:g}"'
+                ' stroke-linejoin="round" stroke-linecap="round"/>'
+            )
+        for name, point in marked.items():
+            elements.append(
+                f'<circle cx="{point[0]:.1f}" cy="{point[1]:.1f}"'
+                f' r="{self.markersize / 2:g}" fill="{MARKER_COLORS[name]}"/>'
+            )
+
+        return (
+            '<svg xmlns="http://www.w3.org/2000/svg"'
+            f' width="{self.width}" height="{self.height}"'
+            f' viewBox="0 0 {self.width} {self.height}">{"".join(elements)}</svg>'
+        )
+
+    def render(
+        self,
+        series: Iterable[Iterable],
+        format: str = "png",
+        uri: bool = False,
+    ) -> list:
+        """Render every series
+
+        Args:
+            series (Iterable[Iterable]): Series, or a DataFrame with one series
+                per column.
+            format (str, optional): Either "png" or "svg". Defaults to "png".
+            uri (bool, optional): Return base64 data URIs, e.g. for the src of
+                img elements. Defaults to False.
+
+        Raises:
+            ValueError: If the format is unknown.
+
+        Returns:
+            list: PNG bytes or SVG strings, or data URIs, one per series.
+        """
+        if format not in FORMATS:
+            raise ValueError(f"Expected format to be one of {FORMATS}. Got {format}")
+
+        if isinstance(series, pd.DataFrame):
+            series = (series[column] for column in series.columns)
+
+        draw = self.to_png if format == "png" else self.to_svg
+        images = [draw(values) for values in series]
+        if not uri:
+            return images
+
+        prefix = f"data:{MIME_TYPES[format]};base64,"
+        return [
+            prefix
+            + base64.b64encode(
+                image if isinstance(image, bytes) else image.encode()
+            ).decode()
+            for image in images
+        ]
+
+
+def sparklines(
+    series: Iterable[Iterable],
+    format: str = "png",
+    uri: bool = False,
+    width: int = 100,
+    height: int = 20,
+    color: str = "black",
+    linewidth: float = 1.0,
+    markers: Iterable[str] = MARKERS,
+    markersize: float = 3.0,
+    scale: float = 1.0,
+) -> list:
+    renderer = Sparklines(
+        width=width,
+        height=height,
+        color=color,
+        linewidth=linewidth,
+        markers=markers,
+        markersize=markersize,
+        scale=scale,
+    )
+
+    return renderer.render(series, format=format, uri=uri)
@@ -0,0 +1,309 @@
+from collections.abc import Generator, Iterator
+from itertools import chain, islice
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from tufte.base import BLOCK_SIZE, FrameStats, frame_stats
+from tufte.downsample import downsample, pixel
+
+CHUNK_SIZE = 2**20
+SUFFIXES = (".npy", ".csv", ".parquet", ".pq")
+
+
+def is_chunked(source) -> bool:
+    """Whether a source is read in chunks instead of being held in memory.
+
+    Chunked sources are memory-mapped arrays, paths to .npy, .csv or .parquet
+    files, and iterators such as the reader returned by
+    pd.read_csv(..., chunksize=n) or a generator of arrays.
+
+    Args:
+        source: Data source.
+
+    Returns:
+        bool: Whether the source is chunked.
+    """
+    if isinstance(source, Chunks | np.memmap):
+        return True
+
+    if isinstance(source, str | Path):
+        return Path(source).suffix.lower() in SUFFIXES
+
+    return isinstance(source, Iterator)
+
+
+def _read_parquet(path: Path, columns: list, chunksize: int) -> Generator:
+    try:
+        import pyarrow.parquet as pq
+
+    except ImportError as error:
+        raise ImportError("Reading parquet files requires pyarrow") from error
+
+    for batch in pq.ParquetFile(path).iter_batches(
+        batch_size=chunksize, columns=columns
+    ):
+        yield {
+            name: batch.column(name).to_numpy(zero_copy_only=False)
+            for name in batch.schema.names
+        }
+
+
+def _split(array, columns: list, chunksize: int) -> Generator:
+    for start in range(0, len(array), chunksize):
+        block = array[start : start + chunksize]
+        if columns is None or block.dtype.names is None:
+            yield {None: np.asarray(block)}
+
+        else:
+            yield {name: np.asarray(block[name]) for name in columns}
+
+
+def _batched(first, items: Iterator, columns: list, chunksize: int) -> Generator:
+    # A generator of scalars is batched instead of yielding 0-d chunks
+    if np.ndim(first) == 0:
+        items = chain([first], items)
+        while block := list(islice(items, chunksize)):
+            yield {None: np.asarray(block)}
+        return
+
+    for item in chain([first], items):
+        if isinstance(item, pd.DataFrame):
+            if columns is None or None in columns:
+                raise ValueError(
+                    "Tables are read by column: pass data=reader and a column"
+                    " name. Got no column"
+                )
+
+            yield {name: item[name].to_numpy() for name in columns or item.columns}
+
+        elif isinstance(item, dict):
+            yield {name: np.asarray(item[name]) for name in columns or item}
+
+        else:
+            yield {None: np.asarray(item)}
+
+
+def iter_frames(
+    source,
+    columns: list = None,
+    chunksize: int = CHUNK_SIZE,
+) -> Generator[dict, None, None]:
+    """Read a chunked source one block of rows at a time.
+
+    Args:
+        source: Chunked source, see is_chunked.
+        columns (list, optional): Columns to read. Defaults to None (the values
+            of a column-less source).
+        chunksize (int, optional): Rows per chunk of sources that are not
+            already chunked. Defaults to CHUNK_SIZE.
+
+    Raises:
+        ValueError: If the file format is not supported, or if a table is read
+            without column names.
+
+    Yields:
+        dict: Arrays of a chunk of rows, by column name. Column-less sources
+            use the key None.
+    """
+    if isinstance(source, str | Path):
+        path = Path(source)
+        suffix = path.suffix.lower()
+        if suffix in SUFFIXES[1:] and (columns is None or None in columns):
+            raise ValueError(
+                f"Tables are read by column: pass data={path.name!r} and a column"
+                " name. Got no column"
+            )
+
+        if suffix == ".npy":
+            yield from _split(np.load(path, mmap_mode="r"), columns, chunksize)
+
+        elif suffix == ".csv":
+            for frame in pd.read_csv(path, usecols=columns, chunksize=chunksize):
+                yield {name: frame[name].to_numpy() for name in frame.columns}
+
+        elif suffix in (".parquet", ".pq"):
+            yield from _read_parquet(path, columns, chunksize)
+
+        else:
+            raise ValueError(f"Expected one of {SUFFIXES} files. Got {path.name}")
+
+    elif isinstance(source, np.ndarray):
+        yield from _split(source, columns, chunksize)
+
+    else:
+        items = iter(source)
+        first = next(items, None)
+        if first is not None:
+            yield from _batched(first, items, columns, chunksize)
+
+
+class Chunks:
+    """Lazy column of a chunked source.
+
+    Columns of the same source are read together by iter_columns, so that
+    a file or a reader is scanned only once.
+
+    Args:
+        source: Chunked source, see is_chunked.
+        column (str, optional): Column of the source. Defaults to None.
+        chunksize (int, optional): Rows per chunk. Defaults to CHUNK_SIZE.
+
+    Example:
+        >>> chunks = Chunks(pd.read_csv("log.csv", chunksize=10**6), "latency")
+        >>> stats = frame_stats(chunks.to_numpy())
+    """
+
+    def __init__(self, source, column: str = None, chunksize: int = CHUNK_SIZE):
+        self.source = source
+        self.column = column
+        self.chunksize = chunksize
+
+    def __iter__(self) -> Generator[np.ndarray, None, None]:
+        for (values,) in iter_columns(self):
+            yield values
+
+    def same_source(self, other: "Chunks") -> bool:
+        if isinstance(self.source, str | Path) and isinstance(
+            other.source, str | Path
+        ):
+            return Path(self.source) == Path(other.source)
+
+        return self.source is other.source
+
+    def to_numpy(self) -> np.ndarray:
+        """Concatenate all chunks. Use only when the result fits in memory.
+
+        Returns:
+            np.ndarray: Values of the column.
+        """
+        return np.concatenate(list(self) or [np.empty(0)])
+
+
+def iter_columns(*columns) -> Generator[tuple, None, None]:
+    """Read several columns in aligned chunks, scanning each source once.
+
+    Args:
+        *columns: Chunks, or in-memory arrays which are sliced alongside.
+
+    Yields:
+        tuple: One array per column, all of the same length.
+    """
+    sources = []
+    for column in columns:
+        if not isinstance(column, Chunks):
+            continue
+        if not any(column.same_source(source) for source in sources):
+            sources.append(column)
+
+    readers = []
+    for source in sources:
+        names = [
+            column.column
+            for column in columns
+            if isinstance(column, Chunks) and column.same_source(source)
+        ]
+        names = None if names == [None] else list(dict.fromkeys(names))
+        readers.append(iter_frames(source.source, names, source.chunksize))
+
+    def locate(column):
+        for source, reader in zip(sources, readers):
+            if column.same_source(source):
+                return reader, column.column
+
+    lookup = [
+        locate(column) if isinstance(column, Chunks) else None for column in columns
+    ]
+    pending = [{} for _ in readers]
+    offset = 0
+    while True:
+        # Top up every reader until all have rows left, then cut to the shortest
+        for i, reader in enumerate(readers):
+            if not pending[i] or len(next(iter(pending[i].values()))) == 0:
+                frame = next(reader, None)
+                if frame is None:
+                    return
+                pending[i] = frame
+
+        length = min(len(next(iter(frame.values()))) for frame in pending)
+        chunk = []
+        for column, found in zip(columns, lookup):
+            if found is None:
+                chunk.append(np.asarray(column)[offset : offset + length])
+                continue
+
+            frame = pending[readers.index(found[0])]
+            chunk.append(frame[found[1]][:length])
+
+        for i, frame in enumerate(pending):
+            pending[i] = {name: values[length:] for name, values in frame.items()}
+
+        offset += length
+        yield tuple(chunk)
+
+
+def reduce_chunks(
+    chunks: Iterator,
+    method: Union[str, int],
+    width: int,
+    height: int,
+    factor: int = 4,
+) -> tuple:
+    """Compute the range frames and the draw data of x and y in one pass.
+
+    Every chunk is downsampled as soon as it is read and the reduced points
+    are compacted again whenever they exceed factor times the target size,
+    so that memory is bounded by the chunk size and the axes size in pixels.
+
+    Args:
+        chunks (Iterator): Aligned chunks of x and y, see iter_columns.
+        method (Union[str, int]): "lttb", "minmax", "pixel" or a LTTB target
+            number of points.
+        width (int): Axes width in pixels.
+        height (int): Axes height in pixels.
+        factor (int, optional): Reduced points kept before compacting, relative
+            to the target size. Defaults to 4.
+
+    Returns:
+        tuple: Reduced x and y, and the FrameStats of all x and y values.
+    """
+    if isinstance(method, int | np.integer) and not isinstance(method, bool):
+        n_out = int(method)
+
+    elif method == "pixel":
+        n_out = int(width) * int(height)
+
+    else:
+        n_out = int(width) * (2 if method == "minmax" else 1)
+
+    def compact(x, y, xstats, ystats):
+        if method != "pixel":
+            return downsample(x, y, method, n_out)
+
+        mask = np.isfinite(x) & np.isfinite(y)
+        x, y = x[mask], y[mask]
+        indices = pixel(
+            x, y, (xstats.min, xstats.max), (ystats.min, ystats.max), width, height
+        )
+        return x[indices], y[indices]
+
+    xstats, ystats = FrameStats(), FrameStats()
+    xs, ys, size = [], [], 0
+    for x, y in chunks:
+        xstats = xstats.merge(frame_stats(x, BLOCK_SIZE))
+        ystats = ystats.merge(frame_stats(y, BLOCK_SIZE))
+        x, y = compact(x, y, xstats, ystats)
+        xs.append(x)
+        ys.append(y)
+        size += len(x)
+
+        if size > factor * n_out:
+            x, y = compact(np.concatenate(xs), np.concatenate(ys), xstats, ystats)
+            xs, ys, size = [x], [y], len(x)
+
+    x = np.concatenate(xs) if xs else np.empty(0)
+    y = np.concatenate(ys) if ys else np.empty(0)
+
+    return x, y, xstats, ystats
@@ -0,0 +1,117 @@
+import threading
+from collections.abc import Iterable
+from functools import lru_cache
+
+import numpy as np
+from matplotlib.font_manager import FontProperties
+
+CACHE_SIZE = 2**16
+# Labels measured to find the widest of many, longest first
+MAX_CANDIDATES = 64
+
+_lock = threading.Lock()
+_label = None
+
+
+def get_font(fontsize: float | str = None, family: str = None) -> FontProperties:
+    """Font of a label, defaulting to the rcParams font
+
+    Args:
+        fontsize (float | str, optional): Size in points, or a relative size
+            such as "small". Defaults to None (rcParams["font.size"]).
+        family (str, optional): Font family. Defaults to None
+            (rcParams["font.family"]).
+
+    Returns:
+        FontProperties: Font.
+    """
+    return FontProperties(family=family, size=fontsize)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _measure(text: str, font: FontProperties, dpi: float) -> tuple:
+    global _label
+
+    with _lock:
+        if _label is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            figure = Figure(figsize=(1, 1))
+            FigureCanvasAgg(figure)
+            _label = figure.text(0, 0, "")
+
+        figure = _label.get_figure()
+        figure.set_dpi(dpi)
+        _label.set_text(text)
+        _label.set_fontproperties(font)
+        extent = _label.get_window_extent(figure.canvas.get_renderer())
+
+    return extent.width, extent.height
+
+
+def text_extent(
+    text: str,
+    fontsize: float | str = None,
+    family: str = None,
+    dpi: float = 72,
+) -> tuple:
+    """Size of a label, cached by string, font, size and resolution
+
+    The first measurement of a label lays it out as a matplotlib Text at dpi,
+    so it accounts for the actual glyph widths of proportional fonts and for
+    the line height of the font, and matches Text.get_window_extent. Further
+    measurements are a dictionary lookup.
+
+    Args:
+        text (str): Label.
+        fontsize (float | str, optional): Font size. Defaults to None
+            (rcParams["font.size"]).
+        family (str, optional): Font family. Defaults to None
+            (rcParams["font.family"]).
+        dpi (float, optional): Resolution of the extent. Defaults to 72, i.e.
+            points.
+
+    Returns:
+        tuple: Width and height in pixels at dpi.
+    """
+    return _measure(str(text), get_font(fontsize, family), dpi)
+
+
+def max_text_width(
+    labels: Iterable[str],
+    fontsize: float | str = None,
+    family: str = None,
+    dpi: float = 72,
+) -> float:
+    """Width of the widest of many labels
+
+    Only the MAX_CANDIDATES labels with the most characters are measured, so
+    that the cost does not grow with the number of labels.
+
+    Args:
+        labels (Iterable[str]): Labels.
+        fontsize (float | str, optional): Font size. Defaults to None
+            (rcParams["font.size"]).
+        family (str, optional): Font family. Defaults to None
+            (rcParams["font.family"]).
+        dpi (float, optional): Resolution of the width. Defaults to 72, i.e.
+            points.
+
+    Returns:
+        float: Width in pixels at dpi, 0 if there are no labels.
+    """
+    labels = np.asarray(labels, dtype=str).ravel()
+    if labels.size == 0:
+        return 0.0
+
+    if labels.size > MAX_CANDIDATES:
+        lengths = np.char.str_len(labels)
+        labels = labels[np.argpartition(-lengths, MAX_CANDIDATES)[:MAX_CANDIDATES]]
+
+    return max(text_extent(label, fontsize, family, dpi)[0] for label in labels)
+
+
+def clear_cache():
+    """Forget every measurement, e.g. after installing new fonts"""
+    _measure.cache_clear()
@@ -5,6 +5,9 @@ import pandas as pd
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 
+from tufte.base import frame_stats, set_axis_frame
+from tufte.text import max_text_width
+
 
 # mpl.rc("savefig", dpi=200)
 params = {  #'figure.dpi' : 200,
@@ -52,14 +55,10 @@ def plot_style(ax, plot_type):
 
 
 def all_ints(data):
-    if isinstance(data, pd.DataFrame):
-        d_temp = []
-        for c in data.columns:
-            d_temp = d_temp + data[c].tolist()
-        data = d_temp
-    if type(data) not in (list, np.ndarray, pd.Series):
+    if type(data) not in (list, np.ndarray, pd.Series, pd.DataFrame):
         raise TypeError("Container must be of type: list, np.ndarray, or pd.Series")
-    return sum([float(v).is_integer() for v in data]) == len(data)
+    stats = frame_stats(data)
+    return stats.finite and stats.is_int
 
 
 def cast_to(kind=float, labels=None):
@@ -84,50 +83,20 @@ def range_frame(fontsize, ax, x=None, y=None, dimension="both", is_bar=False):
     PAD = 0.05
     if dimension in ("x", "both"):
         assert x is not None, "Must pass in x value"
-        xmin = x.min().min()
-        xmax = x.max().max()
-        xlower = xmin - ((xmax - xmin) * PAD)
-        xupper = xmax + ((xmax - xmin) * PAD)
-        ax.set_xlim(xmin=xlower, xmax=xupper)
-        ax.spines["bottom"].set_bounds(xmin, xmax)
-        xlabels = [xl for xl in ax.xaxis.get_majorticklocs() if xl > xmin and xl < xmax]
-        xlabels = [xmin] + xlabels + [xmax]
-        xlabels = convert_ticks(x, xlabels)
-        ax.set_xticks(xlabels)
-        ax.set_xticklabels(xlabels, fontsize=fontsize)
+        set_axis_frame(ax, "x", frame_stats(x), pad=PAD, fontsize=fontsize)
     if dimension in ("y", "both"):
         assert y is not None, "Must pass in y value"
-        ymin = y.min().min()
-        ymax = y.max().max()
-        ylower = ymin - ((ymax - ymin) * PAD)
-        yupper = ymax + ((ymax - ymin) * PAD)
-        if is_bar:
-            ax.set_ylim(ymin=0, ymax=yupper)
-            ax.spines["left"].set_bounds(0, ymax)
-            ylabels = [yl for yl in ax.yaxis.get_majorticklocs() if yl < ymax]
-            ylabels = ylabels + [ymax]
-        else:
-            ax.set_ylim(ymin=ylower, ymax=yupper)
-            ax.spines["left"].set_bounds(ymin, ymax)
-            ylabels = [
-                yl for yl in ax.yaxis.get_majorticklocs() if yl > ymin and yl < ymax
-            ]
-            ylabels = [ymin] + ylabels + [ymax]
-        ylabels = convert_ticks(y, ylabels)
-        ax.set_yticks(ylabels)
-        ax.set_yticklabels(ylabels, fontsize=fontsize)
+        set_axis_frame(
+            ax, "y", frame_stats(y), pad=PAD, fontsize=fontsize, is_bar=is_bar
+        )
     return ax
 
 
 def auto_rotate_xticklabel(fig, ax):
-    figw = fig.get_figwidth()
-    nticks = len(ax.xaxis.get_majorticklocs())
-    tick_spacing = figw / float(nticks)
-    font_size = [v.get_fontsize() for v in ax.xaxis.get_majorticklabels()][0]
-    FONT_RATE = 0.01
-    char_width = font_size * FONT_RATE
-    max_labelwidth = (
-        max([len(v.get_text()) for v in ax.xaxis.get_majorticklabels()]) * char_width
+    labels = ax.xaxis.get_majorticklabels()
+    tick_spacing = ax.bbox.width / float(len(labels))
+    max_labelwidth = max_text_width(
+        [v.get_text() for v in labels], labels[0].get_fontsize(), dpi=fig.dpi
     )
     if float(max_labelwidth) / tick_spacing >= 0.90:
         plt.xticks(rotation=90)
@@ -137,13 +106,13 @@ def auto_rotate_xticklabel(fig, ax):
 
 
 def to_nparray(container):
-    if type(container) in (list, pd.core.index.Int64Index, pd.Series):
+    if isinstance(container, (list, pd.Index, pd.Series)):
         container = np.array(container)
     elif type(container) is np.ndarray:
         pass
     else:
         raise TypeError(
-            "Container must be of type: list, np.ndarray, pd.core.index.Int64Index, or pd.Series"
+            "Container must be of type: list, np.ndarray, pd.Index, or pd.Series"
         )
     return container
 